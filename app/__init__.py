@@ -1,10 +1,46 @@
 from flask import Flask, render_template
-from .views import bp
+from .views import (bp, DEFAULT_JOB_MIN_BYTES, DEFAULT_PAGE_SIZE, DEFAULT_PLOT_CACHE_MAX_BYTES,
+                    DEFAULT_RESULT_CACHE_MAX_BYTES, start_log_watcher)
+from .jobs import DEFAULT_JOB_WORKERS
+from .parallel import DEFAULT_CHUNK_SIZE
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_BYTES
+from .sketch import DEFAULT_RELATIVE_ERROR, EXACT_QUANTILE_MAX_ROWS
+from .watcher import DEFAULT_WATCH_INTERVAL
 
 # Flask 앱 팩토리 패턴
 
-def create_app():
+def create_app(config=None):
+    """
+    Flask 앱을 만듭니다.
+
+    Args:
+        config: 기본값 위에 덮어쓸 설정 (테스트는 TESTING=True를 여기로 넘겨 감시 스레드를 시작하지 않음)
+    """
     app = Flask(__name__)
+    if config:
+        app.config.update(config)
+    # 병렬 파싱 설정 (워커 수 None이면 CPU 코어 수, 청크 크기는 바이트)
+    app.config.setdefault('PARSE_WORKERS', None)
+    app.config.setdefault('PARSE_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+    # 파싱 결과 디스크 캐시 (디렉토리를 None으로 두면 사용 안 함, 최대 크기는 바이트)
+    app.config.setdefault('PARSE_CACHE_DIR', DEFAULT_CACHE_DIR)
+    app.config.setdefault('PARSE_CACHE_MAX_BYTES', DEFAULT_CACHE_MAX_BYTES)
+    # 엔드포인트 분위수 (행 수가 QUANTILE_EXACT_MAX_ROWS 이하면 정확 계산, 넘으면 상대 오차 스케치)
+    app.config.setdefault('QUANTILE_RELATIVE_ERROR', DEFAULT_RELATIVE_ERROR)
+    app.config.setdefault('QUANTILE_EXACT_MAX_ROWS', EXACT_QUANTILE_MAX_ROWS)
+    # 라우트 간 공유하는 메모리 결과 캐시 최대 크기 (바이트, 0이면 사용 안 함)
+    app.config.setdefault('RESULT_CACHE_MAX_BYTES', DEFAULT_RESULT_CACHE_MAX_BYTES)
+    # 렌더링한 그래프 PNG 캐시 (메모리 최대 크기는 바이트, 0이면 사용 안 함, 디렉토리를 지정하면 디스크에도 저장)
+    app.config.setdefault('PLOT_CACHE_MAX_BYTES', DEFAULT_PLOT_CACHE_MAX_BYTES)
+    app.config.setdefault('PLOT_CACHE_DIR', None)
+    # 백그라운드 분석 작업 (선택한 파일 합계가 JOB_MIN_BYTES 이상이면 작업으로 실행, 실행기는 'thread' 또는 'process')
+    app.config.setdefault('JOB_EXECUTOR', 'thread')
+    app.config.setdefault('JOB_WORKERS', DEFAULT_JOB_WORKERS)
+    app.config.setdefault('JOB_MIN_BYTES', DEFAULT_JOB_MIN_BYTES)
+    # 에러/검색 결과 목록 한 페이지의 행 수 (요청의 limit 인자로 바꿀 수 있음)
+    app.config.setdefault('PAGE_SIZE', DEFAULT_PAGE_SIZE)
+    # 로그 디렉토리 감시 주기 (초, 새로 생기거나 바뀐 파일을 미리 분석, 0이면 사용 안 함)
+    app.config.setdefault('LOG_WATCH_INTERVAL', DEFAULT_WATCH_INTERVAL)
 
     @app.route('/')
     def index():
@@ -12,4 +48,8 @@ def create_app():
 
     app.register_blueprint(bp)
 
+    # 첫 요청을 기다리지 않고 로그 디렉토리 감시와 미리 분석을 바로 시작 (테스트 중에는 시작하지 않음)
+    if not app.testing:
+        start_log_watcher(app)
+
     return app 
\ No newline at end of file
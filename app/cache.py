@@ -0,0 +1,600 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .parallel import DEFAULT_CHUNK_SIZE, parse_files_indexed
+from .search import POSTING_FIELDS, SearchIndex
+from .sketch import DEFAULT_RELATIVE_ERROR, EXACT_QUANTILE_MAX_ROWS
+from .table import LogTable
+from .timeindex import TimeIndex
+from .utils import _FORMAT_HITS_CACHE, LogAccumulator, improvements_from_stats, is_compressed
+
+# 기본 캐시 디렉토리와 최대 크기 (바이트)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache', 'parsed')
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# 지문 계산에 쓰는 파일 앞/뒤 샘플 크기 (바이트)
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+
+# 체크포인트 검증에 쓰는 체크포인트 오프셋 앞 구간 크기 (바이트)
+CHECKPOINT_ANCHOR_SIZE = 4096
+
+# 캐시 형식 버전 (컬럼/집계 구조가 바뀌면 올려서 이전 캐시를 무시)
+CACHE_VERSION = 6
+
+# 증분 항목을 이만큼 쌓으면 다음 갱신 때 전체를 다시 저장해 하나로 합침
+MAX_DELTA_ENTRIES = 8
+
+# LogTable 컬럼 배열 이름
+_COLUMNS = ('ts', 'tz', 'status', 'resp_time', 'url', 'ip', 'method')
+_VOCABS = ('urls', 'ips', 'methods')
+
+# 검색 인덱스 포스팅 배열 이름
+_POSTINGS = tuple(f'search_{field}' for field in POSTING_FIELDS)
+
+def file_fingerprint(file_path: str, stat: Optional[os.stat_result] = None) -> str:
+    """
+    경로, 크기, 수정 시각, 파일 앞/뒤 바이트 해시로 파일 지문을 만듭니다.
+
+    내용이 바뀌면(덧붙이기, 잘림, 교체) 지문이 달라지므로 캐시 키로 사용합니다.
+    """
+    stat = stat or os.stat(file_path)
+    digest = hashlib.sha1()
+    digest.update(f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|".encode('utf-8'))
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+        if stat.st_size > FINGERPRINT_SAMPLE_SIZE:
+            f.seek(max(FINGERPRINT_SAMPLE_SIZE, stat.st_size - FINGERPRINT_SAMPLE_SIZE))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _range_digest(file_path: str, start: int, end: int) -> str:
+    # 파일 [start, end) 구간의 해시
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return hashlib.sha1(f.read(end - start)).hexdigest()
+
+def complete_lines_end(file_path: str, size: int) -> int:
+    """마지막 줄바꿈 바로 뒤 오프셋을 반환합니다 (아직 쓰는 중일 수 있는 마지막 라인 제외)."""
+    with open(file_path, 'rb') as f:
+        pos = size
+        while pos > 0:
+            step = min(FINGERPRINT_SAMPLE_SIZE, pos)
+            f.seek(pos - step)
+            newline = f.read(step).rfind(b'\n')
+            if newline >= 0:
+                return pos - step + newline + 1
+            pos -= step
+    return 0
+
+def make_checkpoint(file_path: str, stat: os.stat_result, offset: int, rows: Optional[int]) -> Dict:
+    """
+    증분 파싱용 체크포인트를 만듭니다.
+
+    offset까지(완성된 라인까지) rows개 행을 파싱했다는 기록(시간 인덱스는 행 수 없이 None)과 함께, 다음에 파일이
+    덧붙기만 했는지 확인할 수 있도록 inode, 파일 앞부분과 offset 바로 앞 구간의 해시를 저장합니다.
+    """
+    head_size = min(FINGERPRINT_SAMPLE_SIZE, offset)
+    anchor_start = max(0, offset - CHECKPOINT_ANCHOR_SIZE)
+    return {
+        'offset': offset,
+        'rows': rows,
+        'inode': stat.st_ino,
+        'head_size': head_size,
+        'head_hash': _range_digest(file_path, 0, head_size),
+        'anchor_start': anchor_start,
+        'anchor_hash': _range_digest(file_path, anchor_start, offset),
+    }
+
+def checkpoint_is_valid(file_path: str, stat: os.stat_result, checkpoint: Dict) -> bool:
+    """체크포인트 이후 파일에 내용이 덧붙기만 했는지 확인합니다 (잘림, 로테이션, 교체 감지)."""
+    if stat.st_ino != checkpoint['inode'] or stat.st_size < checkpoint['offset']:
+        return False
+    return (_range_digest(file_path, 0, checkpoint['head_size']) == checkpoint['head_hash']
+            and _range_digest(file_path, checkpoint['anchor_start'], checkpoint['offset']) == checkpoint['anchor_hash'])
+
+def percentile_mode(rows: int, relative_error: float = DEFAULT_RELATIVE_ERROR,
+                    exact_max_rows: int = EXACT_QUANTILE_MAX_ROWS) -> Optional[float]:
+    """행 수에 따른 분위수 계산 방식 (None이면 NumPy 정확 계산, 아니면 스케치 상대 오차)"""
+    return None if rows <= exact_max_rows else relative_error
+
+def compute_aggregates(table: LogTable, relative_error: Optional[float] = None) -> Dict:
+    """
+    대시보드(analyze.html)에 표시하는 집계 결과를 계산합니다 (utils.LogAccumulator.results와 같은 키).
+
+    엔드포인트 통계에는 p50/p90/p95/p99가 포함되며, relative_error가 None이면 정확한 값,
+    아니면 그 상대 오차의 분위수 스케치 근사값입니다.
+    """
+    percentiles = table.endpoint_percentiles(relative_error)
+    slowest = table.slowest_endpoints(top_n=5, percentiles=percentiles)
+    status_stats = table.status_code_stats()
+    return {
+        'traffic_by_hour': table.traffic_by_hour(),
+        'endpoint_stats': table.endpoint_stats(percentiles),
+        'status_code_stats': status_stats,
+        'slow_requests': table.slow_requests(top_n=10),
+        'slowest_endpoints': slowest,
+        'detect_anomalies': table.detect_anomalies(),
+        # 느린 엔드포인트 상위 3개는 상위 5개의 앞부분이므로 다시 계산하지 않음
+        'suggest_improvements': improvements_from_stats(slowest[:3], status_stats),
+        'percentile_mode': relative_error,
+    }
+
+def _restore_aggregates(aggregates: Dict) -> Dict:
+    # JSON에서 리스트가 된 (시간대, 요청 수), (IP, 요청 수) 쌍을 튜플로 복원
+    aggregates['traffic_by_hour'] = [tuple(item) for item in aggregates['traffic_by_hour']]
+    aggregates['detect_anomalies']['top_ips'] = [tuple(item) for item in aggregates['detect_anomalies']['top_ips']]
+    return aggregates
+
+class ParsedLog:
+    """파싱된 컬럼 테이블, 형식 매치 횟수, 미리 계산한 집계 결과, 검색 인덱스 묶음"""
+
+    def __init__(self, table: LogTable, format_hits: Dict[str, int], aggregates: Dict, fingerprint: str,
+                 checkpoint: Optional[Dict] = None, state: Optional[LogAccumulator] = None,
+                 search_index: Optional[SearchIndex] = None):
+        self.table = table
+        self.format_hits = format_hits
+        self.aggregates = aggregates
+        self.fingerprint = fingerprint
+        self.checkpoint = checkpoint  # 증분 파싱용 체크포인트 (압축 파일은 None)
+        # 다른 파일/날짜와 병합할 수 있는 집계 부분 상태
+        self.state = state if state is not None else table.accumulate()
+        # 키워드/정규식 검색 인덱스
+        self.search_index = search_index if search_index is not None else SearchIndex(table)
+        # 디스크 캐시에서 이 결과가 이어 붙은 앞선 항목들의 지문 (증분 항목이면 기반 항목부터 순서대로)
+        self.base_entries: List[str] = []
+
+    def search(self, query: str, regex: bool = False) -> List[Dict]:
+        """URL, IP, 메소드, 상태코드 중 질의와 일치하는 로그 (인덱스 사용)"""
+        return self.search_index.search_records(query, regex)
+
+class ParsedCache:
+    """
+    파싱 결과를 .npz 사이드카 파일로 저장하는 디스크 캐시
+
+    항목은 '<경로 해시>-<지문>.npz' 이름으로 저장되며, 같은 경로의 이전 지문 항목은
+    새 항목을 저장할 때 지웁니다. 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용하지 않은 항목부터 지웁니다.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _path_key(file_path: str) -> str:
+        return hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+
+    def _entry_path(self, file_path: str, fingerprint: str) -> str:
+        return os.path.join(self.directory, f"{self._path_key(file_path)}-{fingerprint}.npz")
+
+    def load(self, file_path: str, fingerprint: Optional[str] = None) -> Optional[ParsedLog]:
+        """지문이 같은 캐시 항목이 있으면 읽어 반환합니다 (없거나 손상되었으면 None)."""
+        fingerprint = fingerprint or file_fingerprint(file_path)
+        return self._read(self._entry_path(file_path, fingerprint), fingerprint)
+
+    def load_latest(self, file_path: str) -> Optional[ParsedLog]:
+        """지문과 관계없이 같은 경로의 가장 최근 캐시 항목을 읽습니다 (증분 파싱의 시작점)."""
+        prefix = self._path_key(file_path) + '-'
+        try:
+            names = [name for name in os.listdir(self.directory) if name.startswith(prefix) and name.endswith('.npz')]
+        except OSError:
+            return None
+        entries = []
+        for name in names:
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.directory, name)), name))
+            except OSError:
+                continue
+        if not entries:
+            return None
+        name = max(entries)[1]
+        return self._read(os.path.join(self.directory, name), name[len(prefix):-len('.npz')])
+
+    def _read(self, entry: str, fingerprint: str) -> Optional[ParsedLog]:
+        try:
+            with np.load(entry, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta.get('version') != CACHE_VERSION:
+                    return None
+                columns = {name: data[name] for name in _COLUMNS}
+                vocabs = {name: data[name].tolist() for name in _VOCABS}
+                postings = {name[len('search_'):]: data[name] for name in _POSTINGS if name in data}
+        except (OSError, ValueError, KeyError):
+            return None
+        base = base_entry = None
+        if meta.get('base') is not None:
+            # 증분 항목: 기반 항목을 먼저 읽고 덧붙은 행을 이어 붙임 (기반 항목이 없으면 사용할 수 없음)
+            prefix = os.path.basename(entry).split('-', 1)[0]
+            base_entry = os.path.join(self.directory, f"{prefix}-{meta['base']}.npz")
+            base = self._read(base_entry, meta['base'])
+            if base is None or len(base.table) != meta['base_rows']:
+                return None
+        self._touch(entry, base_entry)  # 최근 사용 시각 갱신 (제거 순서 기준)
+        if base is None:
+            table = LogTable(**columns, **vocabs)
+            search_index = SearchIndex(table, postings)
+        else:
+            table = LogTable(**{name: np.concatenate([getattr(base.table, name), columns[name]]) for name in _COLUMNS},
+                             **{name: getattr(base.table, name) + vocabs[name] for name in _VOCABS})
+            search_index = base.search_index.extend(table, len(base.table))
+        parsed = ParsedLog(table, meta['format_hits'], _restore_aggregates(meta['aggregates']), fingerprint,
+                           meta.get('checkpoint'), LogAccumulator.from_dict(meta['state']), search_index)
+        parsed.base_entries = meta.get('chain', [])
+        return parsed
+
+    @staticmethod
+    def _meta(file_path: str, parsed: ParsedLog) -> Dict:
+        return {
+            'version': CACHE_VERSION,
+            'path': os.path.abspath(file_path),
+            'format_hits': parsed.format_hits,
+            'aggregates': parsed.aggregates,
+            'checkpoint': parsed.checkpoint,
+            'state': parsed.state.to_dict(),
+        }
+
+    def store(self, file_path: str, parsed: ParsedLog) -> None:
+        """파싱 결과를 캐시에 저장하고, 같은 경로의 이전 항목과 크기 초과분을 정리합니다."""
+        table = parsed.table
+        arrays = {name: getattr(table, name) for name in _COLUMNS}
+        arrays.update({name: np.array(getattr(table, name), dtype=str) for name in _VOCABS})
+        arrays.update({f'search_{field}': rows for field, rows in parsed.search_index.postings.items()})
+        self._write(file_path, parsed.fingerprint, self._meta(file_path, parsed), arrays, [])
+        parsed.base_entries = []
+
+    def store_delta(self, file_path: str, parsed: ParsedLog, base: ParsedLog) -> None:
+        """
+        base(같은 경로의 캐시 항목에서 읽은 결과) 뒤에 덧붙은 행만 증분 항목으로 저장합니다.
+
+        parsed.table은 base.table.append(덧붙은 행) 결과여야 합니다. 포스팅은 저장하지 않고 읽을 때
+        기반 항목의 검색 인덱스를 이어 만들며, 증분 항목이 MAX_DELTA_ENTRIES개 쌓였으면 전체를 다시 저장합니다.
+        """
+        chain = base.base_entries + [base.fingerprint]
+        if len(chain) > MAX_DELTA_ENTRIES:
+            self.store(file_path, parsed)
+            return
+        start = len(base.table)
+        arrays = {name: getattr(parsed.table, name)[start:] for name in _COLUMNS}
+        arrays.update({name: np.array(getattr(parsed.table, name)[len(getattr(base.table, name)):], dtype=str)
+                       for name in _VOCABS})
+        meta = self._meta(file_path, parsed)
+        meta.update(base=base.fingerprint, base_rows=start, chain=chain)
+        self._write(file_path, parsed.fingerprint, meta, arrays, chain)
+        parsed.base_entries = chain
+
+    @staticmethod
+    def _touch(entry: str, base_entry: Optional[str] = None) -> None:
+        # 수정 시각을 지금으로 (증분 항목은 파일 시스템 시각 단위와 관계없이 기반 항목보다 나중으로 두어
+        # load_latest가 같은 경로에서 항상 가장 최근 항목을 고르도록 함)
+        try:
+            now = time.time_ns()
+            if base_entry is not None:
+                now = max(now, os.stat(base_entry).st_mtime_ns + 1)
+            os.utime(entry, ns=(now, now))
+        except OSError:
+            pass
+
+    def _write(self, file_path: str, fingerprint: str, meta: Dict, arrays: Dict[str, np.ndarray],
+               keep: List[str]) -> None:
+        # 항목을 쓰고, 같은 경로의 다른 항목(keep에 든 기반 항목 제외)과 크기 초과분을 정리
+        os.makedirs(self.directory, exist_ok=True)
+        entry = self._entry_path(file_path, fingerprint)
+        # 임시 파일에 쓴 뒤 교체해 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 함
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        if keep:
+            self._touch(entry, self._entry_path(file_path, keep[-1]))
+
+        prefix = self._path_key(file_path) + '-'
+        kept = {entry} | {self._entry_path(file_path, base) for base in keep}
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith('.npz') and os.path.join(self.directory, name) not in kept:
+                self._remove(os.path.join(self.directory, name))
+        self.evict()
+
+    def _time_index_path(self, file_path: str) -> str:
+        return os.path.join(self.directory, f"{self._path_key(file_path)}.tidx")
+
+    def load_time_index(self, file_path: str) -> Optional[TimeIndex]:
+        """경로의 시간 인덱스를 읽습니다 (없거나 손상되었으면 None, 파일 검증은 호출하는 쪽에서)."""
+        try:
+            with open(self._time_index_path(file_path), 'rb') as f, np.load(f, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta.get('version') != CACHE_VERSION:
+                    return None
+                return TimeIndex(data['blocks'], meta['checkpoint'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store_time_index(self, file_path: str, index: TimeIndex) -> None:
+        """
+        시간 인덱스를 '<경로 해시>.tidx'에 저장합니다 (경로당 하나).
+
+        인덱스는 블록당 24바이트로 작고, 컬럼 캐시 항목이 크기 때문에 제거되어도
+        시간 구간 질의에 계속 쓰이도록 크기 기반 제거 대상에서 빠집니다.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        meta = {'version': CACHE_VERSION, 'path': os.path.abspath(file_path), 'checkpoint': index.checkpoint}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, meta=np.array(json.dumps(meta)), blocks=index.blocks)
+            os.replace(tmp_path, self._time_index_path(file_path))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def evict(self) -> None:
+        """전체 캐시 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목을 지웁니다."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+class _ParsePlan:
+    # 캐시에 없는 파일을 파싱하기 위한 계획 (지문, 이어 붙일 이전 결과, 파싱할 바이트 구간)
+
+    def __init__(self, file_path: str, stat: os.stat_result, fingerprint: str, previous: Optional[ParsedLog]):
+        self.file_path = file_path
+        self.stat = stat
+        self.fingerprint = fingerprint
+        self.previous = previous
+        self.start = previous.checkpoint['offset'] if previous is not None else 0
+        # stat 시점의 크기까지만 파싱해 지문과 내용을 일치시킴 (압축 파일은 항상 전체 파싱)
+        self.compressed = is_compressed(file_path)
+        self.complete = None if self.compressed else complete_lines_end(file_path, stat.st_size)
+
+    def jobs(self):
+        """parse_files_parallel에 넘길 (경로, 시작, 끝) 구간 목록 (완성된 라인까지, 쓰는 중인 마지막 라인)"""
+        if self.compressed:
+            return [(self.file_path, 0, None)]
+        jobs = [(self.file_path, self.start, self.complete)]
+        if self.complete < self.stat.st_size:
+            jobs.append((self.file_path, self.complete, self.stat.st_size))
+        return jobs
+
+def _plan_or_load(file_path: str, cache: Optional[ParsedCache], relative_error: float, exact_max_rows: int):
+    # 캐시에 같은 지문의 항목이 있으면 ParsedLog, 없으면 _ParsePlan을 반환
+    stat = os.stat(file_path)
+    fingerprint = file_fingerprint(file_path, stat)
+    previous = None
+    if cache is not None:
+        parsed = cache.load(file_path, fingerprint)
+        if parsed is not None:
+            # 다음 파싱 때 감지 없이 같은 형식 순서로 시작하도록 형식 매치 횟수 복원
+            _FORMAT_HITS_CACHE.setdefault(file_path, Counter(parsed.format_hits))
+            mode = percentile_mode(len(parsed.table), relative_error, exact_max_rows)
+            if parsed.aggregates.get('percentile_mode') != mode or parsed.state.relative_error != relative_error:
+                # 분위수 설정이 바뀌었으면 저장된 컬럼으로 집계만 다시 계산
+                parsed.aggregates = compute_aggregates(parsed.table, mode)
+                parsed.state = parsed.table.accumulate(relative_error=relative_error)
+                cache.store(file_path, parsed)
+            return parsed
+        if not is_compressed(file_path):
+            previous = cache.load_latest(file_path)
+            if previous is not None and not (previous.checkpoint and checkpoint_is_valid(file_path, stat, previous.checkpoint)):
+                previous = None
+            if previous is not None:
+                _FORMAT_HITS_CACHE.setdefault(file_path, Counter(previous.format_hits))
+    return _ParsePlan(file_path, stat, fingerprint, previous)
+
+def _update_time_index(plan: _ParsePlan, blocks, checkpoint: Dict, cache: ParsedCache) -> None:
+    # 처음 파싱이면 새 시간 인덱스를, 덧붙은 구간만 파싱했으면 이전 인덱스에 블록을 이어 붙여 저장
+    if plan.previous is None:
+        index = TimeIndex(blocks, checkpoint)
+    else:
+        index = cache.load_time_index(plan.file_path)
+        if index is None or index.end != plan.start:
+            return  # 이어 붙일 인덱스가 없으면 다음 전체 파싱 때 다시 만듦
+        index = index.extend(blocks, checkpoint)
+    cache.store_time_index(plan.file_path, index)
+
+def _extend_previous(plan: _ParsePlan, results: List[Tuple[LogTable, Optional[np.ndarray]]],
+                     cache: Optional[ParsedCache], relative_error: float, exact_max_rows: int) -> ParsedLog:
+    """
+    덧붙은 구간의 파싱 결과만으로 이전 결과를 갱신합니다 (갱신 비용이 덧붙은 데이터에 비례).
+
+    - 집계 부분 상태는 덧붙은 행의 상태만 만들어 이전 상태에 병합하고, 대시보드 집계는 병합한 상태에서
+      만듭니다 (정확한 분위수를 쓰는 exact_max_rows 이하의 작은 파일만 전체 컬럼으로 다시 계산).
+    - 검색 인덱스는 덧붙은 행의 포스팅만 만들어 이어 붙이고, 디스크 캐시에는 덧붙은 컬럼만 증분 항목으로 저장합니다.
+    """
+    previous = plan.previous
+    added = LogTable.concat([table for table, _ in results])
+    table = previous.table.append(added)
+    checkpoint = make_checkpoint(plan.file_path, plan.stat, plan.complete, len(previous.table) + len(results[0][0]))
+    if cache is not None:
+        _update_time_index(plan, results[0][1], checkpoint, cache)
+    state = previous.state.merge(added.accumulate(slow_top_n=previous.state.slow_top_n, relative_error=relative_error))
+    mode = percentile_mode(len(table), relative_error, exact_max_rows)
+    aggregates = state.results() if mode is not None else compute_aggregates(table, mode)
+    parsed = ParsedLog(table, dict(_FORMAT_HITS_CACHE.get(plan.file_path, {})), aggregates, plan.fingerprint,
+                       checkpoint, state, previous.search_index.extend(table, len(previous.table)))
+    if cache is not None:
+        cache.store_delta(plan.file_path, parsed, previous)
+    return parsed
+
+def _finish_plan(plan: _ParsePlan, results: List[Tuple[LogTable, Optional[np.ndarray]]],
+                 cache: Optional[ParsedCache], relative_error: float, exact_max_rows: int) -> ParsedLog:
+    # 파싱한 구간을 이전 결과에 이어 붙이고 집계, 체크포인트, 시간 인덱스를 만들어 캐시에 저장
+    previous = plan.previous
+    # 이전 결과에 쓰는 중이던 마지막 라인의 행이 없고 같은 설정의 상태면 덧붙은 행만으로 갱신
+    # (있으면 그 행을 다시 파싱하므로 이전 상태를 그대로 병합할 수 없어 전체를 다시 집계)
+    if (previous is not None and len(previous.table) == previous.checkpoint['rows']
+            and previous.state.relative_error == relative_error and not previous.state.keep_times):
+        return _extend_previous(plan, results, cache, relative_error, exact_max_rows)
+    tables = [table for table, _ in results]
+    checkpoint = None
+    if plan.compressed:
+        table = tables[0]
+    else:
+        parts = []
+        if plan.previous is not None:
+            # 체크포인트까지의 행은 그대로 쓰고, 이전에 쓰는 중이던 마지막 라인부터 다시 파싱한 결과를 붙임
+            parts.append(plan.previous.table.take(slice(0, plan.previous.checkpoint['rows'])))
+        parts.append(tables[0])
+        rows = sum(len(part) for part in parts)
+        table = LogTable.concat(parts + tables[1:])
+        checkpoint = make_checkpoint(plan.file_path, plan.stat, plan.complete, rows)
+        if cache is not None:
+            _update_time_index(plan, results[0][1], checkpoint, cache)
+
+    format_hits = dict(_FORMAT_HITS_CACHE.get(plan.file_path, {}))
+    mode = percentile_mode(len(table), relative_error, exact_max_rows)
+    parsed = ParsedLog(table, format_hits, compute_aggregates(table, mode), plan.fingerprint, checkpoint,
+                       table.accumulate(relative_error=relative_error))
+    if cache is not None:
+        cache.store(plan.file_path, parsed)
+    return parsed
+
+def load_parsed_log(file_path: str, cache: Optional[ParsedCache] = None, workers: Optional[int] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, relative_error: float = DEFAULT_RELATIVE_ERROR,
+                    exact_max_rows: int = EXACT_QUANTILE_MAX_ROWS,
+                    progress: Optional[Callable[[int, int], None]] = None) -> ParsedLog:
+    """
+    로그 파일의 파싱 결과와 집계를 반환합니다.
+
+    캐시에 같은 지문의 항목이 있으면 파싱 없이 읽습니다. 지문은 다르지만 같은 파일에
+    내용이 덧붙기만 했다면(체크포인트 검증 통과) 체크포인트 이후 바이트만 파싱해
+    이전 컬럼에 이어 붙입니다. 그 외(처음, 잘림, 로테이션)에는 처음부터 파싱합니다.
+
+    Args:
+        file_path: 로그 파일 경로
+        cache: 디스크 캐시 (None이면 캐시 없이 파싱)
+        workers: 워커 프로세스 수
+        chunk_size: 청크 크기 (바이트)
+        relative_error: 엔드포인트 분위수 스케치의 상대 오차
+        exact_max_rows: 이 행 수 이하면 분위수를 스케치 대신 정확히 계산
+        progress: 진행 상황 콜백 progress(처리한 바이트 수, 파싱한 행 수) - 캐시에서 읽거나
+                  건너뛴 바이트도 행 0개로 보고하므로, 끝나면 바이트 합이 파일 크기와 같음
+    """
+    return load_parsed_logs([file_path], cache, workers, chunk_size, relative_error, exact_max_rows, progress)[0]
+
+def load_parsed_logs(file_paths: List[str], cache: Optional[ParsedCache] = None, workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE, relative_error: float = DEFAULT_RELATIVE_ERROR,
+                     exact_max_rows: int = EXACT_QUANTILE_MAX_ROWS,
+                     progress: Optional[Callable[[int, int], None]] = None) -> List[ParsedLog]:
+    """
+    여러 로그 파일의 파싱 결과를 load_parsed_log와 같은 규칙으로 반환합니다.
+
+    캐시에 있는 파일은 그대로 읽고, 나머지 파일들의 파싱할 구간은 한 프로세스 풀에
+    함께 넣어 파일 간에도 병렬로 파싱합니다. 인자는 load_parsed_log와 같습니다.
+    """
+    loaded = [_plan_or_load(path, cache, relative_error, exact_max_rows) for path in file_paths]
+    plans = [item for item in loaded if isinstance(item, _ParsePlan)]
+    if progress is not None:
+        # 캐시에서 읽은 파일과 체크포인트 이전 구간은 파싱 없이 처리된 바이트
+        skipped = sum(os.path.getsize(path) for path, item in zip(file_paths, loaded) if isinstance(item, ParsedLog))
+        skipped += sum(plan.start for plan in plans if not plan.compressed)
+        if skipped:
+            progress(skipped, 0)
+    jobs = [plan.jobs() for plan in plans]
+    results = iter(parse_files_indexed([job for plan_jobs in jobs for job in plan_jobs], workers, chunk_size, progress))
+    finished = {
+        id(plan): _finish_plan(plan, [next(results) for _ in plan_jobs], cache, relative_error, exact_max_rows)
+        for plan, plan_jobs in zip(plans, jobs)
+    }
+    return [finished[id(item)] if isinstance(item, _ParsePlan) else item for item in loaded]
+
+def combine_parsed(parsed_logs: List[ParsedLog]) -> LogAccumulator:
+    """
+    파일별 집계 부분 상태를 순서대로 병합합니다 (여러 날짜/파일을 하나의 대시보드로).
+
+    각 파일의 상태는 파싱 시 만들어 캐시에 함께 저장되므로, 겹치는 범위를 다시 조회해도
+    파일을 다시 파싱하지 않습니다. 분위수는 스케치 근사값입니다.
+    """
+    combined = None
+    for parsed in parsed_logs:
+        if combined is None:
+            combined = LogAccumulator(slow_top_n=parsed.state.slow_top_n, relative_error=parsed.state.relative_error)
+        combined.merge(parsed.state)
+    return combined if combined is not None else LogAccumulator()
+
+def window_key(fingerprint: str, ts_from: Optional[int], ts_to: Optional[int]) -> str:
+    """시간 구간 결과의 캐시 키 (파일 지문 + 구간)"""
+    return f"{fingerprint}@{'' if ts_from is None else ts_from}-{'' if ts_to is None else ts_to}"
+
+def load_time_window(file_path: str, ts_from: Optional[int] = None, ts_to: Optional[int] = None,
+                     cache: Optional[ParsedCache] = None, workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE, relative_error: float = DEFAULT_RELATIVE_ERROR,
+                     exact_max_rows: int = EXACT_QUANTILE_MAX_ROWS,
+                     progress: Optional[Callable[[int, int], None]] = None) -> ParsedLog:
+    """
+    로그 파일 중 현지 시각 [ts_from, ts_to) 구간(epoch 초)의 로그만 파싱해 집계합니다.
+
+    - 전체 파싱 결과가 캐시에 있으면 그 컬럼에서 구간의 행만 고릅니다.
+    - 없지만 유효한 시간 인덱스가 있으면 구간과 겹치는 블록과 인덱스 이후 덧붙은 구간만
+      파싱하고, 덧붙은 구간의 블록은 인덱스에 추가합니다.
+    - 둘 다 없으면 전체를 파싱(시간 인덱스가 함께 만들어짐)한 뒤 구간의 행을 고릅니다.
+
+    반환하는 ParsedLog의 fingerprint는 window_key(지문, ts_from, ts_to)입니다.
+    나머지 인자는 load_parsed_log와 같습니다.
+    """
+    stat = os.stat(file_path)
+    fingerprint = file_fingerprint(file_path, stat)
+    parsed = None
+    index = None
+    if cache is not None:
+        parsed = cache.load(file_path, fingerprint)
+        if parsed is None and not is_compressed(file_path):
+            index = cache.load_time_index(file_path)
+            if index is not None and not checkpoint_is_valid(file_path, stat, index.checkpoint):
+                index = None  # 잘림/로테이션 등으로 인덱스를 믿을 수 없음
+
+    if index is None:
+        if parsed is None:
+            parsed = load_parsed_log(file_path, cache, workers, chunk_size, relative_error, exact_max_rows, progress)
+        elif progress is not None:
+            progress(stat.st_size, 0)
+        table = parsed.table.time_window(ts_from, ts_to)
+        format_hits = parsed.format_hits
+    else:
+        complete = complete_lines_end(file_path, stat.st_size)
+        jobs = [(file_path, start, end) for start, end in index.ranges(ts_from, ts_to)]
+        tail = len(jobs)
+        if complete > index.end:
+            jobs.append((file_path, index.end, complete))  # 인덱스 이후 덧붙은 완성된 라인
+        if stat.st_size > complete:
+            jobs.append((file_path, complete, stat.st_size))  # 쓰는 중인 마지막 라인
+        if progress is not None:
+            # 구간과 겹치지 않아 건너뛴 블록의 바이트
+            progress(stat.st_size - sum(end - start for _, start, end in jobs), 0)
+        results = parse_files_indexed(jobs, workers, chunk_size, progress)
+        if complete > index.end:
+            cache.store_time_index(file_path, index.extend(results[tail][1], make_checkpoint(file_path, stat, complete, None)))
+        table = LogTable.concat([table for table, _ in results]).time_window(ts_from, ts_to)
+        format_hits = dict(_FORMAT_HITS_CACHE.get(file_path, {}))
+
+    mode = percentile_mode(len(table), relative_error, exact_max_rows)
+    return ParsedLog(table, format_hits, compute_aggregates(table, mode), window_key(fingerprint, ts_from, ts_to),
+                     state=table.accumulate(relative_error=relative_error))
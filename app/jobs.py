@@ -0,0 +1,248 @@
+import multiprocessing
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing.util import Finalize
+from typing import Callable, Dict, Optional, Tuple
+
+from .parallel import shutdown_executors
+
+# 작업 실행기 종류 (스레드 풀 / 프로세스 풀)
+JOB_EXECUTORS = ('thread', 'process')
+
+# 동시에 실행하는 작업 수 기본값 (작업 하나의 파싱도 PARSE_WORKERS개 프로세스로 병렬 실행됨)
+DEFAULT_JOB_WORKERS = 2
+
+# 끝난 작업을 보관하는 개수 (결과를 들고 있으므로 작게 유지, 오래된 것부터 삭제)
+DEFAULT_JOB_HISTORY = 16
+
+class JobProgress:
+    """
+    작업 진행 상황 카운터 (시작 시각, 처리한 바이트 수, 파싱한 행 수)
+
+    cache.load_parsed_logs 등의 progress 콜백으로 그대로 넘길 수 있습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = None
+        self._bytes = 0
+        self._rows = 0
+
+    def start(self) -> None:
+        with self._lock:
+            self._started = time.time()
+
+    def __call__(self, n_bytes: int, rows: int) -> None:
+        with self._lock:
+            self._bytes += n_bytes
+            self._rows += rows
+
+    def values(self) -> Tuple[Optional[float], int, int]:
+        with self._lock:
+            return self._started, self._bytes, self._rows
+
+class SharedProgress:
+    """
+    프로세스 풀에서 실행되는 작업용 JobProgress (multiprocessing.Manager 사전 프록시에 기록)
+
+    작업 하나는 한 프로세스에서만 실행되므로, 그 프로세스 안의 잠금으로 읽고-쓰기를 묶으면 충분합니다.
+    """
+
+    def __init__(self, shared):
+        self._shared = shared
+        self._shared.update(started=None, bytes=0, rows=0)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'_shared': self._shared}
+
+    def __setstate__(self, state):
+        self._shared = state['_shared']
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        self._shared['started'] = time.time()
+
+    def __call__(self, n_bytes: int, rows: int) -> None:
+        with self._lock:
+            values = self._shared.copy()
+            self._shared.update(bytes=values['bytes'] + n_bytes, rows=values['rows'] + rows)
+
+    def values(self) -> Tuple[Optional[float], int, int]:
+        values = self._shared.copy()
+        return values['started'], values['bytes'], values['rows']
+
+def _init_job_process() -> None:
+    # 작업 프로세스가 끝날 때 그 안에서 만든 파싱 풀을 먼저 종료 (자식 프로세스 대기에서 멈추지 않도록,
+    # 큐 전송 스레드를 닫는 multiprocessing 종료 처리(우선순위 10)보다 먼저 실행되어야 종료 신호가 전달됨)
+    Finalize(None, shutdown_executors, exitpriority=100)
+
+def _run_job(func: Callable, args: tuple, progress) -> object:
+    # 풀에서 실행되는 작업 본체 (프로세스 풀에서도 피클할 수 있도록 모듈 최상위 함수)
+    progress.start()
+    return func(*args, progress=progress)
+
+class Job:
+    """백그라운드 작업 하나의 상태와 결과"""
+
+    def __init__(self, job_id: str, key: str, total_bytes: int, progress):
+        self.id = job_id
+        self.key = key
+        self.total_bytes = total_bytes
+        self.progress = progress
+        self.status = 'pending'  # pending -> running -> done / error
+        self.created = time.time()
+        self.finished = None
+        self.result = None
+        self.error = None
+        self._final = None  # 끝난 시점의 진행 상황 (프로세스 간 프록시를 더 읽지 않도록 고정)
+        self._done = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """작업이 끝날 때까지 기다립니다 (끝났으면 True)."""
+        return self._done.wait(timeout)
+
+    def snapshot(self) -> Dict:
+        """
+        진행 상황 (JSON으로 보낼 수 있는 사전)
+
+        - bytes_processed / total_bytes / percent: 처리한 바이트 (캐시에서 읽거나 건너뛴 바이트 포함)
+        - lines, lines_per_sec: 실제로 파싱한 라인 수와 초당 라인 수
+        - eta_seconds: 지금까지의 바이트 처리 속도로 계산한 남은 시간 (아직 모르면 None)
+        """
+        started, done_bytes, rows = self._final if self._final is not None else self.progress.values()
+        status = self.status
+        if status == 'pending' and started is not None:
+            status = 'running'
+        elapsed = (self.finished or time.time()) - started if started is not None else 0.0
+        remaining = max(self.total_bytes - done_bytes, 0)
+        percent = min(done_bytes / self.total_bytes, 1.0) * 100 if self.total_bytes else 0.0
+        eta = None
+        if status in ('done', 'error'):
+            eta = 0.0
+        elif done_bytes and elapsed > 0:
+            eta = remaining / (done_bytes / elapsed)
+        return {
+            'id': self.id,
+            'status': status,
+            'bytes_processed': done_bytes,
+            'total_bytes': self.total_bytes,
+            'percent': 100.0 if status == 'done' else round(percent, 1),
+            'lines': rows,
+            'lines_per_sec': round(rows / elapsed) if elapsed > 0 else 0,
+            'elapsed': round(elapsed, 2),
+            'eta_seconds': None if eta is None else round(eta, 1),
+            'error': self.error,
+        }
+
+class JobManager:
+    """
+    오래 걸리는 작업(대용량 로그 분석)을 백그라운드 풀에서 실행하고 진행 상황을 조회하는 관리자
+
+    executor가 'thread'면 스레드 풀, 'process'면 프로세스 풀에서 실행합니다 (process는 함수와 인자,
+    반환값이 피클 가능해야 하며 진행 상황은 multiprocessing.Manager로 전달). 같은 키의 작업이
+    아직 끝나지 않았으면 새로 실행하지 않고 그 작업을 돌려주므로, 같은 파일을 동시에 요청해도 한 번만 분석합니다.
+    """
+
+    def __init__(self, executor: str = 'thread', workers: int = DEFAULT_JOB_WORKERS,
+                 history: int = DEFAULT_JOB_HISTORY):
+        if executor not in JOB_EXECUTORS:
+            raise ValueError(f"지원하지 않는 작업 실행기입니다: {executor} ({', '.join(JOB_EXECUTORS)})")
+        self.executor = executor
+        self.workers = workers
+        self.history = history
+        self.submitted = 0  # 새로 실행한 작업 수
+        self.attached = 0  # 실행 중인 같은 키의 작업에 합류한 횟수
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()  # 작업 ID -> 작업, 제출 순서
+        self._active: Dict[str, Job] = {}  # 키 -> 끝나지 않은 작업
+        self._lock = threading.Lock()
+        self._pool = None
+        self._manager = None
+
+    def _get_pool(self):
+        # self._lock을 잡은 상태에서 호출 (첫 작업 때 풀을 만듦)
+        if self._pool is None:
+            if self.executor == 'process':
+                self._manager = multiprocessing.Manager()
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_job_process)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='job')
+        return self._pool
+
+    def submit(self, key: str, total_bytes: int, func: Callable, *args,
+               finish: Optional[Callable[[object], object]] = None) -> Job:
+        """
+        func(*args, progress=진행 상황 콜백)을 백그라운드에서 실행하는 작업을 반환합니다.
+
+        Args:
+            key: 작업 키 (같은 키의 작업이 실행 중이면 그 작업을 반환)
+            total_bytes: 처리할 전체 바이트 수 (진행률, 남은 시간 계산용)
+            func: 실행할 함수 (process 실행기면 모듈 최상위 함수)
+            finish: 결과를 받아 이 프로세스에서 후처리하는 함수 (반환값이 작업 결과가 됨)
+        """
+        with self._lock:
+            job = self._active.get(key)
+            if job is not None:
+                self.attached += 1
+                return job
+            pool = self._get_pool()
+            progress = SharedProgress(self._manager.dict()) if self.executor == 'process' else JobProgress()
+            job = Job(secrets.token_hex(8), key, total_bytes, progress)
+            self._active[key] = job
+            self._jobs[job.id] = job
+            self.submitted += 1
+            future = pool.submit(_run_job, func, args, progress)
+        future.add_done_callback(partial(self._finish, job, finish))
+        return job
+
+    def _finish(self, job: Job, finish: Optional[Callable[[object], object]], future) -> None:
+        # 작업이 끝나면 결과(또는 오류)를 기록하고, 끝난 작업이 history개를 넘으면 오래된 것부터 삭제
+        try:
+            result = future.result()
+            job.result = finish(result) if finish is not None else result
+            job.status = 'done'
+        except Exception as e:
+            job.error = str(e) or type(e).__name__
+            job.status = 'error'
+        try:
+            job._final = job.progress.values()
+        except Exception:
+            job._final = (job.created, 0, 0)  # 프로세스 풀 관리자가 이미 종료된 경우
+        job.finished = time.time()
+        with self._lock:
+            if self._active.get(job.key) is job:
+                del self._active[job.key]
+            finished = [job_id for job_id, item in self._jobs.items() if item.finished is not None]
+            for job_id in finished[:max(len(finished) - self.history, 0)]:
+                del self._jobs[job_id]
+        job._done.set()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 ID의 작업 (없거나 오래되어 삭제됐으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict:
+        """실행 중인 작업 수와 제출/합류 횟수"""
+        with self._lock:
+            return {
+                'executor': self.executor,
+                'workers': self.workers,
+                'active': len(self._active),
+                'submitted': self.submitted,
+                'attached': self.attached,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀과 (프로세스 풀이면) 진행 상황 관리자 프로세스를 종료합니다."""
+        with self._lock:
+            pool, manager = self._pool, self._manager
+            self._pool = self._manager = None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+        if manager is not None:
+            manager.shutdown()
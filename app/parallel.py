@@ -0,0 +1,303 @@
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .sketch import DEFAULT_RELATIVE_ERROR
+from .table import LogTable, LogTableBuilder
+from .timeindex import TIME_INDEX_BLOCK_SIZE, time_blocks
+from .utils import (LogAccumulator, MixedFormatParser, get_file_parser, is_compressed, iter_buffer_records,
+                    iter_decompressed_blocks, iter_mmap_records, open_log_text)
+
+# 기본 청크 크기 (바이트) - 이보다 작은 파일은 현재 프로세스에서 바로 파싱
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# 워커 수별 프로세스 풀 (요청마다 프로세스를 새로 띄우지 않도록 재사용)
+_executors: Dict[int, ProcessPoolExecutor] = {}
+_executors_lock = Lock()
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = _executors[workers] = ProcessPoolExecutor(max_workers=workers)
+        return executor
+
+def _forget_executors() -> None:
+    # fork된 자식 프로세스는 부모의 풀(관리 스레드가 없음)을 쓸 수 없으므로 새로 만들게 함
+    global _executors_lock
+    _executors.clear()
+    _executors_lock = Lock()
+
+os.register_at_fork(after_in_child=_forget_executors)
+
+def shutdown_executors() -> None:
+    """이 프로세스가 만든 파싱 프로세스 풀을 모두 종료합니다 (풀을 쓰던 작업 프로세스가 끝날 때 호출)."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+def split_byte_ranges(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      start: int = 0, end: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    파일의 [start, end) 구간을 줄바꿈 경계에 맞춘 (시작, 끝) 바이트 범위들로 나눕니다.
+
+    각 범위는 라인의 처음에서 시작하고 줄바꿈 바로 뒤에서 끝나므로
+    범위별로 따로 파싱해도 잘리는 라인이 없습니다.
+    start는 라인 시작 위치여야 하며, end가 None이면 파일 끝입니다.
+    """
+    size = os.path.getsize(file_path) if end is None else end
+    ranges = []
+    with open(file_path, 'rb') as f:
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                # 범위 끝을 현재 라인의 끝까지 늘림
+                f.seek(end)
+                f.readline()
+                end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def keep_all(table: LogTable) -> LogTable:
+    # 청크 테이블을 그대로 반환 (map_log_chunks 기본 함수)
+    return table
+
+def keep_errors(table: LogTable) -> LogTable:
+    # 청크에서 4xx, 5xx 에러 행만 반환
+    return table.error_rows()
+
+def keep_top_rows(table: LogTable, top_n: int = 10, field: str = 'resp_time') -> LogTable:
+    # 청크에서 field 값 상위 N개 행만 반환 (functools.partial로 N과 필드를 지정)
+    return table.top_rows(top_n, field)
+
+def accumulate_chunk(table: LogTable, slow_top_n: int = 10, keep_times: bool = False,
+                     relative_error: float = DEFAULT_RELATIVE_ERROR) -> LogAccumulator:
+    # 청크의 집계 부분 상태만 반환 (행 대신 상태를 보내 전송량을 줄임)
+    return table.accumulate(slow_top_n, keep_times, relative_error)
+
+def _build_chunk(records, parser: MixedFormatParser, chunk_func: Callable[[LogTable], object]):
+    # 레코드 스트림을 청크 테이블로 적재해 chunk_func 결과와 형식 매치 횟수 변화를 반환
+    before = Counter(parser.hits)
+    builder = LogTableBuilder()
+    append = builder.append
+    for log_data in records:
+        append(log_data)
+    # 레코드 딕셔너리 대신 컬럼(또는 그 집계) 결과만 부모 프로세스로 전달
+    return chunk_func(builder.build()), parser.hits - before
+
+def _parse_range(file_path: str, start: int, end: int, initial_format: Optional[str],
+                 hits: Dict[str, int], chunk_func: Callable[[LogTable], object]):
+    """워커 프로세스에서 바이트 범위 하나를 파싱해 chunk_func 결과와 형식 매치 횟수를 반환합니다."""
+    parser = MixedFormatParser(initial_format, Counter(hits))
+    # 범위를 문자열로 읽지 않고 mmap 위에서 bytes 정규식으로 일괄 매치
+    return _build_chunk(iter_mmap_records(file_path, start, end, parser), parser, chunk_func)
+
+def _parse_range_indexed(file_path: str, start: int, end: int, initial_format: Optional[str],
+                         hits: Dict[str, int]):
+    """
+    워커 프로세스에서 바이트 범위 하나를 TIME_INDEX_BLOCK_SIZE 블록 단위로 파싱해
+    (테이블, 형식 매치 횟수 변화, 블록별 시간 범위)를 반환합니다 (시간 인덱스는 파싱의 부산물).
+    """
+    parser = MixedFormatParser(initial_format, Counter(hits))
+    before = Counter(parser.hits)
+    builder = LogTableBuilder()
+    append = builder.append
+    marks = []  # 블록별 (시작 오프셋, 첫 행 번호)
+    for block_start, block_end in split_byte_ranges(file_path, TIME_INDEX_BLOCK_SIZE, start, end):
+        marks.append((block_start, len(builder.ts)))
+        for log_data in iter_mmap_records(file_path, block_start, block_end, parser):
+            append(log_data)
+    table = builder.build()
+    return table, parser.hits - before, time_blocks(table, marks)
+
+def _parse_block(data: bytes, initial_format: Optional[str], hits: Dict[str, int],
+                 chunk_func: Callable[[LogTable], object]):
+    """워커 프로세스에서 압축 해제된 블록 하나를 파싱합니다 (_parse_range와 같은 결과 형태)."""
+    parser = MixedFormatParser(initial_format, Counter(hits))
+    return _build_chunk(iter_buffer_records(data, parser), parser, chunk_func)
+
+def _map_compressed(file_path: str, chunk_func: Callable[[LogTable], object], workers: int,
+                    chunk_size: int, initial_format: Optional[str], hits: Dict[str, int]) -> list:
+    """
+    압축 파일은 바이트 범위로 나눌 수 없으므로 부모가 스트림을 블록 단위로 풀고
+    블록 파싱만 워커에 나눕니다. 진행 중인 블록 수를 제한해 파일 전체가 메모리에 풀리지 않게 합니다.
+    """
+    blocks = iter_decompressed_blocks(file_path, chunk_size)
+    if workers == 1:
+        return [_parse_block(block, initial_format, hits, chunk_func) for block in blocks]
+    executor = _get_executor(workers)
+    pending = deque()
+    outputs = []
+    for block in blocks:
+        pending.append(executor.submit(_parse_block, block, initial_format, hits, chunk_func))
+        if len(pending) >= workers * 2:
+            outputs.append(pending.popleft().result())
+    outputs.extend(future.result() for future in pending)
+    return outputs
+
+def _detect_format(file_path: str):
+    # 형식 감지는 부모에서 한 번만 수행하고, 파일별 형식 순서 캐시를 워커에 전달
+    # (압축 파일도 풀린 스트림의 앞부분으로 감지)
+    with open_log_text(file_path) as f:
+        sample_lines = [line.strip() for line in islice(f, 20) if line.strip()]
+    file_parser = get_file_parser(file_path, sample_lines)
+    return file_parser, file_parser.last_format, dict(file_parser.hits)
+
+def map_log_chunks(file_path: str, chunk_func: Callable[[LogTable], object] = keep_all,
+                   workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   start: int = 0, end: Optional[int] = None) -> List[object]:
+    """
+    로그 파일을 줄바꿈 경계의 바이트 범위로 나눠 프로세스 풀에서 병렬로 파싱합니다.
+    압축 파일(.gz, .bz2, .xz)은 풀린 스트림을 chunk_size 블록으로 나눠 파싱합니다.
+
+    Args:
+        file_path: 로그 파일 경로
+        chunk_func: 청크 LogTable을 받아 부모로 돌려줄 값을 만드는 함수
+                    (피클 가능한 모듈 최상위 함수여야 함)
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        chunk_size: 청크 크기 (바이트)
+        start: 파싱을 시작할 바이트 오프셋 (라인 시작 위치, 압축 파일은 0만 가능)
+        end: 파싱을 끝낼 바이트 오프셋 (None이면 파일 끝, 압축 파일은 None만 가능)
+
+    Returns:
+        범위 순서대로 정렬된 chunk_func 결과 리스트
+    """
+    workers = workers or os.cpu_count() or 1
+    file_parser, initial_format, hits = _detect_format(file_path)
+
+    if is_compressed(file_path):
+        if start or end is not None:
+            raise ValueError('압축 파일은 바이트 범위를 지정해 파싱할 수 없습니다')
+        outputs = _map_compressed(file_path, chunk_func, workers, chunk_size, initial_format, hits)
+    else:
+        ranges = split_byte_ranges(file_path, chunk_size, start, end)
+        if workers == 1 or len(ranges) <= 1:
+            # 작은 파일은 프로세스 간 전송 비용 없이 현재 프로세스에서 파싱
+            outputs = [_parse_range(file_path, start, end, initial_format, hits, chunk_func) for start, end in ranges]
+        else:
+            executor = _get_executor(workers)
+            futures = [
+                executor.submit(_parse_range, file_path, start, end, initial_format, hits, chunk_func)
+                for start, end in ranges
+            ]
+            outputs = [future.result() for future in futures]
+
+    results = []
+    for result, chunk_hits in outputs:
+        file_parser.hits.update(chunk_hits)
+        results.append(result)
+    return results
+
+def parse_file_parallel(file_path: str, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        start: int = 0, end: Optional[int] = None) -> LogTable:
+    """로그 파일 전체(또는 [start, end) 구간)를 병렬로 파싱해 하나의 LogTable로 합칩니다."""
+    return LogTable.concat(map_log_chunks(file_path, keep_all, workers, chunk_size, start, end))
+
+def parse_files_parallel(jobs: List[Tuple[str, int, Optional[int]]], workers: Optional[int] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[LogTable]:
+    """
+    여러 파일(또는 파일의 [start, end) 구간)을 하나의 프로세스 풀에서 함께 파싱합니다.
+
+    모든 파일의 청크를 한꺼번에 풀에 넣으므로, 청크 크기보다 작은 일별 파일 여러 개도
+    파일 하나씩 순서대로 파싱하지 않고 코어 수만큼 동시에 파싱됩니다.
+
+    Args:
+        jobs: (파일 경로, 시작 오프셋, 끝 오프셋 또는 None) 목록
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        chunk_size: 청크 크기 (바이트)
+
+    Returns:
+        jobs 순서대로 파일별 LogTable
+    """
+    return [table for table, _ in parse_files_indexed(jobs, workers, chunk_size)]
+
+def _report_chunk(progress: Callable[[int, int], None], size: int, future) -> None:
+    # 청크 파싱이 끝나면 (바이트 수, 행 수)를 진행 상황 콜백에 전달 (실패한 청크는 result()에서 예외)
+    if not future.cancelled() and future.exception() is None:
+        progress(size, len(future.result()[0]))
+
+def parse_files_indexed(jobs: List[Tuple[str, int, Optional[int]]], workers: Optional[int] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        progress: Optional[Callable[[int, int], None]] = None) -> List[Tuple[LogTable, Optional[np.ndarray]]]:
+    """
+    parse_files_parallel과 같지만 job마다 시간 인덱스 블록(timeindex.time_blocks 형식)을 함께 반환합니다.
+
+    압축 파일은 바이트 오프셋으로 이동할 수 없으므로 블록 대신 None입니다.
+    progress를 지정하면 청크가 끝날 때마다 progress(청크 바이트 수, 파싱한 행 수)를 호출합니다
+    (완료 순서대로, 풀 관리 스레드에서 호출될 수 있음). 압축 파일은 파일이 끝나면 디스크상 크기로 한 번 호출합니다.
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = []  # (job 번호, 파일 경로, 청크 시작, 청크 끝, 초기 형식, 형식 매치 횟수)
+    parsers = {}
+    results = [None] * len(jobs)
+    for index, (file_path, start, end) in enumerate(jobs):
+        if is_compressed(file_path):
+            # 압축 파일은 풀린 스트림을 블록으로 나누는 자체 파이프라인 사용
+            results[index] = (parse_file_parallel(file_path, workers, chunk_size, start, end), None)
+            if progress is not None:
+                progress(os.path.getsize(file_path), len(results[index][0]))
+            continue
+        file_parser, initial_format, hits = _detect_format(file_path)
+        parsers[index] = file_parser
+        for chunk_start, chunk_end in split_byte_ranges(file_path, chunk_size, start, end):
+            tasks.append((index, file_path, chunk_start, chunk_end, initial_format, hits))
+
+    if workers == 1 or len(tasks) <= 1:
+        outputs = []
+        for task in tasks:
+            outputs.append(_parse_range_indexed(*task[1:]))
+            if progress is not None:
+                progress(task[3] - task[2], len(outputs[-1][0]))
+    else:
+        executor = _get_executor(workers)
+        futures = [executor.submit(_parse_range_indexed, *task[1:]) for task in tasks]
+        if progress is not None:
+            for task, future in zip(tasks, futures):
+                future.add_done_callback(partial(_report_chunk, progress, task[3] - task[2]))
+        outputs = [future.result() for future in futures]
+
+    chunks = {index: [] for index in parsers}
+    blocks = {index: [time_blocks(LogTableBuilder().build(), [])] for index in parsers}
+    for task, (table, chunk_hits, chunk_blocks) in zip(tasks, outputs):
+        parsers[task[0]].hits.update(chunk_hits)
+        chunks[task[0]].append(table)
+        blocks[task[0]].append(chunk_blocks)
+    for index, parts in chunks.items():
+        results[index] = (LogTable.concat(parts), np.concatenate(blocks[index]))
+    return results
+
+def top_rows_parallel(file_path: str, top_n: int = 10, field: str = 'resp_time', workers: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> LogTable:
+    """
+    청크별 상위 N개 행만 부모로 보내고 합쳐서 파일 전체의 상위 N개 행을 구합니다.
+
+    청크마다 N개만 남기므로 부모 메모리와 전송량은 O(청크 수 × N)이며,
+    청크 순서대로 합치므로 동률 순서도 순차 처리와 같습니다.
+    """
+    chunks = map_log_chunks(file_path, partial(keep_top_rows, top_n=top_n, field=field), workers, chunk_size)
+    return LogTable.concat(chunks).top_rows(top_n, field)
+
+def accumulate_parallel(file_path: str, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        slow_top_n: int = 10, keep_times: bool = False,
+                        relative_error: float = DEFAULT_RELATIVE_ERROR) -> LogAccumulator:
+    """
+    청크마다 집계 부분 상태(LogAccumulator)를 만들고 범위 순서대로 병합합니다.
+
+    결과는 파일 전체를 한 번에 누적한 것과 같으며, 워커는 행 대신 작은 부분 상태만 부모로 보냅니다.
+    """
+    chunk_func = partial(accumulate_chunk, slow_top_n=slow_top_n, keep_times=keep_times, relative_error=relative_error)
+    acc = LogAccumulator(slow_top_n=slow_top_n, keep_times=keep_times, relative_error=relative_error)
+    for state in map_log_chunks(file_path, chunk_func, workers, chunk_size):
+        acc.merge(state)
+    return acc
@@ -0,0 +1,291 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .table import LogTable
+
+# 질의 결과(행 인덱스)를 보관하는 LRU 캐시 크기 (항목 수)
+DEFAULT_SEARCH_CACHE_SIZE = 32
+
+# 일치한 행이 전체의 이 비율을 넘으면 포스팅을 모으는 대신 코드 배열 마스크로 찾음
+_MASK_FRACTION = 1 / 16
+
+# 포스팅 목록 배열 이름 (필드 -> LogTable 코드 컬럼)
+POSTING_FIELDS = ('url', 'ip', 'method', 'status')
+
+# 정규식에서 필수 리터럴을 끊는 메타 문자
+_REGEX_META = set('.^$*+?{}[]|()\\')
+
+def trigrams(text: str) -> set:
+    """소문자 문자열의 3글자 조각 집합"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def required_literals(pattern: str) -> List[str]:
+    """
+    정규식이 일치하려면 반드시 포함해야 하는 리터럴 조각을 소문자로 반환합니다.
+
+    최상위 수준의 연속된 일반 문자만 모으며, 대안(|)이 있으면 필수 조각을 알 수 없으므로
+    빈 목록을 반환합니다. 그룹/문자 클래스 안쪽과 ?, *, {} 앞 글자는 선택적이므로 제외합니다.
+    """
+    literals = []
+    current = ''
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escaped = pattern[i + 1:i + 2]
+            if depth == 0 and escaped and not escaped.isalnum():
+                current += escaped  # \. \/ 등 이스케이프된 일반 문자
+            else:
+                literals.append(current)
+                current = ''
+            i += 2
+            continue
+        if char == '|':
+            return []
+        if char == '[':
+            # 문자 클래스는 통째로 건너뜀 (닫는 ]까지, 맨 앞의 ^와 ]는 클래스의 일부)
+            literals.append(current)
+            current = ''
+            i += 1
+            if pattern[i:i + 1] == '^':
+                i += 1
+            if pattern[i:i + 1] == ']':
+                i += 1
+            while i < len(pattern) and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+            continue
+        if char == '{':
+            # {m,n} 반복: 앞 글자가 0번 나올 수 있으므로 빼고 닫는 }까지 건너뜀
+            literals.append(current[:-1])
+            current = ''
+            close = pattern.find('}', i)
+            i = len(pattern) if close < 0 else close + 1
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char in _REGEX_META:
+            if char in '?*' and current:
+                current = current[:-1]  # 앞 글자가 0번 나올 수 있음
+            literals.append(current)
+            current = ''
+        elif depth == 0:
+            current += char
+        i += 1
+    literals.append(current)
+    return [literal.lower() for literal in literals if literal]
+
+def _narrow(codes: np.ndarray, n_values: int) -> np.ndarray:
+    # 사전 크기에 맞는 가장 작은 부호 없는 정수형으로 변환 (16비트 이하는 안정 정렬이 기수 정렬로 빨라짐)
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if n_values <= np.iinfo(dtype).max + 1:
+            return codes.astype(dtype, copy=False)
+    return codes
+
+class SearchIndex:
+    """
+    LogTable 하나에 대한 키워드/정규식 검색 인덱스
+
+    - URL, IP 사전: 소문자 3글자 조각(trigram) -> 그 조각을 가진 사전 코드 배열
+    - URL, IP, 메소드, 상태코드: 값 코드별 행 포스팅 목록 (코드순 정렬한 행 번호 + 코드별 시작 위치)
+
+    질의는 먼저 사전(고유값) 수준에서 일치하는 값을 찾은 뒤 포스팅 목록으로 행을 모으므로,
+    행 수가 아니라 사전 크기와 결과 행 수에 비례합니다. 같은 질의는 작은 LRU 캐시에서 바로 반환합니다.
+    LogTable.search와 같이 URL, IP, 메소드, 상태코드 중 하나라도 일치하는 행을 찾습니다 (대소문자 무시).
+    """
+
+    def __init__(self, table: LogTable, postings: Optional[Dict[str, np.ndarray]] = None,
+                 cache_size: int = DEFAULT_SEARCH_CACHE_SIZE):
+        self.table = table
+        # 상태코드 값 -> 코드 (값 범위가 int16이므로 정렬 없이 조회 표로 변환)
+        present = np.zeros(1 << 16, dtype=bool)
+        present[table.status.astype(np.int64) + (1 << 15)] = True
+        self.statuses = np.flatnonzero(present) - (1 << 15)
+        lookup = np.cumsum(present) - 1
+        self._codes = {
+            'url': table.url,
+            'ip': table.ip,
+            'method': table.method,
+            'status': lookup[table.status.astype(np.int64) + (1 << 15)],
+        }
+        self._lower = {
+            'url': [value.lower() for value in table.urls],
+            'ip': [value.lower() for value in table.ips],
+            'method': [value.lower() for value in table.methods],
+            'status': [str(int(value)) for value in self.statuses],
+        }
+        self._values = {
+            'url': table.urls,
+            'ip': table.ips,
+            'method': table.methods,
+            'status': self._lower['status'],
+        }
+        self._trigrams = {field: self._build_trigrams(self._lower[field]) for field in ('url', 'ip')}
+        # 코드별 행 포스팅 (파싱 시 만들어 캐시에 저장한 것이 있으면 재사용)
+        row_dtype = np.int32 if len(table) < 2 ** 31 else np.int64
+        self.postings = postings if postings is not None else {
+            field: np.argsort(_narrow(self._codes[field], len(self._lower[field])), kind='stable').astype(row_dtype)
+            for field in POSTING_FIELDS
+        }
+        self._offsets = {}
+        for field in POSTING_FIELDS:
+            counts = np.bincount(self._codes[field], minlength=len(self._lower[field]))
+            self._offsets[field] = np.concatenate(([0], np.cumsum(counts)))
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[Tuple[str, bool], np.ndarray]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # 프로세스 간 전달(피클)할 때 잠금과 결과 캐시는 빼고 보냄
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_cache'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def extend(self, table: LogTable, start: int) -> 'SearchIndex':
+        """
+        앞 start행이 이 인덱스의 테이블과 같은 table(LogTable.append 결과)의 인덱스를 만듭니다.
+
+        기존 포스팅은 다시 정렬하지 않고, 덧붙은 행의 포스팅만 정렬해 코드별 구간 끝에 끼워 넣습니다.
+        """
+        added = table.status[start:].astype(np.int64)
+        statuses = np.union1d(self.statuses, added)
+        row_dtype = np.int32 if len(table) < 2 ** 31 else np.int64
+        postings = {}
+        for field in POSTING_FIELDS:
+            if field == 'status':
+                n_values = len(statuses)
+                old_codes = np.searchsorted(statuses, self.statuses)  # 새 상태코드가 끼어들면 기존 코드도 바뀜
+                new_codes = np.searchsorted(statuses, added)
+            else:
+                n_values = len(getattr(table, field + 's'))
+                old_codes = np.arange(len(self._lower[field]))
+                new_codes = getattr(table, field)[start:]
+            old_counts = np.zeros(n_values, dtype=np.int64)
+            old_counts[old_codes] = np.diff(self._offsets[field])
+            new_counts = np.bincount(new_codes, minlength=n_values)
+            starts = np.cumsum(old_counts + new_counts) - old_counts - new_counts
+            merged = np.empty(len(table), dtype=row_dtype)
+            # 코드별로 기존 행(순서 유지) 다음에 덧붙은 행
+            old_shift = starts - (np.cumsum(old_counts) - old_counts)
+            merged[np.arange(start) + np.repeat(old_shift, old_counts)] = self.postings[field]
+            new_shift = starts + old_counts - (np.cumsum(new_counts) - new_counts)
+            new_rows = np.argsort(_narrow(new_codes, n_values), kind='stable') + start
+            merged[np.arange(len(new_rows)) + np.repeat(new_shift, new_counts)] = new_rows
+            postings[field] = merged
+        return SearchIndex(table, postings, self.cache_size)
+
+    @staticmethod
+    def _build_trigrams(values: List[str]) -> Dict[str, np.ndarray]:
+        # trigram -> 그 조각을 가진 사전 코드 (오름차순)
+        index: Dict[str, List[int]] = {}
+        for code, value in enumerate(values):
+            for gram in trigrams(value):
+                index.setdefault(gram, []).append(code)
+        return {gram: np.array(codes, dtype=np.int64) for gram, codes in index.items()}
+
+    @property
+    def nbytes(self) -> int:
+        # 포스팅 배열이 차지하는 메모리 (trigram 사전 제외)
+        return sum(array.nbytes for array in self.postings.values())
+
+    def _candidates(self, field: str, literals: List[str]) -> Optional[np.ndarray]:
+        # 모든 리터럴의 trigram을 가진 사전 코드 (trigram을 쓸 수 없으면 None = 전체)
+        grams = set()
+        for literal in literals:
+            grams |= trigrams(literal)
+        if field not in self._trigrams or not grams:
+            return None
+        postings = [self._trigrams[field].get(gram) for gram in grams]
+        if any(codes is None for codes in postings):
+            return np.empty(0, dtype=np.int64)
+        postings.sort(key=len)
+        candidates = postings[0]
+        for codes in postings[1:]:
+            candidates = np.intersect1d(candidates, codes, assume_unique=True)
+        return candidates
+
+    def _matching_codes(self, field: str, query: str, regex: Optional[re.Pattern]) -> np.ndarray:
+        # 질의와 일치하는 사전 코드 (trigram으로 후보를 줄인 뒤 실제 문자열로 확인)
+        literals = required_literals(query) if regex is not None else [query]
+        candidates = self._candidates(field, literals)
+        codes = range(len(self._lower[field])) if candidates is None else candidates.tolist()
+        if regex is not None:
+            values = self._values[field]
+            return np.array([code for code in codes if regex.search(values[code])], dtype=np.int64)
+        values = self._lower[field]
+        return np.array([code for code in codes if query in values[code]], dtype=np.int64)
+
+    def _field_rows(self, field: str, codes: np.ndarray) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        # 코드들의 행을 (정렬 안 된 행 번호, 불리언 마스크) 중 하나로 반환
+        offsets = self._offsets[field]
+        total = int((offsets[codes + 1] - offsets[codes]).sum())
+        if total > len(self.table) * _MASK_FRACTION:
+            hit = np.zeros(len(self._lower[field]), dtype=bool)
+            hit[codes] = True
+            return None, hit[self._codes[field]]
+        postings = self.postings[field]
+        return np.concatenate([postings[offsets[code]:offsets[code + 1]] for code in codes.tolist()]), None
+
+    def _search(self, query: str, regex: bool) -> np.ndarray:
+        pattern = re.compile(query, re.IGNORECASE) if regex else None
+        query = query if regex else query.lower()
+        parts = []
+        mask = None
+        for field in POSTING_FIELDS:
+            codes = self._matching_codes(field, query, pattern)
+            if not len(codes):
+                continue
+            rows, field_mask = self._field_rows(field, codes)
+            if field_mask is not None:
+                mask = field_mask if mask is None else mask | field_mask
+            else:
+                parts.append(rows)
+        if mask is not None:
+            for rows in parts:
+                mask[rows] = True
+            return np.flatnonzero(mask)
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(parts))
+
+    def search(self, query: str, regex: bool = False) -> np.ndarray:
+        """
+        질의와 일치하는 행 인덱스를 원래 순서대로 반환합니다.
+
+        Args:
+            query: 부분 문자열 키워드 또는 정규식
+            regex: True면 query를 정규식으로 사용 (잘못된 정규식은 re.error)
+        """
+        key = (query, regex)
+        with self._lock:
+            rows = self._cache.get(key)
+            if rows is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return rows
+            self.misses += 1
+        rows = self._search(query, regex)
+        rows.flags.writeable = False  # 캐시된 결과를 호출한 쪽이 바꾸지 못하게 함
+        with self._lock:
+            self._cache[key] = rows
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return rows
+
+    def search_records(self, query: str, regex: bool = False) -> List[Dict]:
+        """질의와 일치하는 로그 딕셔너리 리스트 (LogTable.search와 같은 결과)"""
+        return self.table.records(self.search(query, regex))
@@ -0,0 +1,201 @@
+import math
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# 기본 상대 오차 (1%: 추정 분위수가 실제 값의 ±1% 이내)
+DEFAULT_RELATIVE_ERROR = 0.01
+
+# 스케치 하나가 가질 수 있는 최대 구간 수 (넘으면 가장 작은 구간부터 합침)
+DEFAULT_MAX_BINS = 2048
+
+# 이 행 수 이하의 파일은 스케치 대신 NumPy로 정확한 분위수를 계산
+EXACT_QUANTILE_MAX_ROWS = 200000
+
+# 대시보드에 표시하는 분위수 (키 이름, 비율)
+PERCENTILES = (('p50', 0.5), ('p90', 0.9), ('p95', 0.95), ('p99', 0.99))
+
+def quantile_rank(count: int, q: float) -> int:
+    """정렬된 count개 값에서 q 분위수의 인덱스 (기존 p90 계산과 같은 규칙)"""
+    return max(int(count * q) - 1, 0) if count > 1 else 0
+
+def quantile_ranks(counts: np.ndarray, q: float) -> np.ndarray:
+    """quantile_rank의 배열 버전"""
+    return np.where(counts > 1, np.maximum((counts * q).astype(np.int64) - 1, 0), 0)
+
+def exact_quantiles(values, quantiles: Sequence[float]) -> List:
+    """NumPy 부분 정렬(np.partition)로 정확한 분위수를 구합니다 (작은 파일용)."""
+    values = np.asarray(values)
+    if not len(values):
+        return [0] * len(quantiles)
+    ranks = [quantile_rank(len(values), q) for q in quantiles]
+    selected = np.partition(values, sorted(set(ranks)))
+    return [selected[rank].item() for rank in ranks]
+
+class QuantileSketch:
+    """
+    DDSketch 방식의 병합 가능한 분위수 스케치.
+
+    양수 값을 로그 간격 구간(gamma^(k-1), gamma^k]에 세어 두므로, 어떤 분위수든
+    실제 값과의 상대 오차가 relative_error 이내입니다. 메모리는 값의 개수가 아니라
+    값의 범위(로그 스케일)에 비례하며 max_bins개로 제한됩니다.
+    같은 relative_error로 만든 스케치끼리는 구간 카운트를 더해 병합할 수 있습니다.
+    """
+
+    def __init__(self, relative_error: float = DEFAULT_RELATIVE_ERROR, max_bins: int = DEFAULT_MAX_BINS):
+        if not 0 < relative_error < 1:
+            raise ValueError(f"relative_error는 0과 1 사이여야 합니다: {relative_error}")
+        self.relative_error = relative_error
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self.gamma)
+        self.bins = {}        # 구간 번호 -> 값 개수
+        self.zero_count = 0   # 0 이하 값 개수 (응답시간 0ms)
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def key(self, value: float) -> int:
+        # 양수 값이 속한 구간 번호
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def value(self, key: int) -> float:
+        # 구간의 대표값 (구간 안 어떤 값과도 상대 오차가 relative_error 이내)
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """값을 count번 추가합니다."""
+        if value > 0:
+            key = self.key(value)
+            self.bins[key] = self.bins.get(key, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        else:
+            self.zero_count += count
+        self.count += count
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+
+    def update(self, values: Iterable[float]) -> 'QuantileSketch':
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """다른 스케치의 값을 합칩니다 (결합 법칙이 성립하므로 청크/파일/날짜 순서와 무관)."""
+        if other.relative_error != self.relative_error:
+            raise ValueError("relative_error가 다른 스케치는 병합할 수 없습니다")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def _collapse(self) -> None:
+        # 가장 작은 구간들을 하나로 합쳐 max_bins개로 줄임 (높은 분위수의 정확도는 유지)
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.bins[target] += self.bins.pop(key)
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[float]:
+        """여러 분위수를 구간을 한 번만 정렬해 구합니다 (값이 없으면 0)."""
+        if not self.count:
+            return [0] * len(quantiles)
+        ranks = [quantile_rank(self.count, q) for q in quantiles]
+        results = {}
+        pending = sorted(set(ranks))
+        cumulative = self.zero_count
+        while pending and pending[0] < cumulative:
+            results[pending.pop(0)] = self.min
+        for key in sorted(self.bins):
+            cumulative += self.bins[key]
+            while pending and pending[0] < cumulative:
+                # 최솟값/최댓값 밖으로 나가지 않게 보정
+                results[pending.pop(0)] = min(max(self.value(key), self.min), self.max)
+            if not pending:
+                break
+        return [results[rank] for rank in ranks]
+
+    def to_dict(self) -> Dict:
+        """JSON으로 저장할 수 있는 상태"""
+        return {
+            'relative_error': self.relative_error,
+            'max_bins': self.max_bins,
+            'bins': [[key, count] for key, count in sorted(self.bins.items())],
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'QuantileSketch':
+        sketch = cls(state['relative_error'], state['max_bins'])
+        sketch.bins = {int(key): int(count) for key, count in state['bins']}
+        sketch.zero_count = state['zero_count']
+        sketch.count = state['count']
+        sketch.min = state['min']
+        sketch.max = state['max']
+        return sketch
+
+def group_sketches(groups: np.ndarray, values: np.ndarray, n_groups: int,
+                   relative_error: float = DEFAULT_RELATIVE_ERROR,
+                   max_bins: int = DEFAULT_MAX_BINS) -> List[QuantileSketch]:
+    """
+    그룹 코드별 스케치를 벡터 연산으로 만듭니다 (LogTable의 URL 코드별 응답시간 등).
+
+    Args:
+        groups: 행별 그룹 코드 (0 ~ n_groups-1)
+        values: 행별 값
+        n_groups: 그룹 수
+        relative_error: 상대 오차
+        max_bins: 스케치당 최대 구간 수
+    """
+    sketches = [QuantileSketch(relative_error, max_bins) for _ in range(n_groups)]
+    if not len(values):
+        return sketches
+    values = np.asarray(values)
+    counts = np.bincount(groups, minlength=n_groups)
+    mins = np.full(n_groups, np.inf)
+    maxs = np.full(n_groups, -np.inf)
+    np.minimum.at(mins, groups, values)
+    np.maximum.at(maxs, groups, values)
+    positive = values > 0
+    zero_counts = np.bincount(groups[~positive], minlength=n_groups)
+
+    keys = np.ceil(np.log(values[positive].astype(np.float64)) / sketches[0]._log_gamma).astype(np.int64)
+    if len(keys):
+        low = int(keys.min())
+        span = int(keys.max()) - low + 1
+        # (그룹, 구간) 쌍을 정수 하나로 묶어 한 번에 센다 (범위가 작으면 정렬 없이 bincount)
+        combined = groups[positive].astype(np.int64) * span + (keys - low)
+        if n_groups * span <= max(len(combined), 1 << 20):
+            bin_counts = np.bincount(combined, minlength=n_groups * span)
+            combined = np.flatnonzero(bin_counts)
+            bin_counts = bin_counts[combined]
+        else:
+            combined, bin_counts = np.unique(combined, return_counts=True)
+        codes = (combined // span).tolist()
+        bin_keys = (combined % span + low).tolist()
+        for code, key, count in zip(codes, bin_keys, bin_counts.tolist()):
+            sketches[code].bins[key] = count
+
+    for code, sketch in enumerate(sketches):
+        if counts[code]:
+            sketch.count = int(counts[code])
+            sketch.zero_count = int(zero_counts[code])
+            sketch.min = mins[code].item()
+            sketch.max = maxs[code].item()
+            if len(sketch.bins) > max_bins:
+                sketch._collapse()
+    return sketches
@@ -0,0 +1,507 @@
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .sketch import DEFAULT_RELATIVE_ERROR, PERCENTILES, group_sketches, quantile_ranks
+from .utils import LogAccumulator, epoch_to_timestamp, hour_label, improvements_from_stats, timestamp_to_epoch
+
+# 타임스탬프가 없거나 해석할 수 없는 레코드 표시용 값
+NO_TIMESTAMP = np.iinfo(np.int64).min
+
+# 페이지 조회 시 한 번에 필터를 적용하는 최소 행 수 (페이지가 작아도 numpy 연산 단위는 이만큼)
+SCAN_BLOCK_ROWS = 4096
+
+# 응답 시간 컬럼(int64)에 담을 수 있는 최댓값 (정규식은 자릿수 제한이 없으므로 더 큰 값은 여기로 자름)
+MAX_RESP_TIME = np.iinfo(np.int64).max
+
+def _in_first_seen_order(values: np.ndarray):
+    # 고유값을 처음 등장한 순서대로 반환 (dict/Counter 삽입 순서와 동일하게 맞추기 위함)
+    uniques, first_index, inverse, counts = np.unique(values, return_index=True, return_inverse=True, return_counts=True)
+    order = np.argsort(first_index, kind='stable')
+    return uniques, order, inverse, counts
+
+class LogTableBuilder:
+    """레코드를 하나씩 받아 LogTable 컬럼을 채우는 빌더"""
+
+    def __init__(self):
+        self.ts = array('q')
+        self.tz = array('i')
+        self.status = array('h')
+        self.resp_time = array('q')
+        self.url = array('i')
+        self.ip = array('i')
+        self.method = array('b')
+        self.urls: List[str] = []
+        self.ips: List[str] = []
+        self.methods: List[str] = []
+        self._url_codes: Dict[str, int] = {}
+        self._ip_codes: Dict[str, int] = {}
+        self._method_codes: Dict[str, int] = {}
+
+    @staticmethod
+    def _encode(value: str, codes: Dict[str, int], vocab: List[str]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(vocab)
+            vocab.append(value)
+        return code
+
+    def append(self, log: Dict) -> None:
+        """파싱된 로그 딕셔너리 한 건을 추가합니다."""
+        # 파싱 시 계산한 epoch을 그대로 사용 (직접 만든 레코드는 timestamp 문자열 해석)
+        epoch = log['ts'] if 'ts' in log else timestamp_to_epoch(log['timestamp'])
+        self.ts.append(NO_TIMESTAMP if epoch is None else epoch)
+        self.tz.append(log.get('tz', 0))
+        try:
+            self.status.append(int(log['status']))
+        except ValueError:
+            self.status.append(0)
+        self.resp_time.append(min(log['resp_time'], MAX_RESP_TIME))
+        self.url.append(self._encode(log['url'], self._url_codes, self.urls))
+        self.ip.append(self._encode(log['ip'], self._ip_codes, self.ips))
+        self.method.append(self._encode(log['method'], self._method_codes, self.methods))
+
+    def build(self) -> 'LogTable':
+        """지금까지 추가된 레코드로 LogTable을 생성합니다."""
+        return LogTable(
+            ts=np.frombuffer(self.ts, dtype=np.int64) if self.ts else np.empty(0, dtype=np.int64),
+            tz=np.frombuffer(self.tz, dtype=np.int32) if self.tz else np.empty(0, dtype=np.int32),
+            status=np.frombuffer(self.status, dtype=np.int16) if self.status else np.empty(0, dtype=np.int16),
+            resp_time=np.frombuffer(self.resp_time, dtype=np.int64) if self.resp_time else np.empty(0, dtype=np.int64),
+            url=np.frombuffer(self.url, dtype=np.int32) if self.url else np.empty(0, dtype=np.int32),
+            ip=np.frombuffer(self.ip, dtype=np.int32) if self.ip else np.empty(0, dtype=np.int32),
+            method=np.frombuffer(self.method, dtype=np.int8) if self.method else np.empty(0, dtype=np.int8),
+            urls=self.urls,
+            ips=self.ips,
+            methods=self.methods,
+        )
+
+class LogTable:
+    """
+    파싱된 로그를 컬럼 단위 NumPy 배열로 보관하는 테이블
+
+    - ts: UTC epoch 초 (int64, 해석 불가 시 NO_TIMESTAMP)
+    - tz: 시간대 오프셋 초 (int32, 시간 버킷은 현지 시각 ts + tz 기준)
+    - status: 상태 코드 (int16)
+    - resp_time: 응답 시간 ms (int64, MAX_RESP_TIME을 넘는 값은 잘라 저장)
+    - url / ip / method: 사전 인코딩된 코드 (urls / ips / methods 목록의 인덱스)
+
+    레코드당 약 31바이트이며, 분석 메서드는 utils의 같은 이름 함수와
+    같은 형태의 결과를 NumPy 연산으로 계산합니다.
+    """
+
+    def __init__(self, ts, tz, status, resp_time, url, ip, method, urls, ips, methods):
+        self.ts = ts
+        self.tz = tz
+        self.status = status
+        self.resp_time = resp_time
+        self.url = url
+        self.ip = ip
+        self.method = method
+        self.urls = urls
+        self.ips = ips
+        self.methods = methods
+
+    @classmethod
+    def from_records(cls, logs: Iterable[Dict]) -> 'LogTable':
+        """파싱된 로그 딕셔너리들(리스트 또는 이터레이터)로 테이블을 생성합니다."""
+        builder = LogTableBuilder()
+        append = builder.append
+        for log in logs:
+            append(log)
+        return builder.build()
+
+    @classmethod
+    def concat(cls, tables: List['LogTable']) -> 'LogTable':
+        """
+        여러 테이블(예: 병렬 파싱한 청크)을 순서대로 이어 붙입니다.
+
+        청크마다 따로 만든 URL/IP/메소드 사전을 하나로 합치고 코드를 다시 매핑합니다.
+        """
+        tables = list(tables)
+        if not tables:
+            return LogTableBuilder().build()
+        if len(tables) == 1:
+            return tables[0]
+
+        def merge_vocab(vocabs, columns, dtype):
+            merged: List[str] = []
+            codes: Dict[str, int] = {}
+            remapped = []
+            for vocab, column in zip(vocabs, columns):
+                mapping = np.array([LogTableBuilder._encode(v, codes, merged) for v in vocab], dtype=dtype)
+                remapped.append(mapping[column] if len(column) else column.astype(dtype))
+            return merged, np.concatenate(remapped)
+
+        urls, url = merge_vocab([t.urls for t in tables], [t.url for t in tables], np.int32)
+        ips, ip = merge_vocab([t.ips for t in tables], [t.ip for t in tables], np.int32)
+        methods, method = merge_vocab([t.methods for t in tables], [t.method for t in tables], np.int8)
+        return cls(
+            ts=np.concatenate([t.ts for t in tables]),
+            tz=np.concatenate([t.tz for t in tables]),
+            status=np.concatenate([t.status for t in tables]),
+            resp_time=np.concatenate([t.resp_time for t in tables]),
+            url=url,
+            ip=ip,
+            method=method,
+            urls=urls,
+            ips=ips,
+            methods=methods,
+        )
+
+    def append(self, other: 'LogTable') -> 'LogTable':
+        """
+        이 테이블 뒤에 other를 이어 붙입니다 (concat과 같은 결과).
+
+        이 테이블의 사전과 코드는 그대로 두고 other의 코드만 다시 매핑하므로, 증분 파싱에서
+        기존 행의 검색 인덱스 포스팅을 그대로 이어 쓸 수 있습니다.
+        """
+        def extend_vocab(vocab, column, other_vocab, other_column, dtype):
+            merged = list(vocab)
+            codes = {value: code for code, value in enumerate(merged)}
+            mapping = np.array([LogTableBuilder._encode(v, codes, merged) for v in other_vocab], dtype=dtype)
+            remapped = mapping[other_column] if len(other_column) else other_column.astype(dtype)
+            return merged, np.concatenate([column, remapped])
+
+        urls, url = extend_vocab(self.urls, self.url, other.urls, other.url, np.int32)
+        ips, ip = extend_vocab(self.ips, self.ip, other.ips, other.ip, np.int32)
+        methods, method = extend_vocab(self.methods, self.method, other.methods, other.method, np.int8)
+        return LogTable(
+            ts=np.concatenate([self.ts, other.ts]),
+            tz=np.concatenate([self.tz, other.tz]),
+            status=np.concatenate([self.status, other.status]),
+            resp_time=np.concatenate([self.resp_time, other.resp_time]),
+            url=url,
+            ip=ip,
+            method=method,
+            urls=urls,
+            ips=ips,
+            methods=methods,
+        )
+
+    def take(self, rows) -> 'LogTable':
+        """행 인덱스 또는 불리언 마스크로 일부 행만 가진 테이블을 만듭니다 (사전은 공유)."""
+        return LogTable(
+            ts=self.ts[rows],
+            tz=self.tz[rows],
+            status=self.status[rows],
+            resp_time=self.resp_time[rows],
+            url=self.url[rows],
+            ip=self.ip[rows],
+            method=self.method[rows],
+            urls=self.urls,
+            ips=self.ips,
+            methods=self.methods,
+        )
+
+    def time_window(self, ts_from: Optional[int] = None, ts_to: Optional[int] = None) -> 'LogTable':
+        """현지 시각(ts + tz) epoch 초 [ts_from, ts_to) 구간의 행만 가진 테이블 (None이면 그쪽 제한 없음, 타임스탬프 없는 행 제외)"""
+        local = self.ts + self.tz
+        mask = self.ts != NO_TIMESTAMP
+        if ts_from is not None:
+            mask &= local >= ts_from
+        if ts_to is not None:
+            mask &= local < ts_to
+        return self.take(mask)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def nbytes(self) -> int:
+        # 컬럼 배열이 차지하는 메모리 (사전 문자열 제외)
+        return sum(col.nbytes for col in (self.ts, self.tz, self.status, self.resp_time, self.url, self.ip, self.method))
+
+    def records(self, indices: Optional[Iterable[int]] = None) -> List[Dict]:
+        """지정한 행(기본: 전체)을 로그 딕셔너리 리스트로 복원합니다."""
+        if indices is None:
+            indices = range(len(self))
+        result = []
+        for i in indices:
+            ts = int(self.ts[i])
+            tz = int(self.tz[i])
+            valid = ts != NO_TIMESTAMP
+            result.append({
+                'timestamp': epoch_to_timestamp(ts + tz) if valid else '',
+                'method': self.methods[self.method[i]],
+                'ip': self.ips[self.ip[i]],
+                'url': self.urls[self.url[i]],
+                'status': str(int(self.status[i])),
+                'resp_time': int(self.resp_time[i]),
+                'ts': ts if valid else None,
+                'tz': tz
+            })
+        return result
+
+    def page(self, rows: Optional[np.ndarray] = None, after: int = -1, limit: int = 100,
+             status_ranges: Optional[Sequence[Tuple[int, int]]] = None) -> Tuple[np.ndarray, Optional[int]]:
+        """
+        커서 이후 필터에 맞는 행을 최대 limit개 찾습니다 (커서 위치부터 블록 단위로 훑으므로 페이지 크기에 비례하는 비용).
+
+        Args:
+            rows: 훑을 행 인덱스 (오름차순, 예: 검색 인덱스 결과), None이면 전체 행
+            after: 커서 (이전 페이지 마지막 행 번호, 처음이면 -1)
+            limit: 페이지 크기
+            status_ranges: 상태 코드 [시작, 끝) 구간 목록 (하나라도 맞으면 포함, None이면 제한 없음)
+
+        Returns:
+            (페이지의 행 인덱스, 다음 페이지 커서 또는 None)
+        """
+        total = len(self) if rows is None else len(rows)
+        pos = after + 1 if rows is None else int(np.searchsorted(rows, after, side='right'))
+        block = max(limit * 2, SCAN_BLOCK_ROWS)
+        found = []
+        count = 0
+        # 다음 페이지가 있는지 알기 위해 limit + 1개까지 찾음
+        while pos < total and count <= limit:
+            end = min(pos + block, total)
+            candidates = np.arange(pos, end) if rows is None else np.asarray(rows[pos:end])
+            if status_ranges is not None:
+                status = self.status[candidates]
+                mask = np.zeros(len(candidates), dtype=bool)
+                for low, high in status_ranges:
+                    mask |= (status >= low) & (status < high)
+                candidates = candidates[mask]
+            found.append(candidates[:limit + 1 - count])
+            count += len(found[-1])
+            pos = end
+        selected = np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+        if len(selected) > limit:
+            selected = selected[:limit]
+            return selected, int(selected[-1])
+        return selected, None
+
+    def _hours(self):
+        # 타임스탬프가 유효한 행의 마스크와 현지 시각 기준 시간 번호
+        valid = self.ts != NO_TIMESTAMP
+        return valid, (self.ts[valid] + self.tz[valid]) // 3600
+
+    def _error_mask(self):
+        # 4xx, 5xx 에러 행 마스크
+        return (self.status >= 400) & (self.status < 600)
+
+    def search(self, keyword: str) -> List[Dict]:
+        # URL, 상태코드, 메소드, IP 중 keyword가 포함된 로그 (사전 단위로 비교 후 코드로 필터)
+        keyword_lower = keyword.lower()
+        url_hit = np.array([keyword_lower in u.lower() for u in self.urls], dtype=bool)
+        ip_hit = np.array([keyword_lower in ip.lower() for ip in self.ips], dtype=bool)
+        method_hit = np.array([keyword_lower in m.lower() for m in self.methods], dtype=bool)
+        mask = np.zeros(len(self), dtype=bool)
+        if len(self):
+            mask |= url_hit[self.url] | ip_hit[self.ip] | method_hit[self.method]
+            for code in np.unique(self.status):
+                if keyword_lower in str(int(code)):
+                    mask |= self.status == code
+        return self.records(np.flatnonzero(mask))
+
+    def errors(self) -> List[Dict]:
+        # 4xx, 5xx 에러 로그
+        return self.records(np.flatnonzero(self._error_mask()))
+
+    def error_rows(self) -> 'LogTable':
+        # 4xx, 5xx 에러 행만 가진 테이블
+        return self.take(self._error_mask())
+
+    def traffic_by_hour(self):
+        # 시간대별 트래픽(요청 수) 집계
+        _, hours = self._hours()
+        uniques, counts = np.unique(hours, return_counts=True)
+        return [(hour_label(int(h)), int(c)) for h, c in zip(uniques, counts)]
+
+    def _endpoint_arrays(self):
+        # URL 코드별 호출수와 응답시간 합계
+        n = len(self.urls)
+        counts = np.bincount(self.url, minlength=n)
+        totals = np.bincount(self.url, weights=self.resp_time, minlength=n).astype(np.float64)
+        return counts, totals
+
+    def endpoint_percentiles(self, relative_error: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        URL 코드별 p50/p90/p95/p99 응답시간 배열을 반환합니다.
+
+        relative_error가 None이면 URL, 응답시간 순 정렬로 정확한 값을 구하고,
+        아니면 URL별 분위수 스케치(상대 오차 relative_error)의 근사값을 사용합니다.
+        """
+        counts = np.bincount(self.url, minlength=len(self.urls))
+        if relative_error is not None:
+            sketches = group_sketches(self.url, self.resp_time, len(self.urls), relative_error)
+            quantiles = [q for _, q in PERCENTILES]
+            values = np.array([sketch.quantiles(quantiles) for sketch in sketches], dtype=np.float64).reshape(-1, len(PERCENTILES))
+            return {name: np.rint(values[:, i]).astype(np.int64) for i, (name, _) in enumerate(PERCENTILES)}
+        # URL 코드, 응답시간 순으로 정렬하면 URL별 구간이 정렬된 응답시간이 됨
+        sorted_times = self.resp_time[np.lexsort((self.resp_time, self.url))]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])) if len(counts) else counts
+        present = counts > 0
+        result = {}
+        for name, q in PERCENTILES:
+            values = np.zeros(len(counts), dtype=np.int64)
+            values[present] = sorted_times[(starts + quantile_ranks(counts, q))[present]]
+            result[name] = values
+        return result
+
+    @staticmethod
+    def _with_percentiles(entry: Dict, code: int, percentiles: Optional[Dict[str, np.ndarray]]) -> Dict:
+        if percentiles is not None:
+            for name, _ in PERCENTILES:
+                entry[name] = int(percentiles[name][code])
+        return entry
+
+    def endpoint_stats(self, percentiles: Optional[Dict[str, np.ndarray]] = None):
+        # 엔드포인트별 호출수, 평균 응답시간 (호출수 내림차순, percentiles를 주면 분위수 포함)
+        counts, totals = self._endpoint_arrays()
+        order = np.argsort(-counts, kind='stable')
+        return [
+            self._with_percentiles({'url': self.urls[code], 'count': int(counts[code]),
+                                    'avg_time': float(totals[code] / counts[code])}, code, percentiles)
+            for code in order if counts[code]
+        ]
+
+    def status_code_stats(self):
+        # 상태 코드별 빈도, 에러 집중 시간/엔드포인트
+        code_counter = {}
+        if len(self):
+            uniques, order, _, counts = _in_first_seen_order(self.status)
+            code_counter = {str(int(uniques[i])): int(counts[i]) for i in order}
+
+        errors = self._error_mask()
+        valid, hours = self._hours()
+        error_hours = hours[errors[valid]]
+        error_by_time = {}
+        if len(error_hours):
+            uniques, order, _, counts = _in_first_seen_order(error_hours)
+            error_by_time = {hour_label(int(uniques[i])): int(counts[i]) for i in order}
+
+        error_urls = self.url[errors]
+        error_by_url = {}
+        if len(error_urls):
+            uniques, order, _, counts = _in_first_seen_order(error_urls)
+            error_by_url = {self.urls[uniques[i]]: int(counts[i]) for i in order}
+        return {
+            'code_counter': code_counter,
+            'error_by_time': error_by_time,
+            'error_by_url': error_by_url
+        }
+
+    def _top_indices(self, top_n: int, field: str) -> np.ndarray:
+        # field 값이 큰 상위 N개 행 번호 (값 내림차순, 동률은 원래 순서)
+        values = getattr(self, field)
+        n = len(self)
+        if n == 0 or top_n <= 0:
+            return np.zeros(0, dtype=np.int64)
+        if top_n < n:
+            # 부분 정렬로 N번째 값을 찾고 그 이상인 후보만 정렬 (O(n + k log k))
+            threshold = np.partition(values, n - top_n)[n - top_n]
+            candidates = np.flatnonzero(values >= threshold)
+        else:
+            candidates = np.arange(n)
+        order = np.lexsort((candidates, -values[candidates].astype(np.float64)))[:top_n]
+        return candidates[order]
+
+    def top_rows(self, top_n=10, field='resp_time') -> 'LogTable':
+        """숫자 컬럼(resp_time, status, ts 등) 값이 큰 상위 N개 행 (값 내림차순, 동률은 원래 순서 유지)"""
+        return self.take(self._top_indices(top_n, field))
+
+    def slow_requests(self, top_n=10):
+        # 처리시간이 긴 상위 N개 요청 (동률은 원래 순서 유지)
+        return self.top_rows(top_n, 'resp_time').records()
+
+    def slowest_endpoints(self, top_n=5, percentiles: Optional[Dict[str, np.ndarray]] = None):
+        # 평균 응답시간이 느린 엔드포인트 top N, 90퍼센타일 (percentiles를 주면 그 분위수들 사용)
+        counts, totals = self._endpoint_arrays()
+        p90 = (percentiles or self.endpoint_percentiles())['p90']
+
+        result = []
+        avg = np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        # endpoint_stats 순서(호출수 내림차순) 기준으로 평균 응답시간 내림차순 정렬
+        order = order[np.argsort(-avg[order], kind='stable')][:top_n]
+        for code in order:
+            entry = {
+                'url': self.urls[code],
+                'count': int(counts[code]),
+                'avg_time': float(avg[code]),
+                'p90': int(p90[code])
+            }
+            result.append(self._with_percentiles(entry, code, percentiles))
+        return result
+
+    def detect_anomalies(self):
+        # 응답시간 급증 시간대, 요청 수 상위 IP
+        valid, hours = self._hours()
+        spike_hours = []
+        if len(hours):
+            uniques, order, inverse, counts = _in_first_seen_order(hours)
+            hour_avg = np.bincount(inverse, weights=self.resp_time[valid]) / counts
+            # 기존 구현과 같은 순서로 더해 부동소수점 결과를 맞춤
+            global_avg = sum(hour_avg[order].tolist()) / len(order)
+            spike_hours = [
+                hour_label(int(uniques[i])) for i in order
+                if hour_avg[i] > 2 * global_avg and hour_avg[i] > 200
+            ]
+
+        ip_counts = np.bincount(self.ip, minlength=len(self.ips))
+        top = np.argsort(-ip_counts, kind='stable')[:5]
+        top_ips = [(self.ips[code], int(ip_counts[code])) for code in top if ip_counts[code]]
+        return {
+            'spike_hours': spike_hours,
+            'top_ips': top_ips
+        }
+
+    def accumulate(self, slow_top_n: int = 10, keep_times: bool = False,
+                   relative_error: float = DEFAULT_RELATIVE_ERROR) -> LogAccumulator:
+        """
+        이 테이블의 행들을 순서대로 누적한 것과 같은 LogAccumulator 상태를 벡터 연산으로 만듭니다.
+
+        병렬 청크나 파일별 결과를 LogAccumulator.merge()로 합치기 위한 부분 상태입니다.
+        """
+        acc = LogAccumulator(slow_top_n=slow_top_n, keep_times=keep_times, relative_error=relative_error)
+        n = len(self)
+        if n == 0:
+            return acc
+        acc.count = n
+
+        valid, hours = self._hours()
+        if len(hours):
+            uniques, order, inverse, counts = _in_first_seen_order(hours)
+            totals = np.bincount(inverse, weights=self.resp_time[valid])
+            acc.hour_count = {int(uniques[i]): int(counts[i]) for i in order}
+            acc.hour_total = {int(uniques[i]): int(totals[i]) for i in order}
+
+        url_codes, order, _, counts = _in_first_seen_order(self.url)
+        _, totals = self._endpoint_arrays()
+        if keep_times:
+            # URL별 응답시간을 원래 행 순서대로 나눔
+            rows = np.argsort(self.url, kind='stable')
+            groups = np.split(self.resp_time[rows], np.cumsum(counts)[:-1])
+            times = {int(code): group.tolist() for code, group in zip(url_codes, groups)}
+        else:
+            sketches = group_sketches(self.url, self.resp_time, len(self.urls), relative_error)
+            times = {int(code): sketches[code] for code in url_codes}
+        for i in order:
+            code = int(url_codes[i])
+            acc.endpoints[self.urls[code]] = [int(counts[i]), int(totals[code]), times[code]]
+
+        stats = self.status_code_stats()
+        acc.code_counter = Counter(stats['code_counter'])
+        errors = self._error_mask()
+        error_hours = hours[errors[valid]]
+        if len(error_hours):
+            uniques, order, _, counts = _in_first_seen_order(error_hours)
+            acc.error_by_time = {int(uniques[i]): int(counts[i]) for i in order}
+        acc.error_by_url = stats['error_by_url']
+
+        ip_codes, order, _, counts = _in_first_seen_order(self.ip)
+        acc.ip_counter = Counter({self.ips[int(ip_codes[i])]: int(counts[i]) for i in order})
+
+        top = self._top_indices(slow_top_n, 'resp_time')
+        for row, log in zip(top.tolist(), self.records(top)):
+            acc.slow.push(log['resp_time'], row, log)
+        acc.slow.count = n
+        return acc
+
+    def suggest_improvements(self):
+        # 느린 엔드포인트, 에러 많은 엔드포인트에 대한 개선 제안
+        return improvements_from_stats(self.slowest_endpoints(top_n=3), self.status_code_stats())
@@ -0,0 +1,90 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .table import NO_TIMESTAMP, LogTable
+
+# 시간 인덱스 블록 크기 (바이트) - 청크를 이 크기의 줄바꿈 경계 블록으로 나눠 블록마다 시간 범위를 기록
+TIME_INDEX_BLOCK_SIZE = 1024 * 1024
+
+# 타임스탬프가 없는 블록의 (처음 분, 마지막 분) - 어떤 시간 구간과도 겹치지 않음
+_EMPTY_FIRST = np.iinfo(np.int64).max
+_EMPTY_LAST = np.iinfo(np.int64).min
+
+def time_blocks(table: LogTable, marks: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """
+    블록별 (시작 바이트 오프셋, 처음 분, 마지막 분) 배열을 만듭니다.
+
+    Args:
+        table: 블록들을 순서대로 파싱한 테이블
+        marks: 블록별 (시작 바이트 오프셋, 테이블에서의 첫 행 번호)
+
+    분은 현지 시각(ts + tz) 기준 epoch 분이며, 블록 안 행의 최솟값/최댓값이므로
+    시간순이 아닌 로그도 그대로 다룰 수 있습니다.
+    """
+    blocks = np.empty((len(marks), 3), dtype=np.int64)
+    if not len(marks):
+        return blocks
+    blocks[:, 0] = [offset for offset, _ in marks]
+    blocks[:, 1] = _EMPTY_FIRST
+    blocks[:, 2] = _EMPTY_LAST
+    valid = table.ts != NO_TIMESTAMP
+    if valid.any():
+        minutes = (table.ts + table.tz) // 60
+        starts = np.array([row for _, row in marks], dtype=np.int64)
+        ends = np.append(starts[1:], len(table))
+        nonempty = ends > starts
+        # 타임스탬프 없는 행은 최솟값/최댓값 계산에서 빠지도록 극값으로 바꿈
+        lows = np.where(valid, minutes, _EMPTY_FIRST)
+        highs = np.where(valid, minutes, _EMPTY_LAST)
+        blocks[nonempty, 1] = np.minimum.reduceat(lows, starts[nonempty])
+        blocks[nonempty, 2] = np.maximum.reduceat(highs, starts[nonempty])
+    return blocks
+
+class TimeIndex:
+    """
+    파일의 분 단위 시간 -> 바이트 오프셋 희소 인덱스
+
+    파일을 약 TIME_INDEX_BLOCK_SIZE 크기의 줄바꿈 경계 블록으로 나누고, 블록마다 시작
+    오프셋과 그 안 로그의 처음/마지막 분을 기록합니다. 시간 구간 질의는 구간과 겹치는
+    블록의 바이트 범위만 돌려주므로, 큰 파일에서도 그 범위만 파싱하면 됩니다.
+    checkpoint는 인덱스가 다루는 끝 오프셋과 파일 검증 정보입니다 (cache.make_checkpoint).
+    """
+
+    def __init__(self, blocks: np.ndarray, checkpoint: Dict):
+        self.blocks = blocks
+        self.checkpoint = checkpoint
+
+    @property
+    def end(self) -> int:
+        # 인덱스가 다루는 마지막 바이트 오프셋 (완성된 라인까지)
+        return self.checkpoint['offset']
+
+    def extend(self, blocks: np.ndarray, checkpoint: Dict) -> 'TimeIndex':
+        """파일 끝에 덧붙은 구간의 블록을 이어 붙인 인덱스를 반환합니다."""
+        return TimeIndex(np.concatenate([self.blocks, blocks]), checkpoint)
+
+    def ranges(self, ts_from: Optional[int] = None, ts_to: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        현지 시각 [ts_from, ts_to) 구간의 로그가 있을 수 있는 바이트 범위 목록 (이웃 블록은 합침)
+
+        Args:
+            ts_from: 시작 (현지 시각 epoch 초, None이면 처음부터)
+            ts_to: 끝 (현지 시각 epoch 초, None이면 끝까지)
+        """
+        if not len(self.blocks):
+            return []
+        starts = self.blocks[:, 0]
+        ends = np.append(starts[1:], self.end)
+        hit = np.ones(len(self.blocks), dtype=bool)
+        if ts_from is not None:
+            hit &= self.blocks[:, 2] >= ts_from // 60
+        if ts_to is not None:
+            hit &= self.blocks[:, 1] <= (ts_to - 1) // 60
+        ranges = []
+        for start, end in zip(starts[hit].tolist(), ends[hit].tolist()):
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return ranges
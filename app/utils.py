@@ -1,53 +1,101 @@
+import bz2
+import calendar
+import gzip
+import heapq
+import io
+import lzma
+import mmap
+import operator
+import os
 import re
+import time
 from collections import Counter, defaultdict
-from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain, islice
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Dict, List, TextIO, Tuple
 
-# 지원하는 로그 형식 패턴들
+from .sketch import DEFAULT_RELATIVE_ERROR, PERCENTILES, QuantileSketch, exact_quantiles
+
+# 지원하는 로그 형식 패턴들 (이름 있는 그룹 사용)
 LOG_PATTERNS = {
     'standard': {
-        'pattern': r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) (GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD|SYSTEM) (\d+\.\d+\.\d+\.\d+) (\S+) (\d{3}) (\d+)$',
+        'pattern': r'^(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) (?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD|SYSTEM) (?P<ip>\d+\.\d+\.\d+\.\d+) (?P<url>\S+) (?P<status>\d{3}) (?P<resp_time>\d+)$',
         'example': '2025-06-03 08:12:34 GET 192.168.0.12 /api/login 200 123',
         'groups': ['timestamp', 'method', 'ip', 'url', 'status', 'resp_time']
     },
     'iso_format': {
-        'pattern': r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?) (GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (\S+) (\d{3}) (\d+)$',
+        'pattern': r'^(?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?) (?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (?P<url>\S+) (?P<status>\d{3}) (?P<resp_time>\d+)$',
         'example': '2025-06-03T08:12:34.123Z GET /api/login 200 123',
         'groups': ['timestamp', 'method', 'url', 'status', 'resp_time']
     },
     'bracket_format': {
-        'pattern': r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (\S+) (\d{3}) (\d+)(?:ms)?$',
+        'pattern': r'^\[(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (?P<url>\S+) (?P<status>\d{3}) (?P<resp_time>\d+)(?:ms)?$',
         'example': '[2025-06-03 08:12:34] GET /api/login 200 123ms',
         'groups': ['timestamp', 'method', 'url', 'status', 'resp_time']
     },
     'apache_format': {
-        'pattern': r'^(\d+\.\d+\.\d+\.\d+) - - \[(\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2} [+-]\d{4})\] "(GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (\S+) [^"]*" (\d{3}) (\d+)$',
+        'pattern': r'^(?P<ip>\d+\.\d+\.\d+\.\d+) - - \[(?P<timestamp>\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2} [+-]\d{4})\] "(?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (?P<url>\S+) [^"]*" (?P<status>\d{3}) (?P<resp_time>\d+)$',
         'example': '192.168.1.100 - - [08/Jun/2025:09:00:01 +0900] "GET / HTTP/1.1" 200 1234',
         'groups': ['ip', 'timestamp', 'method', 'url', 'status', 'resp_time']
     },
     'nginx_format': {
-        'pattern': r'^(\d+\.\d+\.\d+\.\d+) - - \[(\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2} [+-]\d{4})\] "(GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (\S+) [^"]*" (\d{3}) (\d+)',
+        'pattern': r'^(?P<ip>\d+\.\d+\.\d+\.\d+) - - \[(?P<timestamp>\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2} [+-]\d{4})\] "(?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (?P<url>\S+) [^"]*" (?P<status>\d{3}) (?P<resp_time>\d+)',
         'example': '192.168.0.12 - - [03/Jun/2025:08:12:34 +0000] "GET /api/login HTTP/1.1" 200 123',
         'groups': ['ip', 'timestamp', 'method', 'url', 'status', 'resp_time']
     },
     'simple_format': {
-        'pattern': r'^(\d{2}:\d{2}:\d{2}) (GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (\S+) (\d{3}) (\d+)$',
+        'pattern': r'^(?P<time>\d{2}:\d{2}:\d{2}) (?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (?P<url>\S+) (?P<status>\d{3}) (?P<resp_time>\d+)$',
         'example': '08:12:34 GET /api/login 200 123',
         'groups': ['time', 'method', 'url', 'status', 'resp_time']
     },
     'app_log_format': {
-        'pattern': r'^\[(INFO|DEBUG|WARN|ERROR)\] (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\.\d+ - (?:Client )?(\d+\.\d+\.\d+\.\d+) requested (GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (\S+) with status (\d{3}) \(response time: (\d+)ms\)',
+        'pattern': r'^\[(?P<level>INFO|DEBUG|WARN|ERROR)\] (?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\.\d+ - (?:Client )?(?P<ip>\d+\.\d+\.\d+\.\d+) requested (?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (?P<url>\S+) with status (?P<status>\d{3}) \(response time: (?P<resp_time>\d+)ms\)',
         'example': '[INFO] 2025-06-10 09:00:15.123 - Client 10.0.1.45 requested GET /api/v1/dashboard with status 200 (response time: 89ms)',
         'groups': ['level', 'timestamp', 'ip', 'method', 'url', 'status', 'resp_time']
     },
     'system_log_format': {
-        'pattern': r'^\[(INFO|DEBUG|WARN|ERROR)\] (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\.\d+ - (.+)$',
+        'pattern': r'^\[(?P<level>INFO|DEBUG|WARN|ERROR)\] (?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\.\d+ - (?P<message>.+)$',
         'example': '[ERROR] 2025-06-10 09:05:12.890 - Database connection failed: timeout after 30 seconds',
-        'groups': ['level', 'timestamp', 'message']
+        'groups': ['level', 'timestamp', 'message'],
+        # 이 형식에도 매치되는 더 구체적인 형식들 (혼합 파싱 시 항상 먼저 시도)
+        'more_specific': ['app_log_format']
     },
 
 }
 
+# 형식별 컴파일된 정규식 (모듈 로드 시 한 번만 컴파일)
+_COMPILED_PATTERNS = {name: re.compile(info['pattern']) for name, info in LOG_PATTERNS.items()}
+
+# 형식별 라인 파서 함수 캐시 (get_line_parser에서 채움)
+_LINE_PARSERS: Dict[str, Callable[[str], Optional[Dict]]] = {}
+
+# 형식별 bytes 정규식 캐시 (iter_mmap_records에서 채움)
+_BYTES_PATTERNS: Dict[str, 're.Pattern[bytes]'] = {}
+
+def register_log_format(name: str, pattern: str, example: str = '',
+                        more_specific: Optional[List[str]] = None) -> None:
+    """
+    새 로그 형식을 레지스트리에 등록합니다.
+
+    Args:
+        name: 로그 형식 이름
+        pattern: 이름 있는 그룹(?P<timestamp> 등)을 사용하는 정규식
+        example: 예시 로그 라인
+        more_specific: 이 패턴에도 매치되어 먼저 시도해야 하는 형식 이름들
+    """
+    compiled = re.compile(pattern)
+    LOG_PATTERNS[name] = {
+        'pattern': pattern,
+        'example': example,
+        'groups': sorted(compiled.groupindex, key=compiled.groupindex.get)
+    }
+    if more_specific:
+        LOG_PATTERNS[name]['more_specific'] = list(more_specific)
+    _COMPILED_PATTERNS[name] = compiled
+    _LINE_PARSERS.pop(name, None)
+    _BYTES_PATTERNS.pop(name, None)
+
 def detect_log_format(sample_lines: List[str]) -> Optional[str]:
     """
     로그 파일의 형식을 자동으로 감지합니다.
@@ -63,14 +111,14 @@ def detect_log_format(sample_lines: List[str]) -> Optional[str]:
     
     # 각 형식별로 매치되는 라인 수 계산
     format_scores = {}
+    stripped_lines = [line.strip() for line in sample_lines]
     
-    for format_name, format_info in LOG_PATTERNS.items():
-        pattern = re.compile(format_info['pattern'])
+    for format_name, pattern in _COMPILED_PATTERNS.items():
+        match = pattern.match
         match_count = 0
         
-        for line in sample_lines:
-            line = line.strip()
-            if line and pattern.match(line):
+        for line in stripped_lines:
+            if line and match(line):
                 match_count += 1
         
         # 매치율 계산 (매치된 라인 수 / 전체 라인 수)
@@ -89,6 +137,118 @@ def detect_log_format(sample_lines: List[str]) -> Optional[str]:
     
     return best_format
 
+# Apache/Nginx 월 약어 -> 월 번호
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+@lru_cache(maxsize=4096)
+def _day_epoch(date_part: str) -> Optional[int]:
+    # 'YYYY-MM-DD' -> 해당 날짜 00:00:00 UTC의 epoch 초 (날짜별로 한 번만 계산)
+    try:
+        return calendar.timegm((int(date_part[0:4]), int(date_part[5:7]), int(date_part[8:10]), 0, 0, 0))
+    except ValueError:
+        return None
+
+def timestamp_to_epoch(timestamp: str) -> Optional[int]:
+    """
+    'YYYY-MM-DD HH:MM:SS' 또는 'YYYY-MM-DD HH:MM' 형식의 타임스탬프를 epoch 초로 변환합니다.
+    
+    날짜 부분은 캐시된 값을 쓰므로 라인마다 시/분/초만 계산합니다.
+    시간대 정보가 없는 타임스탬프는 UTC로 간주합니다.
+    
+    Returns:
+        epoch 초 또는 None (해석할 수 없는 경우)
+    """
+    if len(timestamp) not in (16, 19):
+        return None
+    day = _day_epoch(timestamp[:10])
+    if day is None:
+        return None
+    try:
+        seconds = int(timestamp[11:13]) * 3600 + int(timestamp[14:16]) * 60
+        if len(timestamp) == 19:
+            seconds += int(timestamp[17:19])
+    except ValueError:
+        return None
+    return day + seconds
+
+def epoch_to_timestamp(epoch: int) -> str:
+    # epoch 초 -> 'YYYY-MM-DD HH:MM:SS'
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(epoch))
+
+@lru_cache(maxsize=8192)
+def hour_label(hour_index: int) -> str:
+    # epoch 기준 시간 번호(epoch // 3600) -> 'YYYY-MM-DD HH:00'
+    return time.strftime('%Y-%m-%d %H:00', time.gmtime(hour_index * 3600))
+
+def _clock_seconds(clock: str) -> int:
+    # 'HH:MM:SS' -> 자정부터의 초
+    return int(clock[0:2]) * 3600 + int(clock[3:5]) * 60 + int(clock[6:8])
+
+@lru_cache(maxsize=4096)
+def _apache_day(date_part: str) -> Tuple[str, Optional[int]]:
+    # '03/Jun/2025' -> ('2025-06-03', 해당 날짜 epoch)
+    day, month, year = date_part.split('/')
+    date_iso = f"{year}-{_MONTHS.get(month, 1):02d}-{day.zfill(2)}"
+    return date_iso, _day_epoch(date_iso)
+
+@lru_cache(maxsize=256)
+def _tz_offset(zone: str) -> int:
+    # '+0900' -> 32400 (UTC 기준 오프셋 초)
+    seconds = int(zone[1:3]) * 3600 + int(zone[3:5]) * 60
+    return -seconds if zone[0] == '-' else seconds
+
+# 오늘 날짜 캐시 (simple_format용, 자정이 지나면 다시 계산)
+_today_cache = {'until': 0.0, 'value': ('', 0)}
+
+def _today() -> Tuple[str, int]:
+    # 로컬 기준 오늘 날짜 ('YYYY-MM-DD', epoch)
+    if time.time() >= _today_cache['until']:
+        today = datetime.now().date()
+        tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today_cache['value'] = (today.isoformat(), _day_epoch(today.isoformat()))
+        _today_cache['until'] = tomorrow.timestamp()
+    return _today_cache['value']
+
+def _decode_plain_timestamp(timestamp: str) -> Tuple[str, Optional[int], int]:
+    # 표준/대괄호 형식: 이미 YYYY-MM-DD HH:MM:SS
+    return timestamp, timestamp_to_epoch(timestamp), 0
+
+def _decode_iso_timestamp(timestamp: str) -> Tuple[str, Optional[int], int]:
+    # ISO 형식: 2025-06-03T08:12:34.123Z -> 2025-06-03 08:12:34 (Z 또는 시간대 없음 = UTC)
+    if 'T' in timestamp:
+        timestamp = timestamp[:10] + ' ' + timestamp[11:19]
+    return timestamp, timestamp_to_epoch(timestamp), 0
+
+def _decode_apache_timestamp(timestamp: str) -> Tuple[str, Optional[int], int]:
+    # Apache/Nginx 형식: 03/Jun/2025:08:12:34 +0900 -> 2025-06-03 08:12:34, UTC epoch, +9시간
+    date_iso, day = _apache_day(timestamp[:11])
+    clock = timestamp[12:20]
+    offset = _tz_offset(timestamp[21:26])
+    epoch = None if day is None else day + _clock_seconds(clock) - offset
+    return f"{date_iso} {clock}", epoch, offset
+
+def _decode_simple_timestamp(timestamp: str) -> Tuple[str, Optional[int], int]:
+    # 간단 형식: 08:12:34 -> 오늘 날짜 + 시간
+    date_iso, day = _today()
+    return f"{date_iso} {timestamp}", day + _clock_seconds(timestamp), 0
+
+def _decode_log_timestamp(timestamp: str) -> Tuple[str, Optional[int], int]:
+    # 애플리케이션/시스템 로그 형식: 밀리초 제거
+    return _decode_plain_timestamp(timestamp.split('.')[0])
+
+# 형식별 타임스탬프 디코더: 원본 -> (표준 문자열, UTC epoch 초, 시간대 오프셋 초)
+_TIMESTAMP_DECODERS: Dict[str, Callable[[str], Tuple[str, Optional[int], int]]] = {
+    'iso_format': _decode_iso_timestamp,
+    'apache_format': _decode_apache_timestamp,
+    'nginx_format': _decode_apache_timestamp,
+    'simple_format': _decode_simple_timestamp,
+    'app_log_format': _decode_log_timestamp,
+    'system_log_format': _decode_log_timestamp,
+}
+
 def normalize_timestamp(timestamp: str, format_type: str) -> str:
     """
     다양한 형식의 타임스탬프를 표준 형식으로 변환합니다.
@@ -101,56 +261,241 @@ def normalize_timestamp(timestamp: str, format_type: str) -> str:
         표준 형식의 타임스탬프 (YYYY-MM-DD HH:MM:SS)
     """
     try:
-        if format_type == 'iso_format':
-            # ISO 형식: 2025-06-03T08:12:34.123Z -> 2025-06-03 08:12:34
-            if 'T' in timestamp:
-                timestamp = timestamp.split('T')[0] + ' ' + timestamp.split('T')[1][:8]
-            return timestamp
+        return _TIMESTAMP_DECODERS.get(format_type, _decode_plain_timestamp)(timestamp)[0]
+    except Exception:
+        return timestamp
+
+def record_epoch(log: Dict) -> Optional[int]:
+    """
+    레코드의 현지 시각 기준 epoch 초를 반환합니다 (시간/분 버킷 계산용).
+    
+    파싱 시 계산해 둔 ts(UTC)와 tz(오프셋)를 사용하고,
+    직접 만든 레코드처럼 ts가 없으면 timestamp 문자열을 해석합니다.
+    """
+    ts = log.get('ts')
+    if ts is not None:
+        return ts + log.get('tz', 0)
+    timestamp = log.get('timestamp')
+    return timestamp_to_epoch(timestamp) if isinstance(timestamp, str) else None
+
+# 시스템 로그 메시지 키워드 -> 가상 API 엔드포인트 (앞에 있을수록 우선)
+SYSTEM_ENDPOINT_KEYWORDS: List[Tuple[str, Tuple[str, ...]]] = [
+    ('/api/system/database', ('database',)),
+    ('/api/system/memory', ('memory',)),
+    ('/api/system/network', ('network',)),
+    ('/api/system/file', ('file',)),
+    ('/api/system/ssl', ('ssl', 'certificate')),
+    ('/api/system/auth', ('authentication', 'auth')),
+    ('/api/system/session', ('session',)),
+    ('/api/system/backup', ('backup',)),
+    ('/api/system/cache', ('cache',)),
+    ('/api/system/email', ('email', 'smtp')),
+    ('/api/system/ratelimit', ('rate limit',)),
+    ('/api/system/service', ('service',)),
+    ('/api/system/config', ('configuration', 'config')),
+    ('/api/system/process', ('process',)),
+    ('/api/system/index', ('index',)),
+    ('/api/system/external', ('external',)),
+]
+
+# 어떤 키워드에도 해당하지 않는 메시지의 엔드포인트
+SYSTEM_ENDPOINT_DEFAULT = '/api/system/other'
+
+# 분류 결과를 기억해 두는 메시지 형태 수 (넘으면 비우고 다시 채움)
+CLASSIFIER_CACHE_SIZE = 4096
+
+# 메시지 형태 키: UTF-8 바이트에서 ASCII 대문자를 소문자로, 숫자를 모두 0으로 바꿈
+# (요청 번호, 시간, IP만 다른 메시지는 같은 키, bytes.translate는 str.translate보다 훨씬 빠름)
+_SHAPE_TABLE = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ123456789', b'abcdefghijklmnopqrstuvwxyz000000000')
+_CASE_TABLE = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz')
+
+def _keyword_trie_pattern(keywords: Iterable[str]) -> str:
+    # 키워드 목록을 공통 접두사로 묶은 정규식 (위치마다 첫 글자로 갈래를 바로 거름)
+    trie: Dict[str, Dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def emit(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(trie)
+
+class KeywordClassifier:
+    """
+    메시지를 키워드 표에 따라 분류하는 분류기
+    
+    모든 키워드를 공통 접두사로 묶은 정규식 하나로 컴파일해 메시지를 한 번 훑어 가장 왼쪽 키워드를 찾고,
+    그보다 표에서 앞선 키워드만 더 확인하므로 앞에 있는 항목이 이기는 기존 if/elif 체인과 결과가 같습니다.
+    시스템 로그 메시지는 숫자만 다른 형태가 반복되므로 형태(대소문자, 숫자를 정규화한 바이트)별로 결과를 기억해
+    같은 형태는 훑지 않습니다.
+    """
+    
+    def __init__(self, table: Iterable[Tuple[str, Iterable[str]]], default: str):
+        self.default = default
+        table = [(label, [keyword.lower() for keyword in keywords]) for label, keywords in table]
+        # (키워드, 분류 값)을 우선순위 순서로 펼친 목록
+        self.keywords: List[Tuple[str, str]] = [(keyword, label) for label, keywords in table for keyword in keywords]
+        self._labels = [label for label, _ in table] + [default]
+        ranks: Dict[str, int] = {}
+        for rank, (_, keywords) in enumerate(table):
+            for keyword in keywords:
+                ranks.setdefault(keyword, rank)
+        # 찾은 키워드 -> 그 안에 든 키워드까지 포함한 가장 앞선 순위
+        self._ranks = {keyword: min(rank for other, rank in ranks.items() if other in keyword) for keyword in ranks}
+        # 키워드를 하나도 찾지 못한 메시지의 순위 (빈 키워드는 모든 메시지에 맞음)
+        self._miss_rank = ranks.get('', len(table))
+        words = [keyword for keyword in ranks if keyword]
+        self._pattern = re.compile(_keyword_trie_pattern(words)) if words else None
+        # (키워드, 순위)를 순위 순서로 (찾은 키워드보다 앞선 키워드만 더 확인할 때 사용)
+        self._ordered = sorted(ranks.items(), key=lambda item: item[1])
+        # 숫자가 든 키워드가 있으면 숫자를 바꾼 키가 결과를 바꿀 수 있으므로 대소문자만 정규화
+        self._shape = _CASE_TABLE if any(ch.isdigit() for keyword in words for ch in keyword) else _SHAPE_TABLE
+        self._cache: Dict[bytes, str] = {}
+    
+    def classify(self, message: str) -> str:
+        """메시지에 맞는 분류 값을 반환합니다 (어떤 키워드에도 맞지 않으면 기본값)."""
+        key = message.encode('utf-8', 'surrogatepass').translate(self._shape)
+        label = self._cache.get(key)
+        if label is None:
+            label = self._labels[self._match(message.lower())]
+            if len(self._cache) >= CLASSIFIER_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = label
+        return label
+    
+    def _match(self, lowered: str) -> int:
+        # 메시지에서 찾은 키워드 중 가장 앞선 순위 (없으면 기본값 순위)
+        # 정규식으로 가장 왼쪽 키워드를 찾고, 그보다 앞선 순위의 키워드만 메시지에 있는지 더 확인
+        found = self._pattern.search(lowered) if self._pattern is not None else None
+        if found is None:
+            return self._miss_rank
+        rank = self._ranks[found.group()]
+        for keyword, keyword_rank in self._ordered:
+            if keyword_rank >= rank:
+                break
+            if keyword in lowered:
+                return keyword_rank
+        return rank
+
+_system_classifier = KeywordClassifier(SYSTEM_ENDPOINT_KEYWORDS, SYSTEM_ENDPOINT_DEFAULT)
+
+def configure_system_endpoints(table: Iterable[Tuple[str, Iterable[str]]],
+                               default: str = SYSTEM_ENDPOINT_DEFAULT) -> None:
+    """
+    시스템 로그 메시지 분류에 쓰는 키워드 표를 교체합니다.
+    
+    Args:
+        table: (엔드포인트, 키워드 목록) 쌍의 목록 (앞에 있을수록 우선)
+        default: 어떤 키워드에도 해당하지 않을 때의 엔드포인트
+    """
+    global _system_classifier
+    _system_classifier = KeywordClassifier(table, default)
+
+def classify_system_message(message: str) -> str:
+    """시스템 로그 메시지를 가상의 API 엔드포인트로 분류합니다."""
+    return _system_classifier.classify(message)
+
+def _system_log_record(level: str, timestamp: str, message: str) -> Dict:
+    """시스템 로그 메시지를 가상의 API 요청 레코드로 변환합니다."""
+    # 에러 레벨에 따라 가상 상태 코드 설정
+    if level == 'ERROR':
+        status = '500'
+    elif level == 'WARN':
+        status = '400'
+    else:
+        status = '200'
+    
+    return {
+        'timestamp': timestamp,
+        'method': 'SYSTEM',  # 가상의 HTTP 메소드
+        'ip': '127.0.0.1',  # 가상의 IP 주소 (시스템 로그이므로)
+        'url': classify_system_message(message),  # 가상의 API 엔드포인트
+        'status': status,
+        'resp_time': 50 if level == 'ERROR' else 30  # 에러는 보통 빠르게 처리됨
+    }
+
+def _build_record_builder(format_type: str) -> Callable[[Dict[str, str]], Dict]:
+    """
+    정규식 그룹 값(문자열 딕셔너리)을 로그 레코드로 바꾸는 형식 전용 함수를 생성합니다.
+    
+    형식별로 필요한 후처리(타임스탬프 정규화, 시스템 로그 변환 등)를
+    미리 결정해 두므로 레코드마다 분기가 일어나지 않습니다.
+    """
+    group_names = _COMPILED_PATTERNS[format_type].groupindex
+    time_key = 'timestamp' if 'timestamp' in group_names else ('time' if 'time' in group_names else None)
+    is_system_log = 'message' in group_names
+    has_ip = 'ip' in group_names
+    has_resp_time = 'resp_time' in group_names
+    decode = _TIMESTAMP_DECODERS.get(format_type, _decode_plain_timestamp)
+    
+    def build(log_data: Dict[str, str]) -> Dict:
+        # 타임스탬프는 수집 시 한 번만 해석 (표시용 문자열 + UTC epoch + 시간대 오프셋)
+        if time_key is not None:
+            log_data['timestamp'], ts, tz = decode(log_data.pop(time_key))
         
-        elif format_type == 'apache_format' or format_type == 'nginx_format':
-            # Apache/Nginx 형식: 03/Jun/2025:08:12:34 +0000 -> 2025-06-03 08:12:34
-            month_map = {
-                'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-                'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-                'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-            }
-            
-            # 03/Jun/2025:08:12:34 +0000 형식 파싱
-            parts = timestamp.split(':')
-            if len(parts) >= 3:
-                date_part = parts[0]  # 03/Jun/2025
-                time_part = f"{parts[1]}:{parts[2]}"  # 08:12:34
-                
-                if '/' in date_part:
-                    day, month, year = date_part.split('/')
-                    month_num = month_map.get(month, '01')
-                    return f"{year}-{month_num}-{day.zfill(2)} {time_part}"
-            
-            return timestamp
+        # 시스템 로그는 가상의 API 요청으로 변환
+        if is_system_log:
+            log_data = _system_log_record(log_data.get('level', 'INFO'), log_data['timestamp'], log_data['message'])
+            log_data['ts'], log_data['tz'] = ts, tz
+            return log_data
         
-        elif format_type == 'simple_format':
-            # 간단 형식: 08:12:34 -> 오늘 날짜 + 시간
-            today = datetime.now().strftime('%Y-%m-%d')
-            return f"{today} {timestamp}"
+        if time_key is not None:
+            log_data['ts'] = ts
+            log_data['tz'] = tz
         
-        elif format_type == 'app_log_format':
-            # 애플리케이션 로그 형식: 밀리초 제거
-            if '.' in timestamp:
-                timestamp = timestamp.split('.')[0]
-            return timestamp
+        # 응답 시간을 정수로 변환
+        if has_resp_time:
+            try:
+                log_data['resp_time'] = int(log_data['resp_time'])
+            except ValueError:
+                log_data['resp_time'] = 0
         
-        elif format_type == 'system_log_format':
-            # 시스템 로그 형식: 밀리초 제거
-            if '.' in timestamp:
-                timestamp = timestamp.split('.')[0]
-            return timestamp
+        # IP 주소가 없는 경우 기본값 설정
+        if not has_ip:
+            log_data['ip'] = '0.0.0.0'
         
-        else:
-            # 표준 형식은 그대로 반환
-            return timestamp
-            
-    except Exception:
-        return timestamp
+        return log_data
+    
+    return build
+
+def _build_line_parser(format_type: str) -> Callable[[str], Optional[Dict]]:
+    """형식 전용 라인 파서 함수를 생성합니다 (정규식 컴파일/형식 분기 없이 매치 + 후처리만 수행)."""
+    match = _COMPILED_PATTERNS[format_type].match
+    build = _build_record_builder(format_type)
+    
+    def parse(line: str) -> Optional[Dict]:
+        m = match(line.strip())
+        if not m:
+            return None
+        return build(m.groupdict())
+    
+    return parse
+
+def get_line_parser(format_type: Optional[str]) -> Callable[[str], Optional[Dict]]:
+    """
+    로그 형식에 맞는 라인 파서 함수를 반환합니다.
+    
+    Args:
+        format_type: 로그 형식 타입 (알 수 없거나 None이면 표준 형식)
+    
+    Returns:
+        로그 라인을 받아 파싱된 딕셔너리 또는 None을 반환하는 함수
+    """
+    if format_type not in LOG_PATTERNS:
+        # 알 수 없는 형식이면 표준 형식으로 시도
+        format_type = 'standard'
+    
+    parser = _LINE_PARSERS.get(format_type)
+    if parser is None:
+        parser = _LINE_PARSERS[format_type] = _build_line_parser(format_type)
+    return parser
 
 def parse_log_line(line: str, format_type: str = 'standard') -> Optional[Dict]:
     """
@@ -166,148 +511,324 @@ def parse_log_line(line: str, format_type: str = 'standard') -> Optional[Dict]:
     if not line.strip():
         return None
     
-    if format_type not in LOG_PATTERNS:
-        # 알 수 없는 형식이면 표준 형식으로 시도
-        format_type = 'standard'
-    
-    format_info = LOG_PATTERNS[format_type]
-    pattern = re.compile(format_info['pattern'])
-    match = pattern.match(line.strip())
+    return get_line_parser(format_type)(line)
+
+# 파일별 형식 매치 횟수 캐시 (같은 파일을 다시 파싱할 때 형식 순서 재사용)
+_FORMAT_HITS_CACHE: Dict[str, Counter] = {}
+
+class MixedFormatParser:
+    """
+    한 파일에 여러 형식이 섞여 있어도 라인 단위로 형식을 예측하여 파싱합니다.
     
-    if not match:
-        return None
+    마지막으로 매치된 형식을 먼저 시도하고, 실패하면 나머지 형식을
+    매치 횟수가 많은 순서로 시도합니다. 단일 형식 파일은 라인당
+    정규식 한 번으로 끝나므로 형식 전용 파서와 거의 같은 속도로 동작합니다.
+    """
     
-    groups = match.groups()
-    group_names = format_info['groups']
+    def __init__(self, initial_format: Optional[str] = None, hits: Optional[Counter] = None):
+        """
+        Args:
+            initial_format: 처음 시도할 형식 (보통 detect_log_format 결과)
+            hits: 형식별 매치 횟수 (이전 파싱 결과를 이어서 사용할 때)
+        """
+        self.hits = hits if hits is not None else Counter()
+        self._parsers = {name: get_line_parser(name) for name in LOG_PATTERNS}
+        # 형식별로 먼저 확인해야 하는 더 구체적인 형식 + 자기 자신
+        self._chains = {
+            name: [specific for specific in info.get('more_specific', []) if specific in LOG_PATTERNS] + [name]
+            for name, info in LOG_PATTERNS.items()
+        }
+        self._order: List[str] = []
+        self._reorder()
+        if initial_format in LOG_PATTERNS:
+            self.last_format = initial_format
+        else:
+            self.last_format = self._order[0] if self.hits else None
     
-    # 그룹 이름과 매치된 값들을 딕셔너리로 변환
-    log_data = {}
-    for i, group_name in enumerate(group_names):
-        if i < len(groups):
-            log_data[group_name] = groups[i]
+    def _switch_to(self, name: str) -> None:
+        """예측 형식을 바꾸고, 매치 횟수가 앞 순서를 넘어선 경우에만 순서를 다시 계산합니다."""
+        self.last_format = name
+        order = self._order
+        idx = order.index(name)
+        if idx > 0 and self.hits[name] > self.hits[order[idx - 1]]:
+            self._reorder()
     
-    # 타임스탬프 정규화
-    if 'timestamp' in log_data:
-        log_data['timestamp'] = normalize_timestamp(log_data['timestamp'], format_type)
-    elif 'time' in log_data:
-        log_data['timestamp'] = normalize_timestamp(log_data['time'], format_type)
-        del log_data['time']
+    def _reorder(self) -> None:
+        """매치 횟수 내림차순으로 시도 순서를 갱신합니다 (구체적인 형식이 항상 먼저)."""
+        order = sorted(LOG_PATTERNS, key=lambda name: -self.hits[name])
+        for name in order[:]:
+            specifics = self._chains[name][:-1]
+            if specifics:
+                order.remove(name)
+                order.insert(max(order.index(s) for s in specifics) + 1, name)
+        self._order = order
     
-    # 응답 시간을 정수로 변환
-    if 'resp_time' in log_data:
-        try:
-            log_data['resp_time'] = int(log_data['resp_time'])
-        except ValueError:
-            log_data['resp_time'] = 0
-    
-    # 시스템 로그 처리 (message가 있는 경우)
-    if 'message' in log_data:
-        # 시스템 로그는 가상의 API 요청으로 변환
-        level = log_data.get('level', 'INFO')
-        message = log_data['message']
+    def parse(self, line: str) -> Optional[Dict]:
+        """
+        로그 라인을 파싱합니다.
         
-        # 에러 레벨에 따라 가상 상태 코드 설정
-        if level == 'ERROR':
-            status = '500'
-        elif level == 'WARN':
-            status = '400'
+        Returns:
+            파싱된 로그 데이터 딕셔너리 또는 None (어떤 형식에도 맞지 않는 경우)
+        """
+        parsers = self._parsers
+        last = self.last_format
+        if last is not None:
+            # 예측한 형식 우선 시도
+            for name in self._chains[last]:
+                log_data = parsers[name](line)
+                if log_data is not None:
+                    self.hits[name] += 1
+                    if name != last:
+                        self._switch_to(name)
+                    return log_data
+            tried = self._chains[last]
         else:
-            status = '200'
+            tried = ()
         
-        # 가상의 API 엔드포인트 생성
-        if 'database' in message.lower():
-            url = '/api/system/database'
-        elif 'memory' in message.lower():
-            url = '/api/system/memory'
-        elif 'network' in message.lower():
-            url = '/api/system/network'
-        elif 'file' in message.lower():
-            url = '/api/system/file'
-        elif 'ssl' in message.lower() or 'certificate' in message.lower():
-            url = '/api/system/ssl'
-        elif 'authentication' in message.lower() or 'auth' in message.lower():
-            url = '/api/system/auth'
-        elif 'session' in message.lower():
-            url = '/api/system/session'
-        elif 'backup' in message.lower():
-            url = '/api/system/backup'
-        elif 'cache' in message.lower():
-            url = '/api/system/cache'
-        elif 'email' in message.lower() or 'smtp' in message.lower():
-            url = '/api/system/email'
-        elif 'rate limit' in message.lower():
-            url = '/api/system/ratelimit'
-        elif 'service' in message.lower():
-            url = '/api/system/service'
-        elif 'configuration' in message.lower() or 'config' in message.lower():
-            url = '/api/system/config'
-        elif 'process' in message.lower():
-            url = '/api/system/process'
-        elif 'index' in message.lower():
-            url = '/api/system/index'
-        elif 'external' in message.lower():
-            url = '/api/system/external'
+        # 매치 횟수가 많은 순서로 나머지 형식 시도
+        for name in self._order:
+            if name in tried:
+                continue
+            log_data = parsers[name](line)
+            if log_data is not None:
+                self.hits[name] += 1
+                self._switch_to(name)
+                return log_data
+        return None
+    
+    __call__ = parse
+
+# 압축 확장자 -> 스트림 열기 함수 (회전된 로그를 풀어 두지 않고 스트리밍으로 읽음)
+COMPRESSED_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+# 압축 해제 스트림을 읽는 버퍼 크기 (바이트)
+DECOMPRESS_BUFFER_SIZE = 1024 * 1024
+
+def is_compressed(file_path: str) -> bool:
+    """확장자로 압축된 로그 파일(.gz, .bz2, .xz)인지 확인합니다."""
+    return os.path.splitext(file_path)[1].lower() in COMPRESSED_OPENERS
+
+def open_log_binary(file_path: str) -> BinaryIO:
+    """로그 파일을 바이너리 스트림으로 엽니다 (압축 파일은 큰 블록 단위로 풀면서 읽음)."""
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(file_path)[1].lower())
+    if opener is None:
+        return open(file_path, 'rb')
+    return io.BufferedReader(opener(file_path, 'rb'), buffer_size=DECOMPRESS_BUFFER_SIZE)
+
+def open_log_text(file_path: str) -> TextIO:
+    """로그 파일을 UTF-8 텍스트 스트림으로 엽니다 (압축 여부와 관계없이 같은 방식으로 읽음)."""
+    return io.TextIOWrapper(open_log_binary(file_path), encoding='utf-8')
+
+def iter_decompressed_blocks(file_path: str, block_size: int) -> Iterator[bytes]:
+    """
+    로그 파일을 약 block_size 바이트씩, 줄바꿈 경계에 맞춘 bytes 블록으로 읽습니다.
+    
+    압축 파일도 스트림을 블록 단위로 풀므로 파일 전체를 메모리에 올리지 않습니다.
+    """
+    with open_log_binary(file_path) as f:
+        rest = b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = rest + block
+            cut = block.rfind(b'\n') + 1
+            if cut == 0:
+                rest = block  # 블록보다 긴 라인
+                continue
+            rest = block[cut:]
+            yield block[:cut]
+        if rest:
+            yield rest
+
+def get_file_parser(file_path: str, sample_lines: Optional[List[str]] = None) -> MixedFormatParser:
+    """
+    파일용 혼합 형식 파서를 반환합니다.
+    
+    같은 파일을 이전에 파싱한 적이 있으면 그때의 형식 매치 횟수로 순서를 이어받고,
+    처음이면 샘플 라인으로 감지한 형식을 먼저 시도합니다.
+    
+    Args:
+        file_path: 로그 파일 경로 (캐시 키)
+        sample_lines: 형식 감지용 샘플 라인들
+    """
+    hits = _FORMAT_HITS_CACHE.get(file_path)
+    if hits:
+        return MixedFormatParser(hits=hits)
+    initial_format = detect_log_format(sample_lines) if sample_lines else None
+    parser = MixedFormatParser(initial_format)
+    _FORMAT_HITS_CACHE[file_path] = parser.hits
+    return parser
+
+def iter_log_records(file_path: str, sample_size: int = 20) -> Iterator[Dict]:
+    """
+    로그 파일을 한 줄씩 읽어 파싱된 레코드를 차례로 반환하는 제너레이터
+    
+    파일 전체 텍스트나 레코드 리스트를 메모리에 올리지 않으므로
+    파일 크기와 관계없이 한 번에 한 줄만 유지합니다.
+    압축 파일(.gz, .bz2, .xz)은 풀면서 읽습니다.
+    파싱할 수 없는 라인은 건너뜁니다.
+    
+    Args:
+        file_path: 로그 파일 경로
+        sample_size: 형식 감지에 사용할 앞부분 라인 수
+    """
+    with open_log_text(file_path) as f:
+        head = list(islice(f, sample_size))
+        parse_line = get_file_parser(file_path, [line.strip() for line in head if line.strip()])
+        for line in chain(head, f):
+            log_data = parse_line(line)
+            if log_data is not None:
+                yield log_data
+
+def _bytes_pattern(format_type: str) -> 're.Pattern[bytes]':
+    """
+    버퍼 전체에 finditer로 적용할 bytes 정규식을 반환합니다 (형식별로 한 번만 컴파일).
+    
+    라인 단위 패턴을 MULTILINE 버퍼용으로 바꿉니다.
+    - 부정 문자 클래스([^...])가 줄바꿈을 넘지 않도록 \\n 제외
+    - 매치가 라인 끝 줄바꿈까지 소비하도록 해서 다음 매치 시작 위치로 건너뛴 라인을 감지
+    """
+    pattern = _BYTES_PATTERNS.get(format_type)
+    if pattern is None:
+        body = LOG_PATTERNS[format_type]['pattern']
+        body = body[1:] if body.startswith('^') else body
+        body = body.replace('[^', '[^\\n')
+        if body.endswith('$'):
+            # strip()과 같이 라인 끝 공백/CR 허용
+            body = body[:-1] + r'[ \t\r]*(?:\n|\Z)'
         else:
-            url = '/api/system/other'
-        
-        # 가상의 응답 시간 설정 (에러는 보통 빠르게 처리됨)
-        resp_time = 50 if level == 'ERROR' else 30
-        
-        # 가상의 IP 주소 (시스템 로그이므로)
-        ip = '127.0.0.1'
-        
-        # 가상의 HTTP 메소드
-        method = 'SYSTEM'
-        
-        # 새로운 로그 데이터로 교체
-        log_data = {
-            'timestamp': log_data['timestamp'],
-            'method': method,
-            'ip': ip,
-            'url': url,
-            'status': status,
-            'resp_time': resp_time
-        }
+            body += r'[^\n]*(?:\n|\Z)'
+        pattern = _BYTES_PATTERNS[format_type] = re.compile(('^' + body).encode('utf-8'), re.MULTILINE)
+    return pattern
+
+def _iter_buffer_records(buf, start: int, end: int, parser: MixedFormatParser) -> Iterator[Dict]:
+    """
+    bytes 버퍼(mmap 또는 bytes)의 [start, end) 구간을 bytes 정규식 finditer로 일괄 매치합니다.
+    
+    매치된 필드만 디코드하고, 주 형식에 맞지 않는 라인(혼합 형식 등)은
+    매치 사이의 구간만 디코드하여 혼합 형식 파서로 처리합니다.
+    """
+    fallback = parser.parse
+    primary = parser.last_format
+    if primary is None or LOG_PATTERNS[primary].get('more_specific'):
+        # 주 형식이 없거나 다른 형식까지 매치하는 포괄 형식이면 라인 단위로 처리
+        for line in buf[start:end].decode('utf-8').splitlines():
+            log_data = fallback(line)
+            if log_data is not None:
+                yield log_data
+        return
+    
+    build = _build_record_builder(primary)
+    names = list(_COMPILED_PATTERNS[primary].groupindex)
+    pos = start
+    matched = 0
+    try:
+        for m in _bytes_pattern(primary).finditer(buf, start, end):
+            m_start = m.start()
+            if m_start != pos:
+                # 주 형식에 맞지 않는 구간만 디코드하여 혼합 형식 파서로 처리
+                for line in buf[pos:m_start].decode('utf-8').splitlines():
+                    log_data = fallback(line)
+                    if log_data is not None:
+                        yield log_data
+            pos = m.end()
+            matched += 1
+            yield build({name: value.decode('utf-8') for name, value in zip(names, m.groups()) if value is not None})
+        if pos < end:
+            for line in buf[pos:end].decode('utf-8').splitlines():
+                log_data = fallback(line)
+                if log_data is not None:
+                    yield log_data
+    finally:
+        parser.hits[primary] += matched
+
+def iter_buffer_records(data: bytes, parser: MixedFormatParser) -> Iterator[Dict]:
+    """줄바꿈 경계에 맞춘 bytes 블록을 파싱하는 제너레이터 (압축 해제 블록 등)"""
+    return _iter_buffer_records(data, 0, len(data), parser)
+
+def iter_mmap_records(file_path: str, start: int = 0, end: Optional[int] = None,
+                      parser: Optional[MixedFormatParser] = None) -> Iterator[Dict]:
+    """
+    로그 파일을 mmap으로 열어 bytes 정규식 finditer로 일괄 매치하는 제너레이터
+    
+    파일을 파이썬 문자열로 복사하거나 라인마다 디코드/strip하지 않고,
+    매치된 필드만 디코드합니다. 결과는 iter_log_records와 같습니다.
+    압축 파일은 mmap할 수 없으므로 풀면서 블록 단위로 같은 방식으로 매치합니다
+    (이때 start, end는 지원하지 않음).
+    
+    Args:
+        file_path: 로그 파일 경로
+        start: 시작 바이트 오프셋 (라인 시작 위치)
+        end: 끝 바이트 오프셋 (줄바꿈 바로 뒤 또는 파일 끝, None이면 파일 끝)
+        parser: 사용할 혼합 형식 파서 (None이면 파일별 파서)
+    """
+    if parser is None:
+        with open_log_text(file_path) as f:
+            sample_lines = [line.strip() for line in islice(f, 20)]
+        parser = get_file_parser(file_path, [line for line in sample_lines if line])
+    
+    if is_compressed(file_path):
+        if start or end is not None:
+            raise ValueError('압축 파일은 바이트 범위를 지정해 읽을 수 없습니다')
+        for block in iter_decompressed_blocks(file_path, DECOMPRESS_BUFFER_SIZE):
+            yield from iter_buffer_records(block, parser)
+        return
     
-    # IP 주소가 없는 경우 기본값 설정
-    if 'ip' not in log_data:
-        log_data['ip'] = '0.0.0.0'
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # 빈 파일은 mmap할 수 없음
     
-    return log_data
+    with mm:
+        yield from _iter_buffer_records(mm, start, len(mm) if end is None else end, parser)
 
-def parse_log_file(file_path: str) -> List[Dict]:
-    """로그 파일을 파싱하여 로그 데이터 리스트를 반환합니다."""
+def parse_log_file(file_path: str, workers: Optional[int] = 1, chunk_size: Optional[int] = None) -> List[Dict]:
+    """
+    로그 파일을 파싱하여 로그 데이터 리스트를 반환합니다.
+    
+    workers가 1이 아니면(None이면 CPU 코어 수) 파일을 바이트 범위로 나눠 병렬 파싱한
+    컬럼 청크를 합친 뒤 레코드로 복원합니다.
+    """
     logs = []
     
     try:
+        if workers != 1:
+            from .parallel import DEFAULT_CHUNK_SIZE, parse_file_parallel  # 순환 import 방지
+            return parse_file_parallel(file_path, workers, chunk_size or DEFAULT_CHUNK_SIZE).records()
+        
         # 파일에서 샘플 라인들을 읽어서 형식 감지
         sample_lines = []
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open_log_text(file_path) as f:
             for i, line in enumerate(f):
                 if i >= 20:  # 처음 20줄만 샘플로 사용
                     break
                 sample_lines.append(line.strip())
         
-        # 로그 형식 감지
-        format_type = detect_log_format(sample_lines)
-        if not format_type:
-            print(f"Warning: Could not detect log format for {file_path}")
-            return []
+        # 혼합 형식 파서 (감지된 형식을 먼저 시도하고, 맞지 않는 라인은 다른 형식으로 파싱)
+        parse_line = get_file_parser(file_path, sample_lines)
         
-        # 전체 파일 파싱
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # 전체 파일 파싱 (압축 파일은 풀면서 읽음)
+        with open_log_text(file_path) as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
                 
                 # 로그 라인 파싱
-                log_data = parse_log_line(line, format_type)
+                log_data = parse_line(line)
                 if log_data:
                     logs.append(log_data)
                 else:
                     print(f"Warning: Line {line_num} could not be parsed: {line[:50]}...")
         
+        if not logs:
+            print(f"Warning: Could not detect log format for {file_path}")
         return logs
     
     except Exception as e:
@@ -346,62 +867,9 @@ def convert_log_format(raw_line: str) -> Optional[str]:
     system_match = re.match(system_log_pattern, line)
     if system_match:
         level, timestamp, message = system_match.groups()
-        # 시스템 로그는 가상의 API 요청으로 변환 (에러 분석을 위해)
-        timestamp_clean = timestamp
-        # 에러 레벨에 따라 가상 상태 코드 설정
-        if level == 'ERROR':
-            status = '500'  # 서버 에러
-        elif level == 'WARN':
-            status = '400'  # 클라이언트 에러
-        else:
-            status = '200'  # 정상
-        
-        # 가상의 API 엔드포인트 생성
-        if 'database' in message.lower():
-            url = '/api/system/database'
-        elif 'memory' in message.lower():
-            url = '/api/system/memory'
-        elif 'network' in message.lower():
-            url = '/api/system/network'
-        elif 'file' in message.lower():
-            url = '/api/system/file'
-        elif 'ssl' in message.lower() or 'certificate' in message.lower():
-            url = '/api/system/ssl'
-        elif 'authentication' in message.lower() or 'auth' in message.lower():
-            url = '/api/system/auth'
-        elif 'session' in message.lower():
-            url = '/api/system/session'
-        elif 'backup' in message.lower():
-            url = '/api/system/backup'
-        elif 'cache' in message.lower():
-            url = '/api/system/cache'
-        elif 'email' in message.lower() or 'smtp' in message.lower():
-            url = '/api/system/email'
-        elif 'rate limit' in message.lower():
-            url = '/api/system/ratelimit'
-        elif 'service' in message.lower():
-            url = '/api/system/service'
-        elif 'configuration' in message.lower() or 'config' in message.lower():
-            url = '/api/system/config'
-        elif 'process' in message.lower():
-            url = '/api/system/process'
-        elif 'index' in message.lower():
-            url = '/api/system/index'
-        elif 'external' in message.lower():
-            url = '/api/system/external'
-        else:
-            url = '/api/system/other'
-        
-        # 가상의 응답 시간 설정 (에러는 보통 빠르게 처리됨)
-        resp_time = '50' if level == 'ERROR' else '30'
-        
-        # 가상의 IP 주소 (시스템 로그이므로)
-        ip = '127.0.0.1'
-        
-        # 가상의 HTTP 메소드
-        method = 'SYSTEM'
-        
-        return f"{timestamp_clean} {method} {ip} {url} {status} {resp_time}"
+        # 시스템 로그는 가상의 API 요청으로 변환 (에러 분석을 위해, 파싱 경로와 같은 분류기 사용)
+        record = _system_log_record(level, timestamp, message)
+        return f"{timestamp} {record['method']} {record['ip']} {record['url']} {record['status']} {record['resp_time']}"
     
     # 2. JSON 로그 형식 변환 (향후 확장용)
     # {"timestamp": "2025-06-10T09:15:23.456Z", "level": "INFO", "method": "GET", "url": "/api/users", "status": 200, "response_time": 145}
@@ -441,33 +909,19 @@ def search_pattern(logs, keyword):
             keyword_lower in log['ip'].lower()]
 
 def traffic_by_hour(logs):
-    # 시간대별 트래픽(요청 수) 집계
+    # 시간대별 트래픽(요청 수) 집계 (epoch 초를 정수 나눗셈으로 시간 번호로 변환)
     hour_counter = Counter()
     for log in logs:
-        try:
-            # 다양한 타임스탬프 형식 지원
-            timestamp = log['timestamp']
-            if len(timestamp) == 16:  # YYYY-MM-DD HH:MM 형식
-                dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M')
-            elif len(timestamp) == 19:  # YYYY-MM-DD HH:MM:SS 형식
-                dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-            else:
-                continue
-            
-            hour = dt.strftime('%Y-%m-%d %H:00')
-            hour_counter[hour] += 1
-        except Exception:
-            continue
+        epoch = record_epoch(log)
+        if epoch is not None:
+            hour_counter[epoch // 3600] += 1
     
-    # 데이터가 있는 시간대만 반환하거나, 전체 24시간 범위 생성
-    if hour_counter:
-        # 데이터가 있는 시간대만 반환 (더 깔끔한 그래프)
-        return sorted(hour_counter.items())
-    else:
-        return []
+    # 데이터가 있는 시간대만 시간순으로 반환 (더 깔끔한 그래프)
+    return [(hour_label(hour), count) for hour, count in sorted(hour_counter.items())]
 
-def endpoint_stats(logs):
+def endpoint_stats(logs, keep_times=True):
     # 엔드포인트별 호출수, 평균 응답시간
+    # keep_times=False면 응답시간 목록을 보관하지 않아 메모리가 엔드포인트 수에만 비례
     stats = {}
     for log in logs:
         url = log['url']
@@ -476,16 +930,19 @@ def endpoint_stats(logs):
         entry = stats[url]
         entry['count'] += 1
         entry['total_time'] += log['resp_time']
-        entry['times'].append(log['resp_time'])
+        if keep_times:
+            entry['times'].append(log['resp_time'])
     result = []
     for url, data in stats.items():
         avg_time = data['total_time'] / data['count'] if data['count'] else 0
-        result.append({
+        entry = {
             'url': url,
             'count': data['count'],
-            'avg_time': avg_time,
-            'times': data['times']
-        })
+            'avg_time': avg_time
+        }
+        if keep_times:
+            entry['times'] = data['times']
+        result.append(entry)
     # 호출수 내림차순 정렬
     return sorted(result, key=lambda x: x['count'], reverse=True)
 
@@ -499,30 +956,91 @@ def status_code_stats(logs):
         code_counter[code] += 1
         if code.startswith('4') or code.startswith('5'):
             # 시간대별 에러
-            try:
-                timestamp = log['timestamp']
-                if len(timestamp) == 16:  # YYYY-MM-DD HH:MM 형식
-                    dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M')
-                elif len(timestamp) == 19:  # YYYY-MM-DD HH:MM:SS 형식
-                    dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-                else:
-                    continue
-                
-                hour = dt.strftime('%Y-%m-%d %H:00')
-                error_by_time[hour] += 1
-            except Exception:
-                pass
+            epoch = record_epoch(log)
+            if epoch is not None:
+                error_by_time[epoch // 3600] += 1
             # 엔드포인트별 에러
             error_by_url[log['url']] += 1
     return {
         'code_counter': dict(code_counter),
-        'error_by_time': dict(error_by_time),
+        'error_by_time': {hour_label(hour): count for hour, count in error_by_time.items()},
         'error_by_url': dict(error_by_url)
     }
 
+class TopK:
+    """
+    값이 큰 상위 k개 항목만 최소 힙으로 유지하는 스트리밍 수집기.
+
+    전체를 정렬하지 않으므로 n개 항목에 O(n log k) 시간, O(k) 메모리만 씁니다.
+    동률이면 먼저 들어온 항목이 우선이며, merge()로 다른 수집기(다음 청크/파일)의
+    결과를 합치면 두 스트림을 이어서 넣은 것과 같은 결과가 됩니다.
+
+    Args:
+        k: 유지할 항목 수
+        key: 비교할 숫자 필드 이름 또는 항목에서 값을 꺼내는 함수
+    """
+
+    def __init__(self, k: int, key='resp_time'):
+        self.k = k
+        self._field = None if callable(key) else key
+        self._key = key if callable(key) else operator.itemgetter(key)
+        self.count = 0
+        self._heap = []  # (값, -순번, 항목) 최소 힙
+
+    def _push(self, entry) -> None:
+        # 순번이 모두 달라 항목(딕셔너리)끼리는 비교하지 않음
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self._heap and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def add(self, item) -> None:
+        self._push((self._key(item), -self.count, item))
+        self.count += 1
+
+    def push(self, value, seq: int, item) -> None:
+        # 값과 순번을 직접 지정해 추가 (벡터 연산으로 미리 뽑은 후보용, count는 호출자가 맞춤)
+        self._push((value, -seq, item))
+
+    def update(self, items: Iterable) -> 'TopK':
+        for item in items:
+            self.add(item)
+        return self
+
+    def merge(self, other: 'TopK') -> 'TopK':
+        """다른 수집기의 항목을 이 수집기 뒤에 들어온 것으로 합칩니다."""
+        for value, neg_seq, item in other._heap:
+            self._push((value, neg_seq - self.count, item))
+        self.count += other.count
+        return self
+
+    def items(self) -> List:
+        """값 내림차순 (동률은 들어온 순서) 상위 항목"""
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def to_dict(self) -> Dict:
+        """JSON으로 저장할 수 있는 상태 (key가 필드 이름일 때만 가능)"""
+        if not isinstance(self._key, operator.itemgetter):
+            raise ValueError('key 함수로 만든 TopK는 직렬화할 수 없습니다')
+        # 힙 내부 배치와 무관하게 같은 상태는 같은 값이 되도록 순위대로 저장
+        ranked = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return {'k': self.k, 'key': self._field, 'count': self.count, 'heap': [list(entry) for entry in ranked]}
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'TopK':
+        top = cls(state['k'], state['key'])
+        top.count = state['count']
+        top._heap = [tuple(entry) for entry in state['heap']]
+        heapq.heapify(top._heap)
+        return top
+
+def top_records(logs, top_n=10, key='resp_time'):
+    # 숫자 필드(또는 key 함수) 기준 상위 N개 로그 (힙으로 N개만 유지하므로 이터레이터도 그대로 처리)
+    return TopK(top_n, key).update(logs).items()
+
 def slow_requests(logs, top_n=10):
     # 처리시간이 긴 상위 N개 요청
-    return sorted(logs, key=lambda x: x['resp_time'], reverse=True)[:top_n]
+    return top_records(logs, top_n, 'resp_time')
 
 def slowest_endpoints(logs, top_n=5):
     # 평균 응답시간이 느린 엔드포인트 top N, 90퍼센타일 등
@@ -538,31 +1056,27 @@ def slowest_endpoints(logs, top_n=5):
     return sorted(stats, key=lambda x: x['avg_time'], reverse=True)[:top_n]
 
 def detect_anomalies(logs):
-    # 응답시간 급증 시간대, 비정상적 요청 IP 등
+    # 응답시간 급증 시간대, 비정상적 요청 IP 등 (한 번의 순회로 집계)
     # 1. 시간대별 평균 응답시간이 평소보다 2배 이상 급증한 구간 탐지
-    hour_resp = defaultdict(list)
+    hour_total = defaultdict(int)
+    hour_count = defaultdict(int)
+    ip_counter = Counter()
     for log in logs:
-        try:
-            timestamp = log['timestamp']
-            if len(timestamp) == 16:  # YYYY-MM-DD HH:MM 형식
-                dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M')
-            elif len(timestamp) == 19:  # YYYY-MM-DD HH:MM:SS 형식
-                dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-            else:
-                continue
-            
-            hour = dt.strftime('%Y-%m-%d %H:00')
-            hour_resp[hour].append(log['resp_time'])
-        except Exception:
+        # 2. IP별 요청수 (비정상적 요청 탐지)
+        ip_counter[log['ip']] += 1
+        epoch = record_epoch(log)
+        if epoch is None:
             continue
-    hour_avg = {h: (sum(v)/len(v) if v else 0) for h, v in hour_resp.items()}
+        hour = epoch // 3600
+        hour_total[hour] += log['resp_time']
+        hour_count[hour] += 1
+    hour_avg = {hour_label(h): hour_total[h] / hour_count[h] for h in hour_count}
     if hour_avg:
         global_avg = sum(hour_avg.values()) / len(hour_avg)
     else:
         global_avg = 0
     spike_hours = [h for h, avg in hour_avg.items() if avg > 2 * global_avg and avg > 200]
-    # 2. IP별 요청수 상위 5개 (비정상적 요청 탐지)
-    ip_counter = Counter([log['ip'] for log in logs])
+    # IP별 요청수 상위 5개
     top_ips = ip_counter.most_common(5)
     return {
         'spike_hours': spike_hours,
@@ -570,19 +1084,248 @@ def detect_anomalies(logs):
     }
 
 def suggest_improvements(logs):
-    # 느린 엔드포인트, 에러 많은 엔드포인트에 대한 개선 제안
+    # 느린 엔드포인트, 에러 많은 엔드포인트에 대한 개선 제안 (한 번의 순회로 두 통계를 함께 집계)
+    return LogAccumulator(logs).suggest_improvements()
+
+def improvements_from_stats(slow_eps, status_stats):
+    # 이미 계산된 느린 엔드포인트/상태 코드 통계로 개선 제안 문구 생성
     suggestions = []
     # 느린 엔드포인트
-    slow_eps = slowest_endpoints(logs, top_n=3)
     for ep in slow_eps:
         if ep['avg_time'] > 300:
             suggestions.append(f"'{ep['url']}' 엔드포인트는 평균 응답시간이 {ep['avg_time']:.1f}ms로 느립니다. DB 인덱스 최적화, 캐싱, 쿼리 개선을 검토하세요.")
     # 에러 많은 엔드포인트
-    status_stats = status_code_stats(logs)
     error_urls = sorted(status_stats['error_by_url'].items(), key=lambda x: x[1], reverse=True)[:3]
     for url, cnt in error_urls:
         if cnt > 0:
             suggestions.append(f"'{url}' 엔드포인트에서 에러가 {cnt}회 발생했습니다. 입력값 검증, 예외처리, 버그 수정이 필요할 수 있습니다.")
     if not suggestions:
         suggestions.append("특별히 개선이 필요한 엔드포인트가 발견되지 않았습니다.")
-    return suggestions 
\ No newline at end of file
+    return suggestions
+
+class LogAccumulator:
+    """
+    대시보드(analyze.html)에 표시하는 모든 통계를 로그 한 번 순회로 집계하는 누적기.
+
+    시간대별 트래픽/응답시간, 엔드포인트별 호출수/응답시간, 상태 코드 분포,
+    시간대/엔드포인트별 에러, 느린 요청 상위 N개, IP별 요청 수를 함께 누적하며
+    위 분석 함수들의 결과를 모두 이 누적 상태에서 만들 수 있습니다 (결과 순서도 동일).
+
+    누적 상태는 merge()로 합칠 수 있고(결합 법칙 성립, 앞 상태 뒤에 이어 붙인 것과 같은 결과)
+    to_dict()/from_dict()로 JSON에 저장할 수 있어, 병렬 청크나 여러 파일/날짜의 결과를
+    다시 파싱하지 않고 합칠 수 있습니다.
+
+    엔드포인트 응답시간은 기본적으로 분위수 스케치(상대 오차 relative_error)로만 보관해
+    메모리가 요청 수와 무관합니다. keep_times=True면 응답시간 목록을 보관해 정확한 분위수와
+    기존 함수와 같은 'times' 필드를 제공합니다.
+
+    사용 예:
+        acc = LogAccumulator(iter_log_records(path))
+        acc.traffic_by_hour(), acc.slowest_endpoints(), acc.results()
+    """
+
+    def __init__(self, logs: Iterable[Dict] = (), slow_top_n: int = 10, keep_times: bool = False,
+                 relative_error: float = DEFAULT_RELATIVE_ERROR):
+        self.slow_top_n = slow_top_n
+        self.keep_times = keep_times
+        self.relative_error = relative_error
+        self.count = 0
+        # 모든 딕셔너리는 처음 나온 순서를 유지 (기존 함수의 동률 순서와 맞춤)
+        self.hour_count = {}      # 시간 번호 -> 요청 수
+        self.hour_total = {}      # 시간 번호 -> 응답시간 합계
+        self.endpoints = {}       # URL -> [호출수, 응답시간 합계, 응답시간 목록 또는 분위수 스케치]
+        self.code_counter = Counter()
+        self.error_by_time = {}   # 시간 번호 -> 에러 수
+        self.error_by_url = {}    # URL -> 에러 수
+        self.ip_counter = Counter()
+        self.slow = TopK(slow_top_n, 'resp_time')   # 느린 요청 상위 N개
+        self.update(logs)
+
+    def update(self, logs: Iterable[Dict]) -> 'LogAccumulator':
+        """로그들을 누적합니다."""
+        add = self.add
+        for log in logs:
+            add(log)
+        return self
+
+    def add(self, log: Dict) -> None:
+        """로그 하나를 모든 통계에 반영합니다."""
+        self.count += 1
+        url = log['url']
+        resp_time = log['resp_time']
+        code = log['status']
+
+        entry = self.endpoints.get(url)
+        if entry is None:
+            times = [] if self.keep_times else QuantileSketch(self.relative_error)
+            entry = self.endpoints[url] = [0, 0, times]
+        entry[0] += 1
+        entry[1] += resp_time
+        if self.keep_times:
+            entry[2].append(resp_time)
+        else:
+            entry[2].add(resp_time)
+
+        self.code_counter[code] += 1
+        self.ip_counter[log['ip']] += 1
+
+        epoch = record_epoch(log)
+        hour = None
+        if epoch is not None:
+            hour = epoch // 3600
+            self.hour_count[hour] = self.hour_count.get(hour, 0) + 1
+            self.hour_total[hour] = self.hour_total.get(hour, 0) + resp_time
+
+        if code.startswith('4') or code.startswith('5'):
+            if hour is not None:
+                self.error_by_time[hour] = self.error_by_time.get(hour, 0) + 1
+            self.error_by_url[url] = self.error_by_url.get(url, 0) + 1
+
+        # 느린 요청 상위 N개 (동률이면 먼저 나온 요청 우선)
+        self.slow.add(log)
+
+    def merge(self, other: 'LogAccumulator') -> 'LogAccumulator':
+        """
+        다른 누적 상태를 합칩니다 (other의 로그가 이 상태의 로그 뒤에 이어진 것으로 취급).
+
+        처음 나온 순서, 동률 순서까지 두 로그 스트림을 이어서 한 번에 누적한 결과와 같습니다.
+        """
+        if other.keep_times != self.keep_times:
+            raise ValueError('keep_times가 다른 누적 상태는 병합할 수 없습니다')
+        for target, source in ((self.hour_count, other.hour_count), (self.hour_total, other.hour_total),
+                               (self.error_by_time, other.error_by_time), (self.error_by_url, other.error_by_url)):
+            for key, value in source.items():
+                target[key] = target.get(key, 0) + value
+        for url, (count, total, times) in other.endpoints.items():
+            entry = self.endpoints.get(url)
+            if entry is None:
+                # 다른 상태와 객체를 공유하지 않도록 복사
+                times = list(times) if self.keep_times else QuantileSketch.from_dict(times.to_dict())
+                self.endpoints[url] = [count, total, times]
+                continue
+            entry[0] += count
+            entry[1] += total
+            if self.keep_times:
+                entry[2].extend(times)
+            else:
+                entry[2].merge(times)
+        self.code_counter.update(other.code_counter)
+        self.ip_counter.update(other.ip_counter)
+        self.slow.merge(other.slow)
+        self.count += other.count
+        return self
+
+    def to_dict(self) -> Dict:
+        """JSON으로 저장할 수 있는 누적 상태 (딕셔너리 순서를 보존하도록 (키, 값) 목록으로 저장)"""
+        return {
+            'slow_top_n': self.slow_top_n,
+            'keep_times': self.keep_times,
+            'relative_error': self.relative_error,
+            'count': self.count,
+            'hour_count': list(self.hour_count.items()),
+            'hour_total': list(self.hour_total.items()),
+            'endpoints': [
+                [url, count, total, list(times) if self.keep_times else times.to_dict()]
+                for url, (count, total, times) in self.endpoints.items()
+            ],
+            'code_counter': list(self.code_counter.items()),
+            'error_by_time': list(self.error_by_time.items()),
+            'error_by_url': list(self.error_by_url.items()),
+            'ip_counter': list(self.ip_counter.items()),
+            'slow': self.slow.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'LogAccumulator':
+        acc = cls(slow_top_n=state['slow_top_n'], keep_times=state['keep_times'],
+                  relative_error=state['relative_error'])
+        acc.count = state['count']
+        acc.hour_count = {hour: count for hour, count in state['hour_count']}
+        acc.hour_total = {hour: total for hour, total in state['hour_total']}
+        acc.endpoints = {
+            url: [count, total, list(times) if acc.keep_times else QuantileSketch.from_dict(times)]
+            for url, count, total, times in state['endpoints']
+        }
+        acc.code_counter = Counter({code: count for code, count in state['code_counter']})
+        acc.error_by_time = {hour: count for hour, count in state['error_by_time']}
+        acc.error_by_url = {url: count for url, count in state['error_by_url']}
+        acc.ip_counter = Counter({ip: count for ip, count in state['ip_counter']})
+        acc.slow = TopK.from_dict(state['slow'])
+        return acc
+
+    def traffic_by_hour(self):
+        # traffic_by_hour(logs)와 같은 결과
+        return [(hour_label(hour), count) for hour, count in sorted(self.hour_count.items())]
+
+    def percentiles(self, url: str) -> Dict[str, float]:
+        """엔드포인트의 p50/p90/p95/p99 응답시간 (응답시간 목록이 있으면 정확한 값)"""
+        times = self.endpoints[url][2]
+        quantiles = [q for _, q in PERCENTILES]
+        values = exact_quantiles(times, quantiles) if self.keep_times else times.quantiles(quantiles)
+        return {name: int(round(value)) for (name, _), value in zip(PERCENTILES, values)}
+
+    def endpoint_stats(self, keep_times: Optional[bool] = None, percentiles: bool = False):
+        # endpoint_stats(logs)와 같은 결과 (percentiles=True면 p50/p90/p95/p99 포함)
+        keep_times = self.keep_times if keep_times is None else keep_times and self.keep_times
+        result = []
+        for url, (count, total, times) in self.endpoints.items():
+            entry = {'url': url, 'count': count, 'avg_time': total / count if count else 0}
+            if keep_times:
+                entry['times'] = list(times)
+            if percentiles:
+                entry.update(self.percentiles(url))
+            result.append(entry)
+        return sorted(result, key=lambda x: x['count'], reverse=True)
+
+    def status_code_stats(self):
+        # status_code_stats(logs)와 같은 결과
+        return {
+            'code_counter': dict(self.code_counter),
+            'error_by_time': {hour_label(hour): count for hour, count in self.error_by_time.items()},
+            'error_by_url': dict(self.error_by_url)
+        }
+
+    def slow_requests(self, top_n: Optional[int] = None):
+        # slow_requests(logs, top_n)와 같은 결과 (top_n은 slow_top_n 이하)
+        top_n = self.slow_top_n if top_n is None else min(top_n, self.slow_top_n)
+        return self.slow.items()[:top_n]
+
+    def slowest_endpoints(self, top_n=5, keep_times: Optional[bool] = None, percentiles: bool = False):
+        # slowest_endpoints(logs, top_n)와 같은 결과 (응답시간 목록이 없으면 p90은 스케치 근사값)
+        stats = sorted(self.endpoint_stats(keep_times), key=lambda x: x['avg_time'], reverse=True)[:top_n]
+        for s in stats:
+            values = self.percentiles(s['url'])
+            if percentiles:
+                s.update(values)
+            else:
+                s['p90'] = values['p90']
+        return stats
+
+    def detect_anomalies(self):
+        # detect_anomalies(logs)와 같은 결과
+        hour_avg = {hour_label(h): self.hour_total[h] / count for h, count in self.hour_count.items()}
+        global_avg = sum(hour_avg.values()) / len(hour_avg) if hour_avg else 0
+        return {
+            'spike_hours': [h for h, avg in hour_avg.items() if avg > 2 * global_avg and avg > 200],
+            'top_ips': self.ip_counter.most_common(5)
+        }
+
+    def suggest_improvements(self):
+        # suggest_improvements(logs)와 같은 결과
+        return improvements_from_stats(self.slowest_endpoints(top_n=3), self.status_code_stats())
+
+    def results(self) -> Dict:
+        """analyze.html에 필요한 집계 결과 전체 (cache.compute_aggregates와 같은 키)"""
+        slowest = self.slowest_endpoints(top_n=5, keep_times=False, percentiles=True)
+        status_stats = self.status_code_stats()
+        return {
+            'traffic_by_hour': self.traffic_by_hour(),
+            'endpoint_stats': self.endpoint_stats(keep_times=False, percentiles=True),
+            'status_code_stats': status_stats,
+            'slow_requests': self.slow_requests(),
+            'slowest_endpoints': slowest,
+            'detect_anomalies': self.detect_anomalies(),
+            # 느린 엔드포인트 상위 3개는 상위 5개의 앞부분과 같으므로 다시 계산하지 않음
+            'suggest_improvements': improvements_from_stats(slowest[:3], status_stats),
+            'percentile_mode': None if self.keep_times else self.relative_error,
+        }
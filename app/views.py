@@ -1,179 +1,855 @@
 import os
 import io
-import matplotlib
-matplotlib.use('Agg')  # 서버 환경에서 Tkinter 없이 이미지 저장용 백엔드 사용
-import matplotlib.pyplot as plt
-import seaborn as sns
+import re
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
+from importlib import metadata
 
-
-from flask import Blueprint, render_template, request, current_app, send_file
-from .utils import parse_log_line, detect_log_format, convert_log_format, search_pattern, traffic_by_hour, endpoint_stats, status_code_stats, slow_requests, slowest_endpoints, detect_anomalies, suggest_improvements
+from flask import Blueprint, Response, render_template, request, current_app, jsonify
+from .cache import (DEFAULT_CACHE_MAX_BYTES, ParsedCache, combine_parsed, file_fingerprint, load_parsed_logs,
+                    load_time_window, window_key)
+from .jobs import DEFAULT_JOB_WORKERS, JobManager
+from .parallel import DEFAULT_CHUNK_SIZE
+from .sketch import DEFAULT_RELATIVE_ERROR, EXACT_QUANTILE_MAX_ROWS
+from .utils import timestamp_to_epoch
+from .watcher import DEFAULT_WATCH_INTERVAL, LogDirWatcher
 
 bp = Blueprint('views', __name__)
 
 # 로그 파일이 저장된 디렉토리 경로
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
 
+@lru_cache(maxsize=None)
+def _pyplot():
+    """
+    matplotlib.pyplot을 처음 그래프를 그릴 때 불러옵니다.
+
+    matplotlib은 불러오는 데만 수백 ms가 걸리고, 화면의 그래프는 브라우저에서 그리므로
+    PNG 내보내기를 요청하기 전에는 앱 시작(create_app)에서 불러오지 않습니다.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # 서버 환경에서 Tkinter 없이 이미지 저장용 백엔드 사용
+    import matplotlib.pyplot as plt
+    return plt
+
+@lru_cache(maxsize=None)
+def _matplotlib_version():
+    # 그래프 캐시 키용 matplotlib 버전 (패키지 정보만 읽으므로 matplotlib을 불러오지 않음)
+    try:
+        return metadata.version('matplotlib')
+    except metadata.PackageNotFoundError:
+        import matplotlib
+        return matplotlib.__version__
+
+def _parse_options():
+    """앱 설정의 파싱/집계 옵션 (워커 수, 청크 크기, 분위수 상대 오차, 정확 계산 최대 행 수)"""
+    return {
+        'workers': current_app.config.get('PARSE_WORKERS'),
+        'chunk_size': current_app.config.get('PARSE_CHUNK_SIZE', DEFAULT_CHUNK_SIZE),
+        'relative_error': current_app.config.get('QUANTILE_RELATIVE_ERROR', DEFAULT_RELATIVE_ERROR),
+        'exact_max_rows': current_app.config.get('QUANTILE_EXACT_MAX_ROWS', EXACT_QUANTILE_MAX_ROWS)
+    }
+
+def _parse_cache():
+    """앱 설정의 파싱 결과 디스크 캐시 (PARSE_CACHE_DIR이 비어 있으면 사용하지 않음)"""
+    directory = current_app.config.get('PARSE_CACHE_DIR')
+    if not directory:
+        return None
+    return ParsedCache(directory, current_app.config.get('PARSE_CACHE_MAX_BYTES', DEFAULT_CACHE_MAX_BYTES))
+
+# 메모리 결과 캐시 기본 최대 크기 (바이트)
+DEFAULT_RESULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+def _parsed_size(parsed):
+    """파싱 결과가 차지하는 대략적인 메모리 (컬럼 배열 + 검색 인덱스 포스팅 + 사전 문자열)"""
+    table = parsed.table
+    return table.nbytes + parsed.search_index.nbytes + sum(sys.getsizeof(value) for vocab in (table.urls, table.ips, table.methods) for value in vocab)
+
+class ResultCache:
+    """
+    파일 지문을 키로 파싱 결과(컬럼 테이블 + 집계)를 메모리에 보관하는 스레드 안전 LRU 캐시.
+
+    분석 페이지 한 번에 /analyze, 그래프 이미지 3개, /errors 요청이 같은 파일을 읽으므로
+    처음 한 번만 파싱(또는 디스크 캐시 읽기)하고 나머지는 여기서 꺼냅니다.
+    같은 파일을 동시에 요청하면 한 요청만 읽고 나머지는 그 결과를 기다립니다.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_RESULT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # 지문 -> (파싱 결과, 크기), 오래 안 쓴 순서
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._loading = {}  # 지문 -> 읽는 중인 요청의 잠금
+
+    @staticmethod
+    def _key(file_path, window=None):
+        # 파일 지문 (시간 구간 결과면 지문 + 구간)
+        fingerprint = file_fingerprint(file_path)
+        return fingerprint if window is None else window_key(fingerprint, *window)
+
+    def get(self, file_path, loader, window=None):
+        """
+        파일 지문에 해당하는 결과를 반환합니다. 없으면 loader(file_path)로 읽어 저장합니다.
+
+        Args:
+            file_path: 로그 파일 경로
+            loader: 캐시에 없을 때 파싱 결과를 만드는 함수
+            window: 시간 구간 (ts_from, ts_to) - 지정하면 파일 전체가 아닌 구간 결과의 키로 찾음
+        """
+        fingerprint = self._key(file_path, window)
+        with self._lock:
+            parsed = self._lookup(fingerprint)
+            if parsed is not None:
+                self.hits += 1
+                return parsed
+            loading = self._loading.setdefault(fingerprint, threading.Lock())
+        with loading:
+            with self._lock:
+                parsed = self._lookup(fingerprint)
+                if parsed is not None:
+                    self.hits += 1  # 다른 요청이 읽는 동안 기다린 경우
+                    return parsed
+                self.misses += 1
+            try:
+                parsed = loader(file_path)
+                self.put(parsed)
+            finally:
+                with self._lock:
+                    self._loading.pop(fingerprint, None)
+        return parsed
+
+    def get_many(self, file_paths, loader_many, window=None):
+        """
+        여러 파일의 결과를 반환합니다. 캐시에 없는 파일들만 모아 loader_many(경로 목록)로 한 번에 읽습니다.
+
+        겹치는 날짜 범위를 다시 조회하면 이미 읽은 파일은 캐시에서 꺼내고 새 파일만 읽습니다.
+        get처럼 없는 파일마다 읽는 중 잠금을 잡아, 다른 요청이 이미 읽고 있는 파일은 그 결과를 기다립니다.
+        """
+        keys = [self._key(file_path, window) for file_path in file_paths]
+        with self._lock:
+            results = [self._lookup(key) for key in keys]
+            self.hits += sum(parsed is not None for parsed in results)
+            missing = sorted({key for key, parsed in zip(keys, results) if parsed is None})
+            locks = [self._loading.setdefault(key, threading.Lock()) for key in missing]
+        if not missing:
+            return results
+        # 여러 요청이 겹치는 파일을 서로 기다리며 멈추지 않도록 항상 키 순서대로 잠금
+        for loading in locks:
+            loading.acquire()
+        try:
+            with self._lock:
+                loaded = {key: self._lookup(key) for key in missing}
+                pending = [key for key in dict.fromkeys(keys) if loaded.get(key, False) is None]  # 요청한 순서대로
+                waited = sum(parsed is None and loaded[key] is not None for key, parsed in zip(keys, results))
+                self.hits += waited  # 다른 요청이 읽는 동안 기다린 경우
+                self.misses += sum(parsed is None for parsed in results) - waited
+            if pending:
+                paths = {key: file_path for key, file_path in zip(keys, file_paths)}
+                for key, parsed in zip(pending, loader_many([paths[key] for key in pending])):
+                    self.put(parsed)
+                    loaded[key] = parsed
+        finally:
+            with self._lock:
+                for key in missing:
+                    self._loading.pop(key, None)
+            for loading in locks:
+                loading.release()
+        return [loaded[key] if parsed is None else parsed for key, parsed in zip(keys, results)]
+
+    def contains(self, file_path, window=None):
+        """파일(또는 시간 구간)의 결과가 캐시에 있는지 (히트/미스 횟수와 사용 순서는 바꾸지 않음)"""
+        key = self._key(file_path, window)
+        with self._lock:
+            return key in self._entries
+
+    def put(self, parsed):
+        """파싱 결과를 저장하고 최대 크기를 넘으면 오래 안 쓴 항목부터 제거합니다."""
+        size = _parsed_size(parsed)
+        with self._lock:
+            if parsed.fingerprint in self._entries:
+                self._bytes -= self._entries.pop(parsed.fingerprint)[1]
+            if size > self.max_bytes:
+                return  # 혼자서도 예산을 넘는 결과는 보관하지 않음
+            self._entries[parsed.fingerprint] = (parsed, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """히트/미스 횟수와 현재 사용량"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _lookup(self, fingerprint):
+        # self._lock을 잡은 상태에서 호출
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            return None
+        self._entries.move_to_end(fingerprint)
+        return entry[0]
+
+_RESULT_CACHE_LOCK = threading.Lock()
+
+def _result_cache():
+    """앱별 메모리 결과 캐시 (RESULT_CACHE_MAX_BYTES가 0이면 사용하지 않음)"""
+    max_bytes = current_app.config.get('RESULT_CACHE_MAX_BYTES', DEFAULT_RESULT_CACHE_MAX_BYTES)
+    if not max_bytes:
+        return None
+    with _RESULT_CACHE_LOCK:
+        cache = current_app.extensions.get('result_cache')
+        if cache is None:
+            cache = current_app.extensions['result_cache'] = ResultCache(max_bytes)
+    return cache
+
+# 그래프 종류
+PLOT_TYPES = ('traffic', 'endpoint', 'status')
+
+# 렌더링한 그래프 PNG 메모리 캐시 기본 최대 크기 (바이트)
+DEFAULT_PLOT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+class PlotCache:
+    """
+    렌더링한 그래프 PNG를 키(파일 지문, 그래프 종류, 파라미터, 테마의 해시)로 보관하는 캐시.
+
+    메모리 LRU에 max_bytes까지 보관하고, directory를 지정하면 '<키>.png' 파일로도 저장해
+    재시작 후에도 다시 그리지 않습니다 (디스크도 max_bytes를 넘으면 오래 안 쓴 파일부터 삭제).
+    """
+
+    def __init__(self, max_bytes=DEFAULT_PLOT_CACHE_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # 키 -> PNG 바이트, 오래 안 쓴 순서
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.png")
+
+    def get(self, key):
+        """키의 PNG를 반환합니다 (메모리에 없으면 디스크에서 읽어 메모리에 올림, 없으면 None)."""
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return png
+        if self.directory:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    png = f.read()
+                os.utime(self._path(key))  # 최근 사용 시각 갱신 (제거 순서 기준)
+            except OSError:
+                png = None
+        with self._lock:
+            if png is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, png)
+        return png
+
+    def put(self, key, png):
+        """PNG를 메모리(와 디스크)에 저장합니다."""
+        self._remember(key, png)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(png)
+            os.replace(tmp_path, self._path(key))
+            self._evict_disk()
+
+    def _remember(self, key, png):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key))
+            if len(png) > self.max_bytes:
+                return
+            self._entries[key] = png
+            self._bytes += len(png)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def _evict_disk(self):
+        # 디스크 캐시가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.png'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def stats(self):
+        """히트/미스 횟수와 현재 메모리 사용량"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+def _plot_cache():
+    """앱별 그래프 PNG 캐시 (PLOT_CACHE_MAX_BYTES가 0이면 사용하지 않음)"""
+    max_bytes = current_app.config.get('PLOT_CACHE_MAX_BYTES', DEFAULT_PLOT_CACHE_MAX_BYTES)
+    if not max_bytes:
+        return None
+    with _RESULT_CACHE_LOCK:
+        cache = current_app.extensions.get('plot_cache')
+        if cache is None:
+            cache = current_app.extensions['plot_cache'] = PlotCache(max_bytes, current_app.config.get('PLOT_CACHE_DIR'))
+    return cache
+
+def _plot_key(file_paths, plot_type, window, theme):
+    """
+    그래프 캐시 키이자 ETag (파일 지문, 그래프 종류, 시간 구간, 테마, 집계 옵션, matplotlib 버전의 해시).
+
+    파일 내용이 바뀌면 지문이 바뀌므로 키도 바뀝니다.
+    """
+    options = _parse_options()
+    parts = {
+        'files': [file_fingerprint(file_path) for file_path in file_paths],
+        'plot': plot_type,
+        'window': window,
+        'theme': theme,
+        'quantiles': [options['relative_error'], options['exact_max_rows']],
+        'matplotlib': _matplotlib_version(),
+    }
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _set_plot_headers(response, key, last_modified):
+    # 강한 ETag와 Last-Modified (원본 로그 파일 중 가장 최근 수정 시각), 매번 재검증
+    response.set_etag(key)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+
+def _read_parsed_many(file_paths):
+    """로그 파일들의 컬럼 테이블과 집계 결과를 읽습니다 (디스크 캐시에 없는 파일만 함께 병렬 파싱)."""
+    parsed_logs = load_parsed_logs(file_paths, _parse_cache(), **_parse_options())
+    for parsed in parsed_logs:
+        current_app.logger.debug("Loaded %d records (%.1f MB columns)", len(parsed.table), parsed.table.nbytes / 1e6)
+    return parsed_logs
+
+def _read_parsed(file_path):
+    return _read_parsed_many([file_path])[0]
+
+def _read_window(file_path, window):
+    """로그 파일의 시간 구간 결과를 읽습니다 (시간 인덱스로 구간과 겹치는 바이트만 파싱)."""
+    return load_time_window(file_path, *window, cache=_parse_cache(), **_parse_options())
+
+def _load_parsed(file_path, window=None):
+    """메모리 결과 캐시를 거쳐 파싱 결과를 가져옵니다 (같은 내용의 파일은 한 번만 읽음)."""
+    cache = _result_cache()
+    loader = _read_parsed if window is None else partial(_read_window, window=window)
+    if cache is None:
+        return loader(file_path)
+    return cache.get(file_path, loader, window)
+
+def _load_parsed_many(file_paths, window=None):
+    """여러 파일의 파싱 결과 (메모리 결과 캐시에 없는 파일만 읽음)"""
+    cache = _result_cache()
+    if window is None:
+        loader_many = _read_parsed_many
+    else:
+        loader_many = lambda paths: [_read_window(path, window) for path in paths]
+    if cache is None:
+        return loader_many(file_paths)
+    return cache.get_many(file_paths, loader_many, window)
+
+def _load_aggregates(file_paths, window=None):
+    """
+    파일 하나면 그 파일의 집계를, 여러 개면 파일별 집계 부분 상태를 병합한 결과를 반환합니다.
+
+    Returns:
+        (집계 결과, 파일별 파싱 결과 목록)
+    """
+    if len(file_paths) == 1:
+        parsed_logs = [_load_parsed(file_paths[0], window)]
+    else:
+        parsed_logs = _load_parsed_many(file_paths, window)
+    return _aggregate(parsed_logs), parsed_logs
+
+def _aggregate(parsed_logs):
+    # 파일 하나면 그 파일의 집계, 여러 개면 파일별 집계 부분 상태를 병합한 결과
+    if len(parsed_logs) == 1:
+        return parsed_logs[0].aggregates
+    return combine_parsed(parsed_logs).results()
+
+# 이 크기(바이트, 선택한 파일 합계) 이상이면 분석을 백그라운드 작업으로 실행
+DEFAULT_JOB_MIN_BYTES = 32 * 1024 * 1024
+
+def _job_manager():
+    """앱별 백그라운드 분석 작업 관리자 (JOB_EXECUTOR: 'thread' 또는 'process', JOB_WORKERS: 동시 작업 수)"""
+    with _RESULT_CACHE_LOCK:
+        manager = current_app.extensions.get('job_manager')
+        if manager is None:
+            manager = current_app.extensions['job_manager'] = JobManager(
+                current_app.config.get('JOB_EXECUTOR', 'thread'),
+                current_app.config.get('JOB_WORKERS', DEFAULT_JOB_WORKERS))
+    return manager
+
+def _run_analysis(file_paths, window, cache_dir, cache_max_bytes, options, progress=None):
+    """
+    백그라운드 분석 작업 본체: 파일별 파싱 결과 목록을 반환합니다.
+
+    프로세스 풀에서도 실행되므로 앱 컨텍스트 대신 설정값을 인자로 받습니다.
+    """
+    cache = ParsedCache(cache_dir, cache_max_bytes) if cache_dir else None
+    if window is None:
+        return load_parsed_logs(file_paths, cache, progress=progress, **options)
+    return [load_time_window(file_path, *window, cache=cache, progress=progress, **options) for file_path in file_paths]
+
+def _store_results(cache, parsed_logs):
+    # 끝난 작업의 결과를 메모리 결과 캐시에 넣어 그래프/에러 페이지 요청이 다시 읽지 않게 함
+    if cache is not None:
+        for parsed in parsed_logs:
+            cache.put(parsed)
+    return parsed_logs
+
+def _analysis_job(file_paths, window, job_id=None):
+    """
+    큰 분석을 백그라운드 작업으로 실행합니다.
+
+    - job_id의 작업이 같은 파일/구간의 작업이면 그 작업 (끝났으면 그 결과로 화면을 그림)
+    - 합계 크기가 JOB_MIN_BYTES 미만이거나 메모리 결과 캐시에 모두 있으면 None (요청 안에서 바로 분석)
+    - 그 외에는 새 작업을 제출 (같은 파일/구간의 작업이 실행 중이면 그 작업에 합류)
+    """
+    key = '|'.join(ResultCache._key(file_path, window) for file_path in file_paths)
+    manager = _job_manager()
+    job = manager.get(job_id) if job_id else None
+    if job is not None and job.key == key:
+        return job
+    cache = _result_cache()
+    total_bytes = sum(os.path.getsize(file_path) for file_path in file_paths)
+    if total_bytes < current_app.config.get('JOB_MIN_BYTES', DEFAULT_JOB_MIN_BYTES):
+        return None
+    if cache is not None and all(cache.contains(file_path, window) for file_path in file_paths):
+        return None
+    directory = current_app.config.get('PARSE_CACHE_DIR')
+    max_bytes = current_app.config.get('PARSE_CACHE_MAX_BYTES', DEFAULT_CACHE_MAX_BYTES)
+    return manager.submit(key, total_bytes, _run_analysis, file_paths, window, directory, max_bytes,
+                          _parse_options(), finish=partial(_store_results, cache))
+
+def _time_window(args):
+    """
+    요청의 time_from/time_to('YYYY-MM-DDTHH:MM', 로그의 현지 시각)로 시간 구간을 만듭니다.
+
+    Returns:
+        (시작 epoch 초 또는 None, 끝 epoch 초 또는 None), 둘 다 없으면 None
+    """
+    window = tuple(timestamp_to_epoch(args.get(name, '')) for name in ('time_from', 'time_to'))
+    return None if window == (None, None) else window
+
+# 에러/검색 결과 목록 한 페이지의 행 수 (기본값, limit 인자의 최대값)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# 상태 코드 필터 한 항목 (예: 404, 5xx)
+_STATUS_FILTER_RE = re.compile(r'([1-5])(\d\d|xx)', re.IGNORECASE)
+
+def _status_ranges(spec):
+    """
+    요청의 status 인자(예: '404', '5xx', 쉼표로 여러 개)를 상태 코드 [시작, 끝) 구간 목록으로 바꿉니다.
+
+    Returns:
+        구간 목록, 비어 있으면 None (잘못된 항목은 ValueError)
+    """
+    ranges = []
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        match = _STATUS_FILTER_RE.fullmatch(item)
+        if match is None:
+            raise ValueError(f"잘못된 상태 코드 필터입니다: {item}")
+        if match.group(2).lower() == 'xx':
+            low = int(match.group(1)) * 100
+            ranges.append((low, low + 100))
+        else:
+            ranges.append((int(item), int(item) + 1))
+    return ranges or None
+
+def _page_size(args):
+    # 요청의 limit 인자 (없으면 PAGE_SIZE 설정값, 1 ~ MAX_PAGE_SIZE)
+    limit = args.get('limit', type=int) or current_app.config.get('PAGE_SIZE', DEFAULT_PAGE_SIZE)
+    return min(max(limit, 1), MAX_PAGE_SIZE)
+
+def _parse_cursor(value):
+    """커서 '파일 순번:행 번호'를 (파일 순번, 행 번호)로 (없으면 처음인 (0, -1), 잘못된 값은 ValueError)"""
+    if not value:
+        return 0, -1
+    file_index, row = (int(part) for part in value.split(':'))
+    if file_index < 0 or row < -1:
+        raise ValueError(f"잘못된 커서입니다: {value}")
+    return file_index, row
+
+def _page_records(parsed_logs, row_sets, cursor, limit, status_ranges=None):
+    """
+    여러 파일에 걸친 목록의 한 페이지 (파일 순서, 파일 안에서는 행 순서)
+
+    Args:
+        row_sets: 파일별로 훑을 행 인덱스 (None이면 전체 행)
+        cursor: _parse_cursor 결과
+
+    Returns:
+        (로그 딕셔너리 리스트, 다음 페이지 커서 문자열 또는 None)
+    """
+    file_index, after = cursor
+    records = []
+    for i in range(file_index, len(parsed_logs)):
+        table = parsed_logs[i].table
+        rows, next_row = table.page(row_sets[i], after if i == file_index else -1, limit - len(records), status_ranges)
+        records.extend(table.records(rows))
+        if next_row is not None:
+            return records, f'{i}:{next_row}'
+        if len(records) >= limit:
+            return records, f'{i + 1}:-1' if i + 1 < len(parsed_logs) else None
+    return records, None
+
+def _search_rows(parsed_logs, keyword, use_regex):
+    # 파일별 검색 인덱스로 찾은 일치 행 (잘못된 정규식은 re.error)
+    return [parsed.search_index.search(keyword, use_regex) for parsed in parsed_logs]
+
+# 파일 이름에 든 날짜 (예: dummy-2025-06-03.log)
+_FILE_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def _files_in_range(log_files, date_from, date_to):
+    """파일 이름의 날짜가 [date_from, date_to] 안에 있는 파일 (YYYY-MM-DD, 비어 있으면 제한 없음)"""
+    selected = []
+    for name in log_files:
+        match = _FILE_DATE_RE.search(name)
+        if match and (not date_from or match.group() >= date_from) and (not date_to or match.group() <= date_to):
+            selected.append(name)
+    return selected
+
+def _selected_files(args, log_files):
+    """요청의 logfile(여러 개 가능)과 date_from/date_to 범위로 고른 파일 이름 (이름순, 목록에 있는 파일만)"""
+    names = set(args.getlist('logfile'))
+    date_from, date_to = args.get('date_from', ''), args.get('date_to', '')
+    if date_from or date_to:
+        names.update(_files_in_range(log_files, date_from, date_to))
+    return sorted(name for name in names if name in log_files)
+
+def _requested_files(args):
+    """
+    요청한 파일 이름 (_selected_files와 같음). 요청한 logfile 중 로그 디렉토리 목록에 없는 이름이
+    하나라도 있으면 None (../나 절대 경로로 디렉토리 밖 파일을 열지 않도록)
+    """
+    names = _selected_files(args, _log_files())
+    return names if set(args.getlist('logfile')) <= set(names) else None
+
+def _warm_file(app, file_path):
+    """
+    감시자가 새로 생기거나 바뀐 파일을 미리 분석해 디스크/메모리 결과 캐시를 채웁니다.
+
+    분석 화면과 같은 작업 키로 백그라운드 작업을 제출하므로, 그 사이 같은 파일을 요청하면 이 작업에 합류합니다.
+    """
+    with app.app_context():
+        cache = _result_cache()
+        if cache is not None and cache.contains(file_path):
+            return cache.get(file_path, _read_parsed)
+        directory = current_app.config.get('PARSE_CACHE_DIR')
+        max_bytes = current_app.config.get('PARSE_CACHE_MAX_BYTES', DEFAULT_CACHE_MAX_BYTES)
+        job = _job_manager().submit(ResultCache._key(file_path), os.path.getsize(file_path), _run_analysis,
+                                    [file_path], None, directory, max_bytes, _parse_options(),
+                                    finish=partial(_store_results, cache))
+    job.wait()
+    if job.status == 'error':
+        raise RuntimeError(job.error)
+    return job.result[0]
+
+def _log_watcher():
+    """
+    앱별 로그 디렉토리 감시자 (LOG_WATCH_INTERVAL초마다 훑고 새 파일을 미리 분석, 0이면 폴링하지 않음)
+
+    테스트 중에는 백그라운드 분석이 캐시 통계를 바꾸지 않도록 폴링 스레드를 시작하지 않습니다.
+    """
+    with _RESULT_CACHE_LOCK:
+        watcher = current_app.extensions.get('log_watcher')
+        if watcher is None:
+            if not os.path.exists(LOG_DIR):
+                os.makedirs(LOG_DIR)
+            app = current_app._get_current_object()
+            watcher = current_app.extensions['log_watcher'] = LogDirWatcher(LOG_DIR, partial(_warm_file, app))
+            interval = current_app.config.get('LOG_WATCH_INTERVAL', DEFAULT_WATCH_INTERVAL)
+            if interval and not current_app.testing:
+                watcher.scan(warm=False)  # 첫 화면의 파일 목록은 바로 채우고, 미리 분석은 스레드에서
+                watcher.start(interval)
+    return watcher
+
+def start_log_watcher(app):
+    """앱의 로그 디렉토리 감시자를 만들고 폴링 스레드를 시작합니다 (테스트 중이거나 LOG_WATCH_INTERVAL이 0이면 스레드 없이)."""
+    with app.app_context():
+        return _log_watcher()
+
+def _log_files():
+    """logs 디렉토리의 파일별 메타데이터 (이름순, 감시자가 폴링 중이 아니면 요청마다 다시 훑음)"""
+    watcher = _log_watcher()
+    if not watcher.running:
+        watcher.scan(warm=False)
+    return watcher.files()
+
+@bp.route('/cache/stats')
+def cache_stats():
+    # 메모리 결과 캐시의 히트/미스 횟수와 사용량 (plots: 그래프 PNG 캐시, watcher: 로그 디렉토리 감시자)
+    cache = _result_cache()
+    stats = cache.stats() if cache is not None else {'enabled': False}
+    plot_cache = _plot_cache()
+    stats['plots'] = plot_cache.stats() if plot_cache is not None else {'enabled': False}
+    watcher = current_app.extensions.get('log_watcher')
+    stats['watcher'] = watcher.stats() if watcher is not None else {'enabled': False}
+    return jsonify(stats)
+
+@bp.route('/jobs/<job_id>')
+def job_status(job_id):
+    # 백그라운드 분석 작업의 진행 상황 (처리한 바이트, 초당 라인 수, 남은 시간)
+    job = _job_manager().get(job_id)
+    if job is None:
+        return jsonify({'error': 'not found'}), 404
+    return jsonify(job.snapshot())
+
+@bp.route('/analyze/search')
+def search_page():
+    """
+    패턴 검색 결과의 한 페이지를 JSON으로 반환하는 라우트
+
+    인자: logfile(여러 개 가능), date_from/date_to, keyword, regex, time_from/time_to, status(상태 코드 필터), cursor, limit
+    """
+    keyword = request.args.get('keyword', '')
+    names = _requested_files(request.args)
+    if not keyword or not names:
+        return jsonify({'error': 'not found'}), 404
+    file_paths = [os.path.join(LOG_DIR, name) for name in names]
+    try:
+        status_ranges = _status_ranges(request.args.get('status', ''))
+        cursor = _parse_cursor(request.args.get('cursor', ''))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    window = _time_window(request.args)
+    parsed_logs = [_load_parsed(file_paths[0], window)] if len(file_paths) == 1 else _load_parsed_many(file_paths, window)
+    try:
+        row_sets = _search_rows(parsed_logs, keyword, bool(request.args.get('regex')))
+    except re.error as e:
+        return jsonify({'error': f"잘못된 정규식입니다: {e}"}), 400
+    records, next_cursor = _page_records(parsed_logs, row_sets, cursor, _page_size(request.args), status_ranges)
+    return jsonify({
+        'results': records,
+        'next_cursor': next_cursor,
+        'total': sum(len(rows) for rows in row_sets),  # 상태 코드 필터 적용 전 일치 건수
+    })
+
 @bp.route('/analyze', methods=['GET', 'POST'])
 def analyze():
-    # logs 디렉토리의 파일 목록을 가져옴 (없으면 생성)
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR)
-    log_files = [f for f in os.listdir(LOG_DIR) if os.path.isfile(os.path.join(LOG_DIR, f))]
+    log_files = _log_files()
 
     # 분석 결과 변수 초기화
     result = None
     chart_data = None
     pattern_results = None
     keyword = request.form.get('keyword', '')  # 검색 키워드
-    selected_file = request.form.get('logfile')  # 선택된 로그 파일명
-    logs = []
+    use_regex = bool(request.form.get('regex'))  # 키워드를 정규식으로 검색
+    search_error = None
+    aggregates = None
+    job = None  # 진행 중인 백그라운드 분석 작업
+    job_error = None
+    date_from = request.form.get('date_from', '')  # 기간 시작 (파일 이름의 날짜 기준)
+    date_to = request.form.get('date_to', '')  # 기간 끝
+    time_from = request.form.get('time_from', '')  # 시간 구간 시작 (로그의 현지 시각)
+    time_to = request.form.get('time_to', '')  # 시간 구간 끝
+    # 선택된 로그 파일들 (여러 개 또는 기간으로 선택하면 합쳐서 분석)
+    selected_files = _selected_files(request.form, log_files) if request.method == 'POST' else []
+    selected_file = selected_files[0] if len(selected_files) == 1 else None
     # POST 요청 + 파일 선택 시 분석 시작
-    if request.method == 'POST' and selected_file:
-        file_path = os.path.join(LOG_DIR, selected_file)
-        if os.path.exists(file_path):
-            # 로그 파일 읽기
-            with open(file_path, encoding='utf-8') as f:
-                lines = f.read().splitlines()
-            
-            # 로그 형식 자동 감지 (처음 20줄 사용)
-            sample_lines = [line for line in lines[:20] if line.strip()]
-            detected_format = detect_log_format(sample_lines)
-            print(f"DEBUG: Detected format: {detected_format}")
-            print(f"DEBUG: Sample lines: {sample_lines[:3]}")
-            
-            # 로그 파싱
-            logs = []
-            parsed_count = 0
-            for i, line in enumerate(lines):
-                if line.strip():
-                    # 감지된 형식으로 직접 파싱
-                    if detected_format:
-                        log_entry = parse_log_line(line, detected_format)
-                    else:
-                        log_entry = parse_log_line(line, 'standard')
-                    
-                    if log_entry:
-                        logs.append(log_entry)
-                        parsed_count += 1
-                    else:
-                        print(f"DEBUG: Failed to parse line {i+1}: {line[:100]}...")
-            
-            print(f"DEBUG: Total lines: {len(lines)}, Parsed: {parsed_count}, Logs: {len(logs)}")
-            # 키워드(패턴) 검색
-            if keyword:
-                pattern_results = search_pattern(logs, keyword)
-            # 시간대별 트래픽 분석
-            chart_data = traffic_by_hour(logs)
-            # 엔드포인트별 통계 분석
-            endpoint_data = endpoint_stats(logs)
-            # 상태코드 분포 분석
-            status_data = status_code_stats(logs)
-            # 느린 요청 상위 10개
-            slowreqs = slow_requests(logs, top_n=10)
-            # 느린 엔드포인트 상위 5개
-            slowest_eps = slowest_endpoints(logs, top_n=5)
-            # 특이 패턴(이상 탐지)
-            anomalies = detect_anomalies(logs)
-            # 자동 개선 방안 제안
-            improvements = suggest_improvements(logs)
-            result = True  # 분석 성공 플래그
+    if request.method == 'POST' and selected_files:
+        file_paths = [os.path.join(LOG_DIR, name) for name in selected_files]
+        window = _time_window(request.form)
+        # 큰 파일은 백그라운드 작업으로 분석하고, 페이지가 진행 상황을 조회하다 끝나면 다시 요청
+        job = _analysis_job(file_paths, window, request.form.get('job_id'))
+        if job is None:
+            # 로그 파일 읽고 컬럼 테이블로 파싱 (집계는 파싱 시 미리 계산되어 캐시와 함께 저장됨)
+            # 시간 구간을 지정하면 시간 인덱스로 그 구간의 바이트만 파싱
+            aggregates, parsed_logs = _load_aggregates(file_paths, window)
+        elif job.status == 'done':
+            parsed_logs = job.result
+            aggregates = _aggregate(parsed_logs)
+            job = None
+        elif job.status == 'error':
+            job_error = job.error
+            job = None
+        # 그 외에는 아직 실행 중 (템플릿이 진행 상황을 조회하다 끝나면 같은 폼을 다시 제출)
+    if aggregates is not None:
+        # 키워드(패턴) 검색 (파일별 검색 인덱스 사용, 첫 페이지만 렌더링하고 나머지는 /analyze/search로 이어서 조회)
+        if keyword:
+            try:
+                row_sets = _search_rows(parsed_logs, keyword, use_regex)
+                pattern_total = sum(len(rows) for rows in row_sets)
+                pattern_results, pattern_cursor = _page_records(parsed_logs, row_sets, (0, -1), _page_size(request.form))
+            except re.error as e:
+                pattern_results = []
+                search_error = f"잘못된 정규식입니다: {e}"
+        # 시간대별 트래픽 분석
+        chart_data = aggregates['traffic_by_hour']
+        # 엔드포인트별 통계 분석
+        endpoint_data = aggregates['endpoint_stats']
+        # 상태코드 분포 분석
+        status_data = aggregates['status_code_stats']
+        # 느린 요청 상위 10개
+        slowreqs = aggregates['slow_requests']
+        # 느린 엔드포인트 상위 5개
+        slowest_eps = aggregates['slowest_endpoints']
+        # 특이 패턴(이상 탐지)
+        anomalies = aggregates['detect_anomalies']
+        # 자동 개선 방안 제안
+        improvements = aggregates['suggest_improvements']
+        # 브라우저에서 그릴 그래프 데이터 (서버는 그래프를 그리지 않음)
+        chart_series = {plot_type: _chart_series(plot_type, aggregates) for plot_type in PLOT_TYPES}
+        result = True  # 분석 성공 플래그
     # 분석 결과와 각종 데이터, 파일 목록을 템플릿에 전달
     return render_template(
         'analyze.html',
         result=result,
         chart_data=chart_data,
         pattern_results=pattern_results,
+        pattern_total=locals().get('pattern_total', 0),
+        pattern_cursor=locals().get('pattern_cursor'),
         keyword=keyword,
+        use_regex=use_regex,
+        search_error=search_error,
         log_files=log_files,
         selected_file=selected_file,
+        selected_files=selected_files,
+        date_from=date_from,
+        date_to=date_to,
+        time_from=time_from,
+        time_to=time_to,
         endpoint_data=locals().get('endpoint_data'),
         status_data=locals().get('status_data'),
         slowreqs=locals().get('slowreqs'),
         slowest_eps=locals().get('slowest_eps'),
         anomalies=locals().get('anomalies'),
-        improvements=locals().get('improvements')
+        improvements=locals().get('improvements'),
+        chart_series=locals().get('chart_series'),
+        job=job.snapshot() if job is not None else None,
+        job_error=job_error
     )
 
-@bp.route('/analyze/plot/<plot_type>')
-def plot_image(plot_type):
-    try:
-        # 분석 결과를 그래프로 그려 PNG 이미지로 반환하는 라우트
-        logfile = request.args.get('logfile')  # 쿼리스트링에서 파일명 받기
-        print(f"DEBUG: Plot request - type: {plot_type}, logfile: {logfile}")  # 디버깅
-        
-        if not logfile:
-            print("DEBUG: No logfile provided")
-            return '', 404  # 파일명 없으면 404
-        
+# 상태코드 계열별 색상 (2xx 초록, 4xx 주황, 5xx 빨강, 그 외 회색)
+_STATUS_COLORS = {'2': '#198754', '4': '#fd7e14', '5': '#dc3545'}
 
-            
-        file_path = os.path.join(LOG_DIR, logfile)
-        if not os.path.exists(file_path):
-            print(f"DEBUG: File not found - {file_path}")
-            return '', 404  # 파일 없으면 404
-            
-        # 로그 파일 읽고 파싱
-        with open(file_path, encoding='utf-8') as f:
-            lines = f.read().splitlines()
-        
-        # 로그 형식 자동 감지 (처음 20줄 사용)
-        sample_lines = [line for line in lines[:20] if line.strip()]
-        detected_format = detect_log_format(sample_lines)
-        
-        # 로그 파싱
-        logs = []
-        for line in lines:
-            if line.strip():
-                # 감지된 형식으로 직접 파싱
-                if detected_format:
-                    log_entry = parse_log_line(line, detected_format)
-                else:
-                    log_entry = parse_log_line(line, 'standard')
-                
-                if log_entry:
-                    logs.append(log_entry)
-        
-        print(f"DEBUG: Parsed {len(logs)} valid log entries")  # 디버깅
-        
-        buf = io.BytesIO()  # 이미지 임시 저장 버퍼
-        
-        # matplotlib 설정 초기화
-        plt.rcParams['figure.figsize'] = (12, 6)
-        plt.rcParams['font.size'] = 10
-        plt.rcParams['axes.unicode_minus'] = False
-        
+def _hour_label(hour):
+    # 시간 라벨을 더 간단하게 표시 (HH:MM 형식): "2025-06-10 09:00" -> "09:00"
+    return hour.split(' ')[1] if ' ' in hour else hour
+
+def _endpoint_label(url):
+    # 엔드포인트 이름을 간단하게 표시 (마지막 경로 조각)
+    parts = url.split('/')
+    if parts[-1]:
+        return parts[-1]
+    if len(parts) > 1:
+        return parts[-2]
+    return url
+
+def _chart_series(plot_type, aggregates):
+    """
+    그래프 한 개의 데이터 시리즈 (브라우저 차트, JSON API, PNG 내보내기가 같이 사용)
+
+    - traffic: 시간대 라벨(labels, hours)과 요청 수(values)
+    - endpoint: 평균 응답시간 상위 20개 엔드포인트의 라벨(labels, urls), avg_time, p50/p95/p99
+    - status: 상태코드(labels), 건수(values), 색상(colors)
+
+    지원하지 않는 종류면 None을 반환합니다.
+    """
+    if plot_type == 'traffic':
+        data = aggregates['traffic_by_hour']
+        return {
+            'labels': [_hour_label(hour) for hour, _ in data],
+            'hours': [hour for hour, _ in data],
+            'values': [count for _, count in data],
+        }
+    if plot_type == 'endpoint':
+        # 상위 20개만 표시 (너무 많으면 그래프가 복잡해짐)
+        stats = sorted(aggregates['endpoint_stats'], key=lambda x: x['avg_time'], reverse=True)[:20]
+        series = {
+            'labels': [_endpoint_label(s['url']) for s in stats],
+            'urls': [s['url'] for s in stats],
+            'avg_time': [s['avg_time'] for s in stats],
+        }
+        if stats and 'p50' in stats[0]:
+            for name in ('p50', 'p95', 'p99'):
+                series[name] = [s[name] for s in stats]
+        return series
+    if plot_type == 'status':
+        counter = aggregates['status_code_stats']['code_counter']
+        return {
+            'labels': list(counter.keys()),
+            'values': list(counter.values()),
+            'colors': [_STATUS_COLORS.get(code[:1], '#6c757d') for code in counter],
+        }
+    return None
+
+def _render_plot(plot_type, aggregates, theme='light'):
+    """집계 결과로 그래프를 그려 PNG 바이트를 반환합니다 (내보내기용, 지원하지 않는 종류면 None)."""
+    series = _chart_series(plot_type, aggregates)
+    if series is None:
+        return None
+    plt = _pyplot()
+    buf = io.BytesIO()  # 이미지 임시 저장 버퍼
+    
+    # matplotlib 설정 초기화
+    plt.rcParams['figure.figsize'] = (12, 6)
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['axes.unicode_minus'] = False
+    
+    # 테마별 스타일 (야간 모드는 어두운 배경)
+    with plt.style.context('dark_background' if theme == 'dark' else 'default'):
         fig, ax = plt.subplots(figsize=(12, 6))
-        plt.style.use('default')  # 기본 스타일 사용
         
         # 그래프 종류별 분기
         if plot_type == 'traffic':
             # 시간대별 트래픽 (Line Chart)
-            data = traffic_by_hour(logs)
-            print(f"DEBUG: Traffic data - {len(data)} points")  # 디버깅
-            if data:
-                x = [d[0] for d in data]
-                y = [d[1] for d in data]
-                
-                # 시간 라벨을 더 간단하게 표시 (HH:MM 형식)
-                x_labels = []
-                for hour in x:
-                    if ' ' in hour:
-                        # "2025-06-10 09:00" -> "09:00"
-                        time_part = hour.split(' ')[1]
-                        x_labels.append(time_part)
-                    else:
-                        x_labels.append(hour)
-                
+            x_labels, y = series['labels'], series['values']
+            current_app.logger.debug("Traffic data - %d points", len(y))
+            if y:
                 # 데이터 포인트가 적을 때는 더 큰 마커와 선 사용
-                marker_size = 8 if len(data) <= 5 else 6
-                line_width = 3 if len(data) <= 5 else 2
+                marker_size = 8 if len(y) <= 5 else 6
+                line_width = 3 if len(y) <= 5 else 2
                 
-                ax.plot(range(len(x)), y, marker='o', linewidth=line_width, markersize=marker_size, color='#0d6efd')
-                ax.fill_between(range(len(x)), y, alpha=0.3, color='#0d6efd')
+                ax.plot(range(len(y)), y, marker='o', linewidth=line_width, markersize=marker_size, color='#0d6efd')
+                ax.fill_between(range(len(y)), y, alpha=0.3, color='#0d6efd')
                 
                 # 제목에 데이터 범위 표시
-                if len(data) == 1:
+                if len(y) == 1:
                     title = f'Traffic at {x_labels[0]}'
                 else:
                     title = f'Traffic from {x_labels[0]} to {x_labels[-1]}'
@@ -181,7 +857,7 @@ def plot_image(plot_type):
                 ax.set_title(title, fontsize=16, fontweight='bold', pad=30)
                 ax.set_xlabel('Time', fontsize=12)
                 ax.set_ylabel('Number of Requests', fontsize=12)
-                ax.set_xticks(range(len(x)))
+                ax.set_xticks(range(len(y)))
                 ax.set_xticklabels(x_labels, rotation=45, ha='right')
                 ax.grid(True, alpha=0.3)
                 
@@ -196,30 +872,19 @@ def plot_image(plot_type):
                 plt.subplots_adjust(top=0.9)
         elif plot_type == 'endpoint':
             # 엔드포인트별 평균 응답시간 (Bar Chart)
-            stats = endpoint_stats(logs)
-            print(f"DEBUG: Endpoint data - {len(stats)} endpoints")  # 디버깅
-            if stats:
-                # 상위 20개만 표시 (너무 많으면 그래프가 복잡해짐)
-                stats = sorted(stats, key=lambda x: x['avg_time'], reverse=True)[:20]
-                x = [s['url'] for s in stats]
-                y = [s['avg_time'] for s in stats]
-                
-                # 엔드포인트 이름을 간단하게 표시
-                x_labels = []
-                for url in x:
-                    parts = url.split('/')
-                    if parts[-1]:
-                        x_labels.append(parts[-1])
-                    elif len(parts) > 1:
-                        x_labels.append(parts[-2])
-                    else:
-                        x_labels.append(url)
-                
-                bars = ax.bar(range(len(x)), y, color='#198754', alpha=0.7, edgecolor='#0f5132', linewidth=1)
-                ax.set_title('Average Response Time by Endpoint (Top 20)', fontsize=16, fontweight='bold', pad=30)
+            x_labels, y = series['labels'], series['avg_time']
+            current_app.logger.debug("Endpoint data - %d endpoints", len(y))
+            if y:
+                bars = ax.bar(range(len(y)), y, color='#198754', alpha=0.7, edgecolor='#0f5132', linewidth=1, label='avg')
+                # 분위수(p50/p95/p99)는 막대 위에 점으로 표시
+                if 'p50' in series:
+                    for name, color in (('p50', '#0d6efd'), ('p95', '#fd7e14'), ('p99', '#dc3545')):
+                        ax.plot(range(len(y)), series[name], 'o', color=color, markersize=6, label=name)
+                    ax.legend(loc='upper right')
+                ax.set_title('Response Time by Endpoint (Top 20)', fontsize=16, fontweight='bold', pad=30)
                 ax.set_xlabel('Endpoint', fontsize=12)
-                ax.set_ylabel('Average Response Time (ms)', fontsize=12)
-                ax.set_xticks(range(len(x)))
+                ax.set_ylabel('Response Time (ms)', fontsize=12)
+                ax.set_xticks(range(len(y)))
                 ax.set_xticklabels(x_labels, rotation=45, ha='right')
                 ax.grid(True, alpha=0.3, axis='y')
                 
@@ -234,108 +899,144 @@ def plot_image(plot_type):
                 plt.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=plt.gca().transAxes, fontsize=14)
                 plt.title('Average Response Time by Endpoint', fontsize=16, fontweight='bold', pad=30)
                 plt.subplots_adjust(top=0.9)
-        elif plot_type == 'status':
+        else:
             # 상태 코드 분포 (Pie Chart)
-            from collections import Counter
-            codes = [log['status'] for log in logs]
-            counter = Counter(codes)
-            if counter:
-                labels = list(counter.keys())
-                sizes = list(counter.values())
-                
-                # 색상 설정 (상태 코드별로 다른 색상)
-                colors = []
-                for code in labels:
-                    if code.startswith('2'):
-                        colors.append('#198754')  # 성공 - 초록
-                    elif code.startswith('4'):
-                        colors.append('#fd7e14')  # 클라이언트 에러 - 주황
-                    elif code.startswith('5'):
-                        colors.append('#dc3545')  # 서버 에러 - 빨강
-                    else:
-                        colors.append('#6c757d')  # 기타 - 회색
-                
-                ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, 
-                       colors=colors, explode=[0.05]*len(sizes), shadow=True)
+            sizes = series['values']
+            if sizes:
+                ax.pie(sizes, labels=series['labels'], autopct='%1.1f%%', startangle=90, 
+                       colors=series['colors'], explode=[0.05]*len(sizes), shadow=True)
                 ax.set_title('Status Code Distribution', fontsize=16, fontweight='bold', pad=30)
                 plt.subplots_adjust(top=0.9)
             else:
                 plt.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=plt.gca().transAxes, fontsize=14)
                 plt.title('Status Code Distribution', fontsize=16, fontweight='bold', pad=30)
                 plt.subplots_adjust(top=0.9)
-        else:
-            # 지원하지 않는 plot_type
-            return '', 404
             
-        # 그래프를 PNG로 저장 후 응답
+        # 그래프를 PNG로 저장
         fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
+    plt.close(fig)
+    return buf.getvalue()
+
+@bp.route('/analyze/plot/<plot_type>')
+def plot_image(plot_type):
+    try:
+        # 분석 결과를 그래프로 그려 PNG 이미지로 반환하는 라우트
+        logfiles = request.args.getlist('logfile')  # 쿼리스트링에서 파일명 받기 (여러 개면 합산)
+        current_app.logger.debug("Plot request - type: %s, logfile: %s", plot_type, logfiles)
+        
+        if not logfiles:
+            current_app.logger.debug("No logfile provided")
+            return '', 404  # 파일명 없으면 404
+        if plot_type not in PLOT_TYPES:
+            return '', 404  # 지원하지 않는 plot_type
+        
+        names = _requested_files(request.args)
+        if not names:
+            return '', 404  # 로그 디렉토리 목록에 없는 파일이면 404
+        file_paths = [os.path.join(LOG_DIR, name) for name in names]
         
-        response = send_file(buf, mimetype='image/png')
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
+        window = _time_window(request.args)
+        theme = 'dark' if request.args.get('theme') == 'dark' else 'light'
+        key = _plot_key(file_paths, plot_type, window, theme)
+        last_modified = max(os.path.getmtime(file_path) for file_path in file_paths)
+        
+        # 브라우저가 이미 같은 이미지를 가지고 있으면 그리지 않고 304
+        response = Response(mimetype='image/png')
+        _set_plot_headers(response, key, last_modified)
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+        
+        cache = _plot_cache()
+        png = cache.get(key) if cache is not None else None
+        if png is None:
+            # 로그 파일 파싱 결과의 미리 계산된 집계 사용 (여러 파일이면 병합)
+            aggregates, _ = _load_aggregates(file_paths, window)
+            png = _render_plot(plot_type, aggregates, theme)
+            if cache is not None:
+                cache.put(key, png)
+        
+        response = Response(png, mimetype='image/png')
+        _set_plot_headers(response, key, last_modified)
         return response
         
     except Exception as e:
-        print(f"DEBUG: Error generating plot - {e}")  # 디버깅
+        current_app.logger.debug("Error generating plot - %s", e, exc_info=True)
         return '', 500
 
-@bp.route('/errors/<logfile>')
-def show_errors(logfile):
-    # 에러 로그를 보여주는 라우트
-    file_path = os.path.join(LOG_DIR, logfile)
-    if not os.path.exists(file_path):
-        return '', 404
-    
-    # 로그 파일 읽고 파싱
-    with open(file_path, encoding='utf-8') as f:
-        lines = f.read().splitlines()
+@bp.route('/analyze/data/<plot_type>')
+def chart_data(plot_type):
+    # 그래프 데이터 시리즈를 JSON으로 반환하는 라우트 (브라우저에서 차트를 그림, 인자는 plot_image와 같음)
+    logfiles = request.args.getlist('logfile')
+    if not logfiles or plot_type not in PLOT_TYPES:
+        return jsonify({'error': 'not found'}), 404
+    names = _requested_files(request.args)
+    if not names:
+        return jsonify({'error': 'not found'}), 404
+    file_paths = [os.path.join(LOG_DIR, name) for name in names]
     
-    # 로그 형식 자동 감지 (처음 20줄 사용)
-    sample_lines = [line for line in lines[:20] if line.strip()]
-    detected_format = detect_log_format(sample_lines)
+    window = _time_window(request.args)
+    key = _plot_key(file_paths, f'data:{plot_type}', window, None)
+    last_modified = max(os.path.getmtime(file_path) for file_path in file_paths)
     
-    # 로그 파싱
-    logs = []
-    for line in lines:
-        if line.strip():
-            # 감지된 형식으로 직접 파싱
-            if detected_format:
-                log_entry = parse_log_line(line, detected_format)
-            else:
-                log_entry = parse_log_line(line, 'standard')
-            
-            if log_entry:
-                logs.append(log_entry)
+    # 파일이 바뀌지 않았으면 집계도 읽지 않고 304
+    response = Response(mimetype='application/json')
+    _set_plot_headers(response, key, last_modified)
+    response.make_conditional(request)
+    if response.status_code == 304:
+        return response
     
-    # 4xx, 5xx 에러만 필터링
-    error_logs = [log for log in logs if log['status'].startswith('4') or log['status'].startswith('5')]
+    aggregates, _ = _load_aggregates(file_paths, window)
+    response = jsonify(_chart_series(plot_type, aggregates))
+    _set_plot_headers(response, key, last_modified)
+    return response
+
+# 에러 로그 상태 코드 구간 (4xx, 5xx)
+_ERROR_RANGE = (400, 600)
+
+@bp.route('/errors/<logfile>')
+def show_errors(logfile):
+    # 에러 로그를 보여주는 라우트 (상태 코드 필터와 커서로 한 페이지씩, status/cursor/limit 인자)
+    if logfile not in _log_files():
+        return '', 404  # 로그 디렉토리 목록에 없는 파일
+    file_path = os.path.join(LOG_DIR, logfile)
+    try:
+        status_ranges = _status_ranges(request.args.get('status', '')) or [_ERROR_RANGE]
+        cursor = _parse_cursor(request.args.get('cursor', ''))
+    except ValueError:
+        return '', 400
+    # 에러 구간으로 좁힘 (예: status=2xx면 빈 목록)
+    status_ranges = [(max(low, _ERROR_RANGE[0]), min(high, _ERROR_RANGE[1])) for low, high in status_ranges]
+    status_ranges = [(low, high) for low, high in status_ranges if low < high]
     
-    # 에러별로 그룹화
-    error_stats = {}
-    error_4xx_count = 0
-    error_5xx_count = 0
+    # 분석 화면과 같은 파싱 결과/캐시 사용, 상태 코드별 건수는 미리 계산된 집계에서 읽음
+    parsed = _load_parsed(file_path, _time_window(request.args))
+    code_counter = parsed.aggregates['status_code_stats']['code_counter']
+    error_stats = {code: count for code, count in sorted(code_counter.items())
+                   if code.isdigit() and _ERROR_RANGE[0] <= int(code) < _ERROR_RANGE[1]}
+    error_4xx_count = sum(count for code, count in error_stats.items() if code.startswith('4'))
+    error_5xx_count = sum(count for code, count in error_stats.items() if code.startswith('5'))
+    filtered_count = sum(count for code, count in error_stats.items()
+                         if any(low <= int(code) < high for low, high in status_ranges))
     
-    for log in error_logs:
-        status = log['status']
-        if status not in error_stats:
-            error_stats[status] = []
-        error_stats[status].append(log)
-        
-        # 4xx, 5xx 카운트
-        if status.startswith('4'):
-            error_4xx_count += 1
-        elif status.startswith('5'):
-            error_5xx_count += 1
+    # 현재 페이지의 에러 로그만 복원
+    error_logs, next_cursor = [], None
+    if status_ranges:
+        error_logs, next_cursor = _page_records([parsed], [None], cursor, _page_size(request.args), status_ranges)
     
     return render_template(
         'errors.html',
         logfile=logfile,
+        time_from=request.args.get('time_from', ''),
+        time_to=request.args.get('time_to', ''),
+        status_filter=request.args.get('status', ''),
+        limit=request.args.get('limit', type=int),
+        cursor=request.args.get('cursor', ''),
+        next_cursor=next_cursor,
         error_logs=error_logs,
         error_stats=error_stats,
-        total_errors=len(error_logs),
+        filtered_count=filtered_count,
+        total_errors=error_4xx_count + error_5xx_count,
         error_4xx_count=error_4xx_count,
         error_5xx_count=error_5xx_count
-    ) 
\ No newline at end of file
+    )
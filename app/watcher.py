@@ -0,0 +1,218 @@
+import logging
+import lzma
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from .table import NO_TIMESTAMP
+from .utils import MixedFormatParser, detect_log_format, epoch_to_timestamp, is_compressed, open_log_binary
+
+logger = logging.getLogger(__name__)
+
+# 파일을 샘플링할 때 파일 하나만의 문제로 보고 기록하는 예외 (읽기 실패, 잘리거나 손상된 압축 파일)
+SAMPLE_ERRORS = (OSError, EOFError, lzma.LZMAError, ValueError)
+
+# 디렉토리를 다시 훑는 간격 기본값 (초)
+DEFAULT_WATCH_INTERVAL = 10.0
+
+# 미리 분석이 실패한 파일을 다시 시도하기까지 기다리는 시간 (초, 연속으로 실패할 때마다 두 배, 최대 WARM_RETRY_MAX_DELAY)
+WARM_RETRY_DELAY = 30.0
+WARM_RETRY_MAX_DELAY = 3600.0
+
+# 형식, 줄 수, 시간 범위를 추정할 때 읽는 파일 앞/뒤 크기 (바이트)
+WATCH_SAMPLE_SIZE = 64 * 1024
+
+def _sample_lines(data: bytes, partial_head: bool, partial_tail: bool) -> List[str]:
+    # 샘플 바이트를 줄 목록으로 (잘린 앞/뒤 줄은 버림)
+    lines = data.decode('utf-8', errors='replace').splitlines()
+    if partial_head:
+        lines = lines[1:]
+    if partial_tail:
+        lines = lines[:-1]
+    return [line for line in lines if line.strip()]
+
+def _first_timestamp(parser: MixedFormatParser, lines: List[str]) -> Optional[str]:
+    for line in lines:
+        log = parser.parse(line)
+        if log is not None and log.get('timestamp'):
+            return log['timestamp']
+    return None
+
+def sample_file_info(file_path: str, size: int) -> Dict:
+    """
+    파일 앞/뒤 일부만 읽어 로그 형식, 줄 수 추정값, 시간 범위(로그의 현지 시각)를 구합니다.
+
+    파일 전체가 샘플보다 작으면 줄 수는 정확한 값이며, 압축 파일은 풀린 스트림의
+    앞부분만 읽으므로 줄 수와 마지막 시각은 None입니다.
+    """
+    with open_log_binary(file_path) as f:
+        head = f.read(WATCH_SAMPLE_SIZE)
+    whole = len(head) < WATCH_SAMPLE_SIZE
+    head_lines = _sample_lines(head, False, not whole and not head.endswith(b'\n'))
+    log_format = detect_log_format(head_lines[:20])
+    parser = MixedFormatParser(log_format)
+    info = {
+        'format': log_format,
+        'lines': None,
+        'time_from': _first_timestamp(parser, head_lines),
+        'time_to': None,
+    }
+    if whole:
+        info['lines'] = head.count(b'\n') + (1 if head and not head.endswith(b'\n') else 0)
+        info['time_to'] = _first_timestamp(parser, reversed(head_lines))
+    elif not is_compressed(file_path):
+        # 앞부분의 평균 줄 길이로 추정하고, 마지막 시각은 파일 끝부분에서 찾음
+        info['lines'] = round(size * head.count(b'\n') / len(head))
+        with open(file_path, 'rb') as f:
+            f.seek(max(size - WATCH_SAMPLE_SIZE, 0))
+            tail = f.read(WATCH_SAMPLE_SIZE)
+        info['time_to'] = _first_timestamp(parser, reversed(_sample_lines(tail, True, False)))
+    return info
+
+def parsed_file_info(parsed) -> Dict:
+    """파싱 결과(cache.ParsedLog)로 구한 정확한 행 수, 가장 많이 맞은 형식, 시간 범위"""
+    table = parsed.table
+    valid = table.ts != NO_TIMESTAMP
+    local = table.ts[valid] + table.tz[valid]
+    hits = parsed.format_hits
+    return {
+        'rows': len(table),
+        'format': max(hits, key=hits.get) if hits else None,
+        'time_from': epoch_to_timestamp(int(np.min(local))) if len(local) else None,
+        'time_to': epoch_to_timestamp(int(np.max(local))) if len(local) else None,
+    }
+
+class LogDirWatcher:
+    """
+    로그 디렉토리를 os.scandir로 주기적으로 훑어 파일별 메타데이터를 유지하고,
+    새로 생기거나 바뀐 파일을 누가 요청하기 전에 미리 분석해 캐시를 채우는 감시자.
+
+    파일은 (크기, 수정 시각)이 바뀌었을 때만 다시 샘플링합니다. warm은 파일 경로를 받아
+    파싱 결과(cache.ParsedLog)를 만들고 캐시에 넣는 함수이며, 그 결과로 메타데이터를 정확한 값으로 바꿉니다.
+    미리 분석이 실패한 파일은 오류를 기록하고, 실패할 때마다 늘어나는 대기 시간이 지난 뒤의 스캔에서 다시 시도합니다.
+    """
+
+    def __init__(self, directory: str, warm: Optional[Callable[[str], object]] = None):
+        self.directory = directory
+        self.warm = warm
+        self.scans = 0  # 디렉토리를 훑은 횟수
+        self.warmed = 0  # 미리 분석한 파일 수
+        self._files: Dict[str, Dict] = {}  # 파일 이름 -> 메타데이터
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()  # 폴링 스레드와 요청이 동시에 훑지 않도록
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def files(self) -> Dict[str, Dict]:
+        """파일 이름순 메타데이터 (size, mtime, lines, format, time_from, time_to, warm, rows, error, failures, retry_at)"""
+        with self._lock:
+            return {name: dict(self._files[name]) for name in sorted(self._files)}
+
+    def scan(self, warm: bool = True) -> List[str]:
+        """
+        디렉토리를 한 번 훑어 메타데이터를 갱신합니다.
+
+        Args:
+            warm: True면 아직 분석하지 않은 파일을 이어서 미리 분석 (warm 함수가 있을 때)
+
+        Returns:
+            새로 생기거나 바뀐 파일 이름 목록
+        """
+        with self._scan_lock:
+            current = {}
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        current[entry.name] = (stat.st_size, stat.st_mtime)
+            with self._lock:
+                previous = {name: (info['size'], info['mtime']) for name, info in self._files.items()}
+            changed = sorted(name for name, signature in current.items() if previous.get(name) != signature)
+            sampled = {}
+            for name in changed:
+                size, mtime = current[name]
+                info = {'size': size, 'mtime': mtime, 'warm': False, 'rows': None, 'error': None,
+                        'failures': 0, 'retry_at': None}
+                try:
+                    info.update(sample_file_info(os.path.join(self.directory, name), size))
+                except SAMPLE_ERRORS as e:
+                    info.update(format=None, lines=None, time_from=None, time_to=None,
+                                error=str(e) or type(e).__name__)
+                sampled[name] = info
+            with self._lock:
+                for name in set(self._files) - set(current):
+                    del self._files[name]
+                self._files.update(sampled)
+                self.scans += 1
+            if warm and self.warm is not None:
+                self._warm_pending()
+        return changed
+
+    def _warm_pending(self) -> None:
+        # 아직 분석하지 않은 파일을 이름순으로 하나씩 분석 (self._scan_lock을 잡은 상태에서 호출)
+        # 실패한 파일은 다시 시도할 시각(retry_at)이 지난 경우에만 다시 분석
+        now = time.monotonic()
+        with self._lock:
+            pending = [(name, info['size'], info['mtime'], info['failures']) for name, info in self._files.items()
+                       if not info['warm'] and (info['retry_at'] is None or info['retry_at'] <= now)]
+        for name, size, mtime, failures in sorted(pending):
+            if self._stop.is_set():
+                return
+            try:
+                update = parsed_file_info(self.warm(os.path.join(self.directory, name)))
+                update.update(warm=True, error=None, failures=0, retry_at=None)
+            except Exception as e:
+                delay = min(WARM_RETRY_DELAY * 2 ** failures, WARM_RETRY_MAX_DELAY)
+                update = {'error': str(e) or type(e).__name__, 'failures': failures + 1,
+                          'retry_at': time.monotonic() + delay}
+            with self._lock:
+                info = self._files.get(name)
+                # 분석하는 동안 파일이 바뀌었으면 다음 스캔에서 다시 분석
+                if info is not None and (info['size'], info['mtime']) == (size, mtime):
+                    info.update(update)
+                    self.warmed += update.get('warm', False)
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.scan()
+            except OSError:
+                pass  # 디렉토리가 잠시 없거나 읽을 수 없으면 다음 주기에 다시 시도
+            except Exception:
+                # 예상하지 못한 오류로 폴링 스레드가 끝나지 않도록 기록만 하고 다음 주기에 다시 시도
+                logger.exception("Log directory scan failed: %s", self.directory)
+            self._stop.wait(interval)
+
+    def start(self, interval: float = DEFAULT_WATCH_INTERVAL) -> None:
+        """interval초마다 디렉토리를 훑는 데몬 스레드를 시작합니다 (이미 실행 중이면 그대로)."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), name='log-watcher', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """폴링 스레드를 멈춥니다 (진행 중인 파일 분석이 끝날 때까지 최대 timeout초 기다림)."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'directory': self.directory,
+                'running': self.running,
+                'files': len(self._files),
+                'warm': sum(info['warm'] for info in self._files.values()),
+                'scans': self.scans,
+                'warmed': self.warmed,
+            }
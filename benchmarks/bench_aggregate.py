@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+대시보드 집계 벤치마크
+
+analyze.html에 필요한 통계를 레코드 리스트에서 계산하는 시간을 비교합니다.
+- before: 분석 함수를 각각 호출 (함수마다 전체 순회, suggest_improvements는
+          slowest_endpoints/endpoint_stats/status_code_stats를 다시 계산)
+- after : LogAccumulator 한 번 순회 후 results()
+
+사용법:
+    python benchmarks/bench_aggregate.py [레코드 수]
+"""
+
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.utils import (
+    LogAccumulator, traffic_by_hour, endpoint_stats, status_code_stats, slow_requests,
+    slowest_endpoints, detect_anomalies, improvements_from_stats
+)
+
+
+def make_records(n):
+    """여러 엔드포인트/IP/상태 코드가 섞인 합성 레코드"""
+    statuses = ['200', '200', '200', '201', '304', '404', '500']
+    return [{
+        'timestamp': '', 'method': 'GET', 'ip': f'10.0.{i % 13}.{i % 251}', 'url': f'/api/v1/resource{i % 40}',
+        'status': statuses[i % len(statuses)], 'resp_time': (i * 7919) % 1500,
+        'ts': 1748937600 + i, 'tz': 32400
+    } for i in range(n)]
+
+
+def separate(logs):
+    """기존 방식: 함수별 순회 (suggest_improvements(logs)와 같은 재계산 포함)"""
+    return {
+        'traffic_by_hour': traffic_by_hour(logs),
+        'endpoint_stats': endpoint_stats(logs, keep_times=False),
+        'status_code_stats': status_code_stats(logs),
+        'slow_requests': slow_requests(logs, top_n=10),
+        'slowest_endpoints': slowest_endpoints(logs, top_n=5),
+        'detect_anomalies': detect_anomalies(logs),
+        'suggest_improvements': improvements_from_stats(slowest_endpoints(logs, top_n=3), status_code_stats(logs)),
+    }
+
+
+def fused(logs):
+    return LogAccumulator(logs).results()
+
+
+def measure(func, logs):
+    start = time.perf_counter()
+    func(logs)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    logs = make_records(n)
+    before_result, after_result = separate(logs), fused(logs)
+    for key in before_result:
+        if key != 'slowest_endpoints':  # 기존 함수는 응답시간 목록(times)을 함께 반환
+            assert before_result[key] == after_result[key], key
+    print(f"대시보드 집계 벤치마크 ({n:,} records)")
+    print("=" * 50)
+    before = measure(separate, logs)
+    after = measure(fused, logs)
+    print(f"{'before (s)':>12}{'after (s)':>12}{'speedup':>10}")
+    print(f"{before:>12.3f}{after:>12.3f}{before / after:>9.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+스트리밍 파싱 메모리 벤치마크
+
+임시 로그 파일을 만들어 방식별 최대 메모리 사용량(tracemalloc peak)을 비교합니다.
+- read+list : f.read().splitlines() 후 레코드 리스트 생성 (기존 뷰 방식)
+- LogTable  : iter_log_records 스트림을 컬럼 테이블로 적재
+- mmap      : iter_mmap_records(mmap 일괄 매치) 스트림을 컬럼 테이블로 적재
+- streaming : iter_log_records 스트림을 집계 함수가 바로 소비
+
+사용법:
+    python benchmarks/bench_memory.py [라인 수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.utils import get_line_parser, iter_log_records, iter_mmap_records, status_code_stats, traffic_by_hour
+from app.table import LogTable
+
+
+def write_log(path, n):
+    """표준 형식 합성 로그 파일을 생성합니다."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(f"2025-06-03 {(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d} GET 192.168.0.{i % 255} /api/endpoint{i % 100} {('200', '404', '500')[i % 3]} {20 + i % 900}\n")
+
+
+def read_and_list(path):
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    parse_line = get_line_parser('standard')
+    logs = [parse_line(line) for line in lines]
+    traffic_by_hour(logs)
+    return len(logs)
+
+
+def table(path):
+    return len(LogTable.from_records(iter_log_records(path)))
+
+
+def mapped_table(path):
+    return len(LogTable.from_records(iter_mmap_records(path)))
+
+
+def streaming(path):
+    traffic_by_hour(iter_log_records(path))
+    status_code_stats(iter_log_records(path))
+    return 0
+
+
+def measure(func, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.log')
+        write_log(path, n)
+        size = os.path.getsize(path)
+        print(f"스트리밍 메모리 벤치마크 ({n:,} lines, {size / 1e6:.1f} MB)")
+        print("=" * 60)
+        print(f"{'method':<14}{'peak (MB)':>14}{'time (s)':>12}")
+        for name, func in (('read+list', read_and_list), ('LogTable', table), ('mmap', mapped_table), ('streaming', streaming)):
+            peak, elapsed = measure(func, path)
+            print(f"{name:<14}{peak / 1e6:>14,.1f}{elapsed:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
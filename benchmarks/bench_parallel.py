@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+병렬 청크 파싱 벤치마크
+
+합성 로그 파일을 워커 수별로 parse_file_parallel로 파싱해
+처리량(lines/sec)과 1 워커 대비 배율을 측정합니다.
+
+사용법:
+    python benchmarks/bench_parallel.py [라인 수] [청크 크기(MB)]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.parallel import parse_file_parallel
+
+
+def write_log(path, n):
+    """표준 형식 합성 로그 파일을 생성합니다."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(f"2025-06-03 {(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d} GET 192.168.0.{i % 255} /api/endpoint{i % 100} {('200', '404', '500')[i % 3]} {20 + i % 900}\n")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    chunk_size = int(float(sys.argv[2]) * 1024 * 1024) if len(sys.argv) > 2 else 4 * 1024 * 1024
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.log')
+        write_log(path, n)
+        print(f"병렬 파싱 벤치마크 ({n:,} lines, {os.path.getsize(path) / 1e6:.1f} MB, {cores} cores)")
+        print("=" * 60)
+        print(f"{'workers':<10}{'time (s)':>12}{'lines/sec':>14}{'speedup':>10}")
+        base = None
+        for workers in sorted({1, 2, 4, cores}):
+            parse_file_parallel(path, workers=workers, chunk_size=chunk_size)  # 워커 풀 예열
+            start = time.perf_counter()
+            table = parse_file_parallel(path, workers=workers, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            print(f"{workers:<10}{elapsed:>12.2f}{len(table) / elapsed:>14,.0f}{base / elapsed:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+로그 파싱 벤치마크
+
+형식별로 합성 로그 라인을 만들어 초당 파싱 라인 수(lines/sec)를 측정합니다.
+- before: 라인마다 re.compile + 그룹 리스트 순회 (기존 parse_log_line 방식)
+- after : 레지스트리에서 받은 형식 전용 파서 함수 (get_line_parser)
+- mixed : 라인별 형식 예측 혼합 파서 (MixedFormatParser)
+- reader: 파일 전체 파싱 - 라인 단위 리더(iter_log_records) vs mmap 일괄 매치(iter_mmap_records)
+
+사용법:
+    python benchmarks/bench_parse.py [라인 수]
+"""
+
+import os
+import re
+import sys
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.utils import (LOG_PATTERNS, MixedFormatParser, get_line_parser, iter_log_records,
+                       iter_mmap_records, normalize_timestamp)
+
+
+def make_lines(format_type, n):
+    """형식별 합성 로그 라인을 n개 생성합니다."""
+    lines = []
+    for i in range(n):
+        h, m, s = (i // 3600) % 24, (i // 60) % 60, i % 60
+        url = f"/api/endpoint{i % 50}"
+        status = ('200', '201', '404', '500')[i % 4]
+        resp_time = 20 + (i % 500)
+        if format_type == 'standard':
+            lines.append(f"2025-06-03 {h:02d}:{m:02d}:{s:02d} GET 192.168.0.{i % 255} {url} {status} {resp_time}")
+        elif format_type == 'apache_format':
+            lines.append(f'192.168.0.{i % 255} - - [03/Jun/2025:{h:02d}:{m:02d}:{s:02d} +0900] "GET {url} HTTP/1.1" {status} {resp_time}')
+        elif format_type == 'app_log_format':
+            lines.append(f"[INFO] 2025-06-10 {h:02d}:{m:02d}:{s:02d}.123 - Client 10.0.1.{i % 255} requested GET {url} with status {status} (response time: {resp_time}ms)")
+        elif format_type == 'mixed':
+            # 애플리케이션 로그 3줄마다 시스템 로그 1줄
+            if i % 4 == 3:
+                lines.append(f"[ERROR] 2025-06-10 {h:02d}:{m:02d}:{s:02d}.890 - Database connection failed: timeout after 30 seconds")
+            else:
+                lines.append(f"[INFO] 2025-06-10 {h:02d}:{m:02d}:{s:02d}.123 - Client 10.0.1.{i % 255} requested GET {url} with status {status} (response time: {resp_time}ms)")
+    return lines
+
+
+def legacy_parse_log_line(line, format_type):
+    """기존 구현과 동일하게 라인마다 패턴을 컴파일하고 그룹을 순회하는 파서"""
+    if not line.strip():
+        return None
+    format_info = LOG_PATTERNS[format_type]
+    pattern = re.compile(format_info['pattern'])
+    match = pattern.match(line.strip())
+    if not match:
+        return None
+    groups = match.groups()
+    log_data = {}
+    for i, group_name in enumerate(format_info['groups']):
+        if i < len(groups):
+            log_data[group_name] = groups[i]
+    if 'timestamp' in log_data:
+        log_data['timestamp'] = normalize_timestamp(log_data['timestamp'], format_type)
+    if 'resp_time' in log_data:
+        log_data['resp_time'] = int(log_data['resp_time'])
+    if 'ip' not in log_data:
+        log_data['ip'] = '0.0.0.0'
+    return log_data
+
+
+def measure(func, lines):
+    """func로 모든 라인을 파싱하는 데 걸린 시간을 초당 라인 수로 반환합니다."""
+    start = time.perf_counter()
+    for line in lines:
+        func(line)
+    elapsed = time.perf_counter() - start
+    return len(lines) / elapsed if elapsed else float('inf')
+
+
+def measure_reader(reader, path, n):
+    """reader로 파일 전체를 파싱하는 데 걸린 시간을 초당 라인 수로 반환합니다."""
+    start = time.perf_counter()
+    for _ in reader(path):
+        pass
+    elapsed = time.perf_counter() - start
+    return n / elapsed if elapsed else float('inf')
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"로그 파싱 벤치마크 ({n:,} lines)")
+    print("=" * 60)
+    print(f"{'format':<16}{'before (l/s)':>14}{'after (l/s)':>14}{'speedup':>10}")
+    for format_type in ('standard', 'apache_format', 'app_log_format'):
+        lines = make_lines(format_type, n)
+        before = measure(lambda line: legacy_parse_log_line(line, format_type), lines)
+        after = measure(get_line_parser(format_type), lines)
+        print(f"{format_type:<16}{before:>14,.0f}{after:>14,.0f}{after / before:>9.2f}x")
+    
+    print()
+    print(f"{'mixed parser':<16}{'lines/sec':>14}{'parsed':>14}")
+    for format_type in ('standard', 'app_log_format', 'mixed'):
+        lines = make_lines(format_type, n)
+        parser = MixedFormatParser()
+        rate = measure(parser, lines)
+        parsed = sum(1 for line in lines if parser(line) is not None)
+        print(f"{format_type:<16}{rate:>14,.0f}{parsed:>14,}")
+    
+    print()
+    print(f"{'file reader':<16}{'lines (l/s)':>14}{'mmap (l/s)':>14}{'speedup':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for format_type in ('standard', 'apache_format', 'app_log_format', 'mixed'):
+            path = os.path.join(tmp, f'{format_type}.log')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(make_lines(format_type, n)) + '\n')
+            lines = measure_reader(iter_log_records, path, n)
+            mapped = measure_reader(iter_mmap_records, path, n)
+            print(f"{format_type:<16}{lines:>14,.0f}{mapped:>14,.0f}{mapped / lines:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+키워드 검색 벤치마크
+
+분석 페이지의 패턴 검색 시간을 비교합니다.
+- before: LogTable.search (질의마다 사전 전체를 비교하고 행 수만큼 마스크 생성)
+- after : SearchIndex.search (trigram으로 사전 후보를 줄이고 포스팅 목록으로 행을 모음)
+- cached: 같은 질의 반복 (LRU 결과 캐시)
+
+결과 행을 딕셔너리로 복원하는 시간은 두 방식이 같으므로 행 인덱스까지만 잽니다.
+
+사용법:
+    python benchmarks/bench_search.py [행 수]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.search import SearchIndex
+from app.table import LogTable
+
+QUERIES = [('/api/v1/resource17', False), ('10.0.3.', False), ('404', False), ('delete', False),
+           (r'^/api/v2/resource1\d/detail$', True)]
+
+
+def make_table(n):
+    """엔드포인트 2,000개, IP 50,000개를 가진 합성 테이블"""
+    rng = np.random.default_rng(0)
+    urls = [f'/api/v{i % 3}/resource{i}/{"detail" if i % 2 else "list"}' for i in range(2000)]
+    ips = [f'10.{i % 7}.{i // 256 % 256}.{i % 256}' for i in range(50000)]
+    statuses = np.array([200, 200, 200, 201, 304, 404, 500], dtype=np.int16)
+    return LogTable(
+        ts=np.arange(n, dtype=np.int64) + 1748937600, tz=np.zeros(n, dtype=np.int32),
+        status=statuses[rng.integers(0, len(statuses), n)], resp_time=rng.integers(0, 1500, n).astype(np.int32),
+        url=rng.zipf(1.3, n).astype(np.int32) % len(urls), ip=rng.integers(0, len(ips), n).astype(np.int32),
+        method=rng.integers(0, 3, n).astype(np.int8), urls=urls, ips=ips, methods=['GET', 'POST', 'DELETE'],
+    )
+
+
+def table_scan(table, keyword):
+    """before: LogTable.search와 같은 마스크 계산 (레코드 복원 제외)"""
+    keyword = keyword.lower()
+    url_hit = np.array([keyword in u.lower() for u in table.urls], dtype=bool)
+    ip_hit = np.array([keyword in ip.lower() for ip in table.ips], dtype=bool)
+    method_hit = np.array([keyword in m.lower() for m in table.methods], dtype=bool)
+    mask = url_hit[table.url] | ip_hit[table.ip] | method_hit[table.method]
+    for code in np.unique(table.status):
+        if keyword in str(int(code)):
+            mask |= table.status == code
+    return np.flatnonzero(mask)
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    table = make_table(n)
+    build, index = measure(SearchIndex, table)
+    print(f"검색 벤치마크 ({n:,} rows, 인덱스 생성 {build:.2f}s, 포스팅 {index.nbytes / 1e6:.0f} MB)")
+    print("=" * 78)
+    print(f"{'query':<34}{'rows':>10}{'before (ms)':>12}{'after (ms)':>12}{'cached (ms)':>12}")
+    for query, regex in QUERIES:
+        before = None
+        if not regex:
+            before, expected = measure(table_scan, table, query)
+        after, rows = measure(index.search, query, regex)
+        cached, _ = measure(index.search, query, regex)
+        if not regex:
+            assert rows.tolist() == expected.tolist(), query
+        before_text = f"{before * 1000:>12.1f}" if before is not None else f"{'-':>12}"
+        print(f"{query:<34}{len(rows):>10,}{before_text}{after * 1000:>12.1f}{cached * 1000:>12.3f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+앱 시작 벤치마크
+
+새 인터프리터에서 `import app` + `create_app()`까지 걸린 시간과 그 시점의 메모리(RSS)를 잽니다.
+워커를 새로 띄울 때마다 드는 비용입니다 (백그라운드 미리 분석이 측정에 섞이지 않도록 로그 디렉토리 감시는 끔).
+- before: 예전처럼 matplotlib.pyplot, seaborn을 먼저 불러온 뒤 앱 생성
+- after : 현재 앱 (그래프 라이브러리는 PNG 내보내기를 처음 요청할 때 불러옴)
+
+실행마다 운영체제 파일 캐시 상태가 달라지므로 여러 번 실행해 중앙값을 보여줍니다.
+
+사용법:
+    python benchmarks/bench_startup.py [반복 횟수]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# 프로젝트 루트 (자식 인터프리터의 작업 디렉토리)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 인터프리터에서 실행할 코드 ({preload}는 before에서만 채움)
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+{preload}
+import app
+app.create_app({{'LOG_WATCH_INTERVAL': 0}})
+elapsed = time.perf_counter() - start
+rss = 0
+with open('/proc/self/status') as f:
+    for line in f:
+        if line.startswith('VmRSS:'):
+            rss = int(line.split()[1]) * 1024
+loaded = [name for name in ('matplotlib', 'seaborn', 'pandas') if name in sys.modules]
+print(json.dumps({{'seconds': elapsed, 'rss': rss, 'loaded': loaded}}))
+"""
+
+PRELOAD = """
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot
+try:
+    import seaborn
+except ImportError:
+    pass
+"""
+
+
+def run(preload):
+    output = subprocess.run([sys.executable, '-c', CHILD.format(preload=preload)], cwd=project_root,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"앱 시작 벤치마크 (import app + create_app, {repeat}회 중앙값)")
+    print("=" * 78)
+    print(f"{'mode':<10}{'startup (ms)':>14}{'RSS (MB)':>12}  loaded")
+    for mode, preload in (('before', PRELOAD), ('after', '')):
+        results = [run(preload) for _ in range(repeat)]
+        seconds = statistics.median(result['seconds'] for result in results)
+        rss = statistics.median(result['rss'] for result in results)
+        loaded = ', '.join(results[-1]['loaded']) or '-'
+        print(f"{mode:<10}{seconds * 1000:>14.0f}{rss / 1e6:>12.1f}  {loaded}")
+
+if __name__ == '__main__':
+    main()
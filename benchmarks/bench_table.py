@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+컬럼 테이블(LogTable) 벤치마크
+
+합성 레코드로 리스트-딕셔너리 방식과 LogTable 방식의
+메모리 사용량과 전체 대시보드 집계 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_table.py [레코드 수]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app import utils
+from app.table import LogTable
+
+
+def make_records(n):
+    """합성 로그 레코드 n개를 생성합니다 (리스트-딕셔너리 방식과 같은 형태)."""
+    for i in range(n):
+        yield {
+            'timestamp': f"2025-06-03 {(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d}",
+            'method': ('GET', 'POST', 'PUT', 'DELETE')[i % 4],
+            'ip': f"192.168.{(i // 255) % 255}.{i % 255}",
+            'url': f"/api/endpoint{i % 200}",
+            'status': ('200', '201', '404', '500')[i % 7 % 4],
+            'resp_time': 20 + (i * 7919) % 1500,
+        }
+
+
+def dashboard_dicts(logs):
+    utils.traffic_by_hour(logs)
+    utils.endpoint_stats(logs)
+    utils.status_code_stats(logs)
+    utils.slow_requests(logs, top_n=10)
+    utils.slowest_endpoints(logs, top_n=5)
+    utils.detect_anomalies(logs)
+    utils.suggest_improvements(logs)
+
+
+def dashboard_table(table):
+    table.traffic_by_hour()
+    table.endpoint_stats()
+    table.status_code_stats()
+    table.slow_requests(top_n=10)
+    table.slowest_endpoints(top_n=5)
+    table.detect_anomalies()
+    table.suggest_improvements()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"LogTable 벤치마크 ({n:,} records)")
+    print("=" * 60)
+
+    tracemalloc.start()
+    logs = list(make_records(n))
+    dict_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    dashboard_dicts(logs)
+    dict_time = time.perf_counter() - start
+    del logs
+
+    tracemalloc.start()
+    table = LogTable.from_records(make_records(n))
+    table_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    dashboard_table(table)
+    table_time = time.perf_counter() - start
+
+    print(f"{'':<14}{'memory (MB)':>14}{'aggregate (s)':>16}")
+    print(f"{'list of dicts':<14}{dict_mem / 1e6:>14,.1f}{dict_time:>16.3f}")
+    print(f"{'LogTable':<14}{table_mem / 1e6:>14,.1f}{table_time:>16.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -99,11 +99,11 @@ def main():
     if len(sys.argv) > 1:
         # 특정 테스트 실행
         test_name = sys.argv[1]
-        if test_name in ['test_utils', 'test_views', 'test_integration']:
+        if test_name in ['test_utils', 'test_table', 'test_parallel', 'test_cache', 'test_sketch', 'test_search', 'test_timeindex', 'test_jobs', 'test_watcher', 'test_views', 'test_integration']:
             return run_specific_test(test_name)
         else:
             print(f"❌ 알 수 없는 테스트: {test_name}")
-            print("사용 가능한 테스트: test_utils, test_views, test_integration")
+            print("사용 가능한 테스트: test_utils, test_table, test_parallel, test_cache, test_sketch, test_search, test_timeindex, test_jobs, test_watcher, test_views, test_integration")
             return 1
     else:
         # 모든 테스트 실행
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+cache 모듈 테스트 스위트
+
+이 모듈은 app.cache의 파싱 결과 디스크 캐시를 테스트합니다.
+- 파일 지문 (크기, 수정 시각, 앞/뒤 바이트)
+- .npz 저장/복원 결과가 파싱 결과와 같은지 확인
+- 같은 경로의 이전 항목 정리와 크기 기반 제거
+- 체크포인트 기반 증분 파싱 (덧붙이기, 잘림/로테이션 감지)
+- 덧붙은 행만으로 갱신하는 부분 상태/검색 인덱스와 증분 캐시 항목
+"""
+
+import sys
+import os
+import tempfile
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app import cache as cache_module
+from app.cache import ParsedCache, combine_parsed, compute_aggregates, file_fingerprint, load_parsed_log, load_parsed_logs
+from app.parallel import parse_file_parallel
+from app.search import SearchIndex
+from app.table import LogTable
+from app.utils import LogAccumulator
+
+def _write_log(path, n=100, start=0):
+    with open(path, 'a', encoding='utf-8') as f:
+        for i in range(start, start + n):
+            status = ['200', '404', '500'][i % 3]
+            f.write(f"2025-06-03 {i % 24:02d}:{i % 60:02d}:00 GET 192.168.1.{i % 7} /api/endpoint{i % 10} {status} {50 + i}\n")
+
+def _entries(cache):
+    # 컬럼 캐시 항목 (.npz) 이름 (경로별 시간 인덱스 .tidx 제외)
+    return sorted(name for name in os.listdir(cache.directory) if name.endswith('.npz'))
+
+# 파일 지문 테스트
+def test_file_fingerprint_changes_with_content():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        first = file_fingerprint(path)
+        assert file_fingerprint(path) == first
+        _write_log(path, n=1, start=100)
+        assert file_fingerprint(path) != first
+
+# 저장/복원 테스트
+def test_load_parsed_log_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        parsed = load_parsed_log(path, cache, workers=1)
+        assert len(_entries(cache)) == 1
+
+        cached = cache.load(path)
+        assert cached is not None
+        assert cached.table.records() == parsed.table.records()
+        assert cached.aggregates == parsed.aggregates == compute_aggregates(parse_file_parallel(path, workers=1))
+        assert cached.format_hits == {'standard': 100}
+
+        # 파일 뒤에 덧붙으면 덧붙은 행만 증분 항목으로 저장하고 이전 항목은 기반 항목으로 남김
+        _write_log(path, n=5, start=100)
+        assert cache.load(path) is None
+        assert len(load_parsed_log(path, cache, workers=1).table) == 105
+        assert len(_entries(cache)) == 2
+        assert cache.load(path).table.records() == parse_file_parallel(path, workers=1).records()
+
+# 손상된 캐시 항목 테스트
+def test_corrupt_entry_is_ignored():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        load_parsed_log(path, cache, workers=1)
+        entry = os.path.join(cache.directory, _entries(cache)[0])
+        with open(entry, 'wb') as f:
+            f.write(b'not a zip file')
+        assert cache.load(path) is None
+        assert len(load_parsed_log(path, cache, workers=1).table) == 100
+
+# 크기 기반 제거 테스트
+def test_eviction_keeps_cache_under_budget():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        paths = []
+        for i in range(3):
+            path = os.path.join(tmp, f'app{i}.log')
+            _write_log(path)
+            load_parsed_log(path, cache, workers=1)
+            paths.append(path)
+        entry_size = max(os.path.getsize(os.path.join(cache.directory, name)) for name in _entries(cache))
+
+        cache.max_bytes = entry_size * 2
+        os.utime(os.path.join(cache.directory, _entries(cache)[0]), (0, 0))
+        cache.evict()
+        assert len(_entries(cache)) == 2
+        assert sum(cache.load(path) is not None for path in paths) == 2
+
+# 증분 파싱 테스트
+def test_appended_bytes_are_parsed_incrementally(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("2025-06-03 23:59:00 GET 10.0.0.1 /api/partial")  # 아직 쓰는 중인 라인
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        parsed = load_parsed_log(path, cache, workers=1)
+        assert len(parsed.table) == 100
+        assert parsed.checkpoint['rows'] == 100
+
+        ranges = []
+        original = cache_module.parse_files_indexed
+        def recording(jobs, workers=None, chunk_size=None, progress=None):
+            ranges.extend((start, end) for _, start, end in jobs)
+            return original(jobs, workers, chunk_size, progress)
+        monkeypatch.setattr(cache_module, 'parse_files_indexed', recording)
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(" 200 70\n")
+        _write_log(path, n=20, start=100)
+        incremental = load_parsed_log(path, cache, workers=1)
+        assert ranges[0][0] == parsed.checkpoint['offset'] > 0
+        assert len(incremental.table) == 121
+
+        full = parse_file_parallel(path, workers=1)
+        assert incremental.table.records() == full.records()
+        assert incremental.aggregates == compute_aggregates(full)
+        assert len(_entries(cache)) == 2
+        assert cache.load(path).table.records() == full.records()
+
+# 증분 갱신 비용 테스트
+def test_refresh_merges_state_without_recomputing_old_rows(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        load_parsed_log(path, cache, workers=1, exact_max_rows=10)  # 스케치 분위수 모드
+
+        # 전체 집계, 부분 상태, 포스팅 정렬이 어느 행 수에 대해 일어나는지 기록
+        calls = []
+        original_aggregates = cache_module.compute_aggregates
+        def recording_aggregates(table, relative_error=None):
+            calls.append(('aggregates', len(table)))
+            return original_aggregates(table, relative_error)
+        original_accumulate = LogTable.accumulate
+        def recording_accumulate(self, *args, **kwargs):
+            calls.append(('accumulate', len(self)))
+            return original_accumulate(self, *args, **kwargs)
+        original_init = SearchIndex.__init__
+        def recording_init(self, table, postings=None, *args, **kwargs):
+            if postings is None:
+                calls.append(('postings', len(table)))
+            original_init(self, table, postings, *args, **kwargs)
+        monkeypatch.setattr(cache_module, 'compute_aggregates', recording_aggregates)
+        monkeypatch.setattr(LogTable, 'accumulate', recording_accumulate)
+        monkeypatch.setattr(SearchIndex, '__init__', recording_init)
+
+        _write_log(path, n=20, start=100)
+        refreshed = load_parsed_log(path, cache, workers=1, exact_max_rows=10)
+        assert calls == [('accumulate', 20)]
+        monkeypatch.undo()
+
+        full = parse_file_parallel(path, workers=1)
+        expected = full.accumulate()
+        assert refreshed.table.records() == full.records()
+        assert refreshed.state.to_dict() == expected.to_dict()
+        assert refreshed.aggregates == expected.results()
+        index = SearchIndex(full)
+        for query in ('endpoint3', '404', '192.168.1.2'):
+            assert list(refreshed.search_index.search(query)) == list(index.search(query))
+
+        # 기반 항목 + 증분 항목을 읽어도 같은 결과
+        cached = cache.load(path)
+        assert len(_entries(cache)) == 2
+        assert cached.table.records() == full.records()
+        assert list(cached.search_index.search('endpoint3')) == list(index.search('endpoint3'))
+
+        # 증분 항목이 MAX_DELTA_ENTRIES개를 넘으면 전체를 다시 저장해 하나로 합침
+        monkeypatch.setattr(cache_module, 'MAX_DELTA_ENTRIES', 1)
+        _write_log(path, n=5, start=120)
+        compacted = load_parsed_log(path, cache, workers=1, exact_max_rows=10)
+        assert len(_entries(cache)) == 1
+        assert cache.load(path).table.records() == compacted.table.records() == parse_file_parallel(path, workers=1).records()
+
+# 잘림/로테이션 감지 테스트
+def test_truncated_or_rotated_file_is_parsed_from_start():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        load_parsed_log(path, cache, workers=1)
+
+        # 잘린 뒤 다시 쓰인 파일
+        with open(path, 'w', encoding='utf-8'):
+            pass
+        _write_log(path, n=30, start=500)
+        parsed = load_parsed_log(path, cache, workers=1)
+        assert parsed.table.records() == parse_file_parallel(path, workers=1).records()
+
+        # 같은 이름의 새 파일로 교체 (크기는 더 커도 앞부분 내용이 다름)
+        os.rename(path, path + '.1')
+        _write_log(path, n=200, start=1000)
+        parsed = load_parsed_log(path, cache, workers=1)
+        assert parsed.table.records() == parse_file_parallel(path, workers=1).records()
+
+# 여러 파일 일괄 로드/병합 테스트
+def test_load_parsed_logs_and_combine():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f'app-2025-06-0{day}.log') for day in (1, 2, 3)]
+        for day, path in enumerate(paths):
+            _write_log(path, n=50 + day * 10, start=day * 100)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        load_parsed_log(paths[0], cache, workers=1)
+
+        parsed_logs = load_parsed_logs(paths, cache, workers=2, chunk_size=700)
+        for path, parsed in zip(paths, parsed_logs):
+            assert parsed.table.records() == load_parsed_log(path, workers=1).table.records()
+        assert len(_entries(cache)) == 3
+
+        # 파일별 부분 상태 병합 == 전체 레코드를 한 번에 누적한 결과 (스케치 모드)
+        records = [record for parsed in parsed_logs for record in parsed.table.records()]
+        assert combine_parsed(parsed_logs).to_dict() == LogAccumulator(records).to_dict()
+
+        # 캐시에서 복원한 상태로도 같은 결과
+        cached = load_parsed_logs(paths, cache, workers=1)
+        assert combine_parsed(cached).results() == combine_parsed(parsed_logs).results()
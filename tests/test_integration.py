@@ -19,21 +19,27 @@ import threading
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+import pytest
+
+import app.views as views
 from app import create_app
 from app.utils import parse_log_line, detect_log_format, convert_log_format
 
 # Flask 앱 fixture
-def app():
+@pytest.fixture
+def app(monkeypatch):
     """Flask 앱 fixture - 테스트용 앱 생성"""
-    app = create_app()
-    app.config['TESTING'] = True
+    app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None))
     app.config['LOG_DIR'] = tempfile.mkdtemp()
+    monkeypatch.setattr(views, 'LOG_DIR', app.config['LOG_DIR'])  # 라우트가 읽는 로그 디렉토리
     return app
 
+@pytest.fixture
 def client(app):
     """테스트 클라이언트 fixture"""
     return app.test_client()
 
+@pytest.fixture
 def large_log_file(app):
     """대용량 테스트 로그 파일 fixture"""
     large_log_file = os.path.join(app.config['LOG_DIR'], 'large.log')
@@ -148,13 +154,15 @@ def test_concurrent_requests(client, large_log_file):
         assert status_code == 200
 
 # 데이터 검증 테스트용 fixture
-def validation_app():
+@pytest.fixture
+def validation_app(monkeypatch):
     """데이터 검증 테스트용 앱 fixture"""
-    app = create_app()
-    app.config['TESTING'] = True
+    app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None))
     app.config['LOG_DIR'] = tempfile.mkdtemp()
+    monkeypatch.setattr(views, 'LOG_DIR', app.config['LOG_DIR'])  # 라우트가 읽는 로그 디렉토리
     return app
 
+@pytest.fixture
 def validation_client(validation_app):
     """데이터 검증 테스트용 클라이언트 fixture"""
     return validation_app.test_client()
@@ -222,13 +230,15 @@ def test_malformed_log_lines(validation_client, validation_app):
         shutil.rmtree(validation_app.config['LOG_DIR'])
 
 # 엣지 케이스 테스트용 fixture
-def edge_app():
+@pytest.fixture
+def edge_app(monkeypatch):
     """엣지 케이스 테스트용 앱 fixture"""
-    app = create_app()
-    app.config['TESTING'] = True
+    app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None))
     app.config['LOG_DIR'] = tempfile.mkdtemp()
+    monkeypatch.setattr(views, 'LOG_DIR', app.config['LOG_DIR'])  # 라우트가 읽는 로그 디렉토리
     return app
 
+@pytest.fixture
 def edge_client(edge_app):
     """엣지 케이스 테스트용 클라이언트 fixture"""
     return edge_app.test_client()
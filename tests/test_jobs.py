@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+jobs 모듈 테스트 스위트
+
+이 모듈은 app.jobs의 백그라운드 작업 관리자를 테스트합니다.
+- 작업 실행, 진행 상황(바이트, 라인 수, 남은 시간) 조회
+- 같은 키의 작업이 실행 중이면 그 작업에 합류하는지 확인
+- 스레드/프로세스 실행기와 오류 처리
+- 파싱 함수의 진행 상황 콜백이 파일 크기와 행 수를 모두 보고하는지 확인
+"""
+
+import sys
+import os
+import tempfile
+import threading
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app import parallel as parallel_module
+from app.cache import ParsedCache, load_parsed_logs, load_time_window
+from app.jobs import JobManager, JobProgress
+from app.utils import timestamp_to_epoch
+
+def _count(n, progress=None):
+    # 10바이트, 1라인씩 처리하는 작업 (프로세스 실행기에서도 쓰도록 모듈 최상위 함수)
+    for _ in range(n):
+        progress(10, 1)
+    return n
+
+def _fail(progress=None):
+    raise ValueError('broken log')
+
+def _write_log(path, n):
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(f"2025-06-03 08:{i // 60 % 60:02d}:{i % 60:02d} GET 10.0.0.{i % 5} /api/item{i % 4} {['200', '500'][i % 2]} {i}\n")
+
+def test_job_runs_and_reports_progress():
+    """작업 결과와 진행 상황 (처리 바이트, 라인 수, 완료 시 남은 시간 0) 테스트"""
+    manager = JobManager('thread', workers=1)
+    try:
+        job = manager.submit('count', 1000, _count, 100)
+        assert job.wait(10)
+        snapshot = job.snapshot()
+        assert job.result == 100
+        assert snapshot['status'] == 'done' and snapshot['percent'] == 100.0
+        assert snapshot['bytes_processed'] == 1000 and snapshot['lines'] == 100
+        assert snapshot['eta_seconds'] == 0.0
+        assert manager.get(job.id) is job
+        assert manager.get('missing') is None
+    finally:
+        manager.shutdown()
+
+def test_same_key_attaches_to_running_job():
+    """같은 키의 작업이 실행 중이면 새로 실행하지 않고 합류하는지 테스트"""
+    manager = JobManager('thread', workers=2)
+    release = threading.Event()
+    runs = []
+
+    def slow(progress=None):
+        runs.append(1)
+        progress(50, 5)
+        release.wait(10)
+        return 'parsed'
+
+    try:
+        first = manager.submit('file-a', 100, slow)
+        second = manager.submit('file-a', 100, slow)
+        assert second is first
+        snapshot = first.snapshot()
+        assert snapshot['status'] in ('pending', 'running') and snapshot['percent'] < 100
+        release.set()
+        assert first.wait(10)
+        assert runs == [1] and first.result == 'parsed'
+        assert manager.stats()['submitted'] == 1 and manager.stats()['attached'] == 1
+
+        # 끝난 뒤 같은 키는 새 작업
+        third = manager.submit('file-a', 100, slow)
+        assert third is not first and third.wait(10)
+    finally:
+        release.set()
+        manager.shutdown()
+
+def test_failed_job_and_finish_callback():
+    """실패한 작업은 error 상태와 메시지, finish 후처리 결과가 작업 결과가 되는지 테스트"""
+    manager = JobManager('thread', workers=1)
+    try:
+        failed = manager.submit('fail', 10, _fail)
+        assert failed.wait(10)
+        assert failed.status == 'error' and failed.snapshot()['error'] == 'broken log'
+        finished = manager.submit('count', 30, _count, 3, finish=lambda result: result * 2)
+        assert finished.wait(10) and finished.result == 6
+    finally:
+        manager.shutdown()
+
+def test_process_executor():
+    """프로세스 실행기에서 진행 상황이 부모로 전달되는지 테스트"""
+    manager = JobManager('process', workers=1)
+    try:
+        job = manager.submit('count', 500, _count, 50)
+        assert job.wait(60)
+        snapshot = job.snapshot()
+        assert job.result == 50 and snapshot['bytes_processed'] == 500 and snapshot['lines'] == 50
+    finally:
+        manager.shutdown()
+
+def test_parse_progress_covers_file(monkeypatch):
+    """파싱 진행 상황 콜백이 파싱/캐시/건너뛴 구간을 합쳐 파일 크기와 행 수를 보고하는지 테스트"""
+    monkeypatch.setattr(parallel_module, 'TIME_INDEX_BLOCK_SIZE', 1024)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path, 3000)
+        size = os.path.getsize(path)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+
+        progress = JobProgress()
+        parsed = load_parsed_logs([path], cache, workers=2, chunk_size=16 * 1024, progress=progress)[0]
+        _, done_bytes, rows = progress.values()
+        assert done_bytes == size and rows == len(parsed.table) == 3000
+
+        # 캐시에서 읽으면 파싱 없이 처리된 바이트로 보고
+        progress = JobProgress()
+        load_parsed_logs([path], cache, workers=2, chunk_size=16 * 1024, progress=progress)
+        assert progress.values()[1:] == (size, 0)
+
+        # 시간 구간: 인덱스로 건너뛴 블록도 처리된 바이트
+        for name in os.listdir(cache.directory):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(cache.directory, name))
+        progress = JobProgress()
+        window = load_time_window(path, timestamp_to_epoch('2025-06-03T08:10'), timestamp_to_epoch('2025-06-03T08:20'),
+                                  cache, workers=1, chunk_size=16 * 1024, progress=progress)
+        _, done_bytes, rows = progress.values()
+        assert done_bytes == size and len(window.table) <= rows < 3000
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+parallel 모듈 테스트 스위트
+
+이 모듈은 app.parallel의 청크 단위 병렬 파싱을 테스트합니다.
+- 줄바꿈 경계 바이트 범위 분할
+- 병렬 파싱 결과가 순차 파싱과 같은지 확인
+"""
+
+import sys
+import os
+import tempfile
+import gzip
+import bz2
+import lzma
+import shutil
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.parallel import split_byte_ranges, parse_file_parallel, parse_files_parallel, map_log_chunks, keep_errors, top_rows_parallel, accumulate_parallel
+from app.table import LogTable
+from app.utils import LogAccumulator, iter_log_records, top_records
+
+def _write_log(directory, n=200):
+    path = os.path.join(directory, 'chunks.log')
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            status = ['200', '201', '404', '500'][i % 4]
+            f.write(f"2025-06-03 {i % 24:02d}:{i % 60:02d}:00 GET 192.168.1.{i % 7} /api/endpoint{i % 10} {status} {50 + i}\n")
+            if i % 50 == 0:
+                f.write(f"[ERROR] 2025-06-03 {i % 24:02d}:00:00.000 - Database connection failed\n")
+    return path
+
+# 바이트 범위 분할 테스트
+def test_split_byte_ranges():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        ranges = split_byte_ranges(path, chunk_size=500)
+        assert len(ranges) > 1
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == os.path.getsize(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+            assert end == next_start
+            assert data[end - 1:end] == b'\n'  # 범위가 라인 중간에서 끊기지 않음
+
+# 병렬 파싱 결과 테스트
+def test_parse_file_parallel_matches_sequential():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        expected = LogTable.from_records(iter_log_records(path))
+        for workers in (1, 2):
+            table = parse_file_parallel(path, workers=workers, chunk_size=700)
+            assert table.records() == expected.records()
+            assert table.status_code_stats() == expected.status_code_stats()
+
+# 청크별 에러 행 필터 테스트
+def test_map_log_chunks_errors_only():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        chunks = map_log_chunks(path, keep_errors, workers=2, chunk_size=700)
+        errors = LogTable.concat(chunks)
+        assert len(chunks) > 1
+        assert errors.records() == LogTable.from_records(iter_log_records(path)).errors()
+
+# 빈 파일 테스트
+def test_parse_file_parallel_empty_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'empty.log')
+        open(path, 'w').close()
+        assert len(parse_file_parallel(path, workers=2)) == 0
+
+# 압축 파일 병렬 파싱 테스트
+def test_parse_file_parallel_compressed():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        expected = parse_file_parallel(path, workers=1).records()
+        for ext, opener in (('.gz', gzip.open), ('.bz2', bz2.open), ('.xz', lzma.open)):
+            compressed = path + ext
+            with open(path, 'rb') as src, opener(compressed, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            for workers in (1, 2):
+                assert parse_file_parallel(compressed, workers=workers, chunk_size=700).records() == expected
+            chunks = map_log_chunks(compressed, keep_errors, workers=2, chunk_size=700)
+            assert len(chunks) > 1
+            assert LogTable.concat(chunks).records() == LogTable.from_records(expected).errors()
+
+# 바이트 범위 지정 파싱 테스트
+def test_parse_file_parallel_byte_range():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        ranges = split_byte_ranges(path, chunk_size=500)
+        middle = ranges[len(ranges) // 2][0]
+        head = parse_file_parallel(path, workers=2, chunk_size=300, end=middle)
+        tail = parse_file_parallel(path, workers=2, chunk_size=300, start=middle)
+        assert len(head) > 0 and len(tail) > 0
+        assert LogTable.concat([head, tail]).records() == parse_file_parallel(path, workers=1).records()
+
+# 청크별 상위 N개 병합 테스트
+def test_top_rows_parallel_matches_sequential():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        expected = top_records(iter_log_records(path), 15)
+        for workers in (1, 2):
+            assert top_rows_parallel(path, 15, workers=workers, chunk_size=700).records() == expected
+        assert [log['status'] for log in top_rows_parallel(path, 3, 'status', workers=2, chunk_size=700).records()] == ['500'] * 3
+
+# 청크별 누적 상태 병합 테스트
+def test_accumulate_parallel_matches_sequential():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        expected = LogAccumulator(parse_file_parallel(path, workers=1).records()).to_dict()
+        for workers in (1, 2):
+            assert accumulate_parallel(path, workers=workers, chunk_size=700).to_dict() == expected
+
+# 여러 파일 한 풀 파싱 테스트
+def test_parse_files_parallel_matches_per_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_log(tmp)
+        compressed = path + '.gz'
+        with open(path, 'rb') as src, gzip.open(compressed, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        middle = split_byte_ranges(path, chunk_size=700)[1][0]
+        jobs = [(path, 0, None), (compressed, 0, None), (path, middle, None)]
+        for workers in (1, 2):
+            tables = parse_files_parallel(jobs, workers=workers, chunk_size=700)
+            assert [len(table) for table in tables[:2]] == [len(parse_file_parallel(path, workers=1))] * 2
+            assert tables[2].records() == parse_file_parallel(path, workers=1, start=middle).records()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+search 모듈 테스트 스위트
+
+이 모듈은 app.search의 검색 인덱스를 테스트합니다.
+- 키워드 검색 결과가 LogTable.search(전체 비교)와 같은지 확인
+- 정규식 필수 리터럴 추출과 정규식 검색
+- 결과 LRU 캐시와 캐시 저장/복원
+"""
+
+import sys
+import os
+import re
+import tempfile
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.cache import ParsedCache, load_parsed_log
+from app.search import SearchIndex, required_literals
+from app.table import LogTable
+
+def _records(n=400):
+    statuses = ['200', '201', '304', '404', '500', 'abc']
+    methods = ['GET', 'POST', 'DELETE']
+    return [{
+        'timestamp': '2025-06-03 08:00:00', 'method': methods[i % 3], 'ip': f'10.0.{i % 5}.{i % 37}',
+        'url': f'/api/v{i % 3}/Users/{i % 50}', 'status': statuses[i % len(statuses)], 'resp_time': i,
+    } for i in range(n)]
+
+# 키워드 검색 테스트
+def test_keyword_search_matches_table_scan():
+    table = LogTable.from_records(_records())
+    index = SearchIndex(table)
+    for keyword in ['/api', 'users/1', 'USERS/4', '10.0.3.', '0.1', '404', '0', 'post', 'e', '', 'nomatch', '/v2/users/49']:
+        assert index.search_records(keyword) == table.search(keyword), keyword
+
+# 정규식 필수 리터럴 테스트
+def test_required_literals():
+    assert required_literals('/api/v1/users') == ['/api/v1/users']
+    assert required_literals(r'^/API/v\d+/users$') == ['/api/v', '/users']
+    assert required_literals('colou?r') == ['colo', 'r']
+    assert required_literals('ab{2}cde') == ['a', 'cde']
+    assert required_literals('x[abc]+qwe\\.rt') == ['x', 'qwe.rt']
+    assert required_literals('(foo)bar') == ['bar']
+    assert required_literals('foo|bar') == []
+
+# 정규식 검색 테스트
+def test_regex_search_matches_full_scan():
+    records = _records()
+    index = SearchIndex(LogTable.from_records(records))
+    for pattern in [r'^/api/v[12]/users/4\d$', r'10\.0\.2\.', r'^5\d\d$', r'^(get|delete)$', 'users/(1|2)0$', 'zzz']:
+        regex = re.compile(pattern, re.IGNORECASE)
+        expected = [i for i, r in enumerate(records)
+                    if any(regex.search(r[field] if field != 'status' else str(int(r[field]) if r[field].isdigit() else 0))
+                           for field in ('url', 'ip', 'method', 'status'))]
+        assert index.search(pattern, regex=True).tolist() == expected, pattern
+
+# 결과 캐시 테스트
+def test_search_results_are_cached():
+    index = SearchIndex(LogTable.from_records(_records()), cache_size=2)
+    first = index.search('users')
+    assert index.search('users') is first
+    assert index.search('users', regex=True) is not first
+    index.search('404')
+    index.search('500')
+    assert index.hits == 1 and index.misses == 4
+    assert ('users', False) not in index._cache  # 가장 오래 안 쓴 항목부터 제거
+
+# 파싱 시 생성/캐시 저장 테스트
+def test_search_index_round_trip_through_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(200):
+                f.write(f"2025-06-03 08:{i % 60:02d}:00 GET 192.168.1.{i % 7} /api/endpoint{i % 10} {['200', '404'][i % 2]} {i}\n")
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        parsed = load_parsed_log(path, cache, workers=1)
+        cached = cache.load(path)
+        for field, rows in parsed.search_index.postings.items():
+            assert cached.search_index.postings[field].tolist() == rows.tolist()
+        assert cached.search('endpoint3') == parsed.search('endpoint3') == parsed.table.search('endpoint3')
+        assert len(cached.search(r'endpoint[12]$', regex=True)) == 40
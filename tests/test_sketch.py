@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+sketch 모듈 테스트 스위트
+
+이 모듈은 app.sketch의 분위수 스케치를 테스트합니다.
+- 상대 오차 범위 안의 분위수 추정
+- 병합(merge)과 직렬화 결과가 한 번에 만든 스케치와 같은지 확인
+- 벡터 연산으로 만든 그룹별 스케치와 LogTable 분위수
+"""
+
+import sys
+import os
+import random
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.sketch import PERCENTILES, QuantileSketch, exact_quantiles, group_sketches
+from app.table import LogTable
+
+QUANTILES = [q for _, q in PERCENTILES]
+
+def _values(n=5000, seed=7):
+    rng = random.Random(seed)
+    return [int(rng.lognormvariate(5, 1.2)) for _ in range(n)] + [0] * 20
+
+# 상대 오차 테스트
+def test_quantiles_within_relative_error():
+    values = _values()
+    for error in (0.01, 0.05):
+        sketch = QuantileSketch(error).update(values)
+        for exact, approx in zip(exact_quantiles(values, QUANTILES), sketch.quantiles(QUANTILES)):
+            assert abs(approx - exact) <= exact * error + 1e-9
+    assert sketch.quantile(0.0) == 0 and sketch.count == len(values)
+    assert QuantileSketch().quantiles(QUANTILES) == [0] * len(QUANTILES)
+
+# 정확 모드 테스트
+def test_exact_quantiles_matches_sorted_index():
+    values = _values(101)
+    ordered = sorted(values)
+    assert exact_quantiles(values, [0.9]) == [ordered[int(len(values) * 0.9) - 1]]
+    assert exact_quantiles([42], QUANTILES) == [42] * len(QUANTILES)
+
+# 병합/직렬화 테스트
+def test_merge_and_round_trip():
+    values = _values()
+    whole = QuantileSketch().update(values)
+    parts = [QuantileSketch().update(values[i::3]) for i in range(3)]
+    merged = QuantileSketch().merge(parts[2]).merge(parts[0].merge(parts[1]))
+    assert merged.to_dict() == whole.to_dict()
+    restored = QuantileSketch.from_dict(whole.to_dict())
+    assert restored.quantiles(QUANTILES) == whole.quantiles(QUANTILES)
+
+    # 최대 구간 수를 넘으면 작은 구간부터 합쳐 메모리를 제한 (높은 분위수는 유지)
+    small = QuantileSketch(max_bins=128).update(values)
+    assert len(small.bins) <= 128 < len(whole.bins)
+    assert small.quantile(0.99) == whole.quantile(0.99)
+
+# 그룹별 벡터 스케치 테스트
+def test_group_sketches_and_table_percentiles():
+    values = _values(3000)
+    groups = np.array([i % 4 for i in range(len(values))])
+    sketches = group_sketches(groups, np.array(values), 5)
+    for code in range(4):
+        expected = QuantileSketch().update(v for i, v in enumerate(values) if i % 4 == code)
+        assert sketches[code].quantiles(QUANTILES) == expected.quantiles(QUANTILES)
+    assert sketches[4].count == 0
+
+    logs = [{'timestamp': '', 'method': 'GET', 'ip': '10.0.0.1', 'url': f'/api/e{i % 4}', 'status': '200',
+             'resp_time': v, 'ts': None, 'tz': 0} for i, v in enumerate(values)]
+    table = LogTable.from_records(logs)
+    exact = table.endpoint_percentiles()
+    approx = table.endpoint_percentiles(relative_error=0.01)
+    for name, _ in PERCENTILES:
+        assert np.all(np.abs(approx[name] - exact[name]) <= exact[name] * 0.01 + 1)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+table 모듈 테스트 스위트
+
+이 모듈은 app.table의 컬럼 기반 LogTable을 테스트합니다.
+- 레코드 -> 컬럼 변환
+- 벡터화된 분석 메서드가 utils 함수와 같은 결과를 내는지 확인
+- int32를 넘는 응답 시간도 파싱되는지 확인
+"""
+
+import sys
+import os
+import tempfile
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from app import utils
+from app.cache import load_parsed_log
+from app.table import MAX_RESP_TIME, LogTable, timestamp_to_epoch
+
+# 분석 비교용 샘플 데이터 (파서 출력처럼 UTC epoch과 시간대 오프셋 포함)
+_sample_logs = [
+    {"timestamp": "2025-06-03 08:00:00", "method": "GET", "ip": "192.168.0.1", "url": "/api/users", "status": "200", "resp_time": 100},
+    {"timestamp": "2025-06-03 08:01:00", "method": "POST", "ip": "192.168.0.2", "url": "/api/login", "status": "201", "resp_time": 150},
+    {"timestamp": "2025-06-03 08:02:00", "method": "GET", "ip": "192.168.0.3", "url": "/api/data", "status": "200", "resp_time": 80},
+    {"timestamp": "2025-06-03 09:10:00", "method": "GET", "ip": "192.168.0.1", "url": "/api/users", "status": "404", "resp_time": 900},
+    {"timestamp": "2025-06-03 09:15:00", "method": "DELETE", "ip": "192.168.0.1", "url": "/api/data", "status": "500", "resp_time": 1200},
+    {"timestamp": "2025-06-03 10:00:00", "method": "GET", "ip": "192.168.0.4", "url": "/api/users", "status": "200", "resp_time": 100},
+]
+test_sample_logs = [dict(log, ts=timestamp_to_epoch(log['timestamp']), tz=0) for log in _sample_logs]
+
+def _without_times(stats):
+    return [{k: v for k, v in s.items() if k != 'times'} for s in stats]
+
+# 타임스탬프 변환 테스트
+def test_timestamp_to_epoch():
+    assert timestamp_to_epoch("1970-01-02 00:00:00") == 86400
+    assert timestamp_to_epoch("1970-01-01 01:30") == 5400
+    assert timestamp_to_epoch("not a timestamp") is None
+
+# 컬럼 변환 테스트
+def test_from_records_columns():
+    table = LogTable.from_records(iter(test_sample_logs))
+    assert len(table) == len(test_sample_logs)
+    assert table.status.dtype.name == 'int16'
+    assert table.resp_time.dtype.name == 'int64'
+    assert table.ts.dtype.name == 'int64'
+    assert table.urls == ['/api/users', '/api/login', '/api/data']
+    assert table.records() == test_sample_logs
+
+# 시간대 오프셋 테스트
+def test_timezone_offset_buckets():
+    line = '192.168.0.12 - - [03/Jun/2025:08:12:34 +0900] "GET /api/login HTTP/1.1" 500 123'
+    log = utils.parse_log_line(line, 'apache_format')
+    table = LogTable.from_records([log])
+    assert table.ts[0] == timestamp_to_epoch("2025-06-02 23:12:34")  # UTC
+    assert table.tz[0] == 9 * 3600
+    assert table.records() == [log]
+    # 시간 버킷은 로그에 기록된 현지 시각 기준
+    assert table.traffic_by_hour() == utils.traffic_by_hour([log]) == [('2025-06-03 08:00', 1)]
+    assert table.status_code_stats() == utils.status_code_stats([log])
+
+# 타임스탬프 없는 레코드 테스트
+def test_records_without_epoch():
+    table = LogTable.from_records(_sample_logs)
+    assert table.records() == test_sample_logs
+
+# 빈 테이블 테스트
+def test_empty_table():
+    table = LogTable.from_records([])
+    assert table.traffic_by_hour() == []
+    assert table.endpoint_stats() == []
+    assert table.slow_requests() == []
+    assert len(table.top_rows(5, 'status')) == 0
+    assert table.detect_anomalies() == {'spike_hours': [], 'top_ips': []}
+
+# 분석 결과가 utils 함수와 같은지 테스트
+def test_analysis_matches_utils():
+    table = LogTable.from_records(test_sample_logs)
+    logs = test_sample_logs
+    assert table.traffic_by_hour() == utils.traffic_by_hour(logs)
+    assert table.endpoint_stats() == _without_times(utils.endpoint_stats(logs))
+    assert table.status_code_stats() == utils.status_code_stats(logs)
+    assert table.slow_requests(top_n=3) == utils.slow_requests(logs, top_n=3)
+    assert table.slowest_endpoints(top_n=2) == _without_times(utils.slowest_endpoints(logs, top_n=2))
+    assert table.detect_anomalies() == utils.detect_anomalies(logs)
+    assert table.suggest_improvements() == utils.suggest_improvements(logs)
+
+# 컬럼 기준 상위 N개 행 테스트
+def test_top_rows_matches_top_records():
+    table = LogTable.from_records(test_sample_logs)
+    for n in (1, 3, 10):
+        assert table.top_rows(n).records() == utils.top_records(test_sample_logs, n, 'resp_time')
+        by_status = utils.top_records(test_sample_logs, n, key=lambda log: int(log['status']))
+        assert table.top_rows(n, 'status').records() == by_status
+
+# 벡터 연산 누적 상태 테스트
+def test_accumulate_matches_log_accumulator():
+    table = LogTable.from_records(test_sample_logs)
+    for keep_times in (False, True):
+        expected = utils.LogAccumulator(test_sample_logs, slow_top_n=2, keep_times=keep_times)
+        assert table.accumulate(slow_top_n=2, keep_times=keep_times).to_dict() == expected.to_dict()
+    assert LogTable.from_records([]).accumulate().to_dict() == utils.LogAccumulator().to_dict()
+
+# 검색/에러 필터 테스트
+def test_search_and_errors():
+    table = LogTable.from_records(test_sample_logs)
+    for keyword in ('api', 'users', '404', 'delete', '192.168.0.1', 'nothing'):
+        assert table.search(keyword) == utils.search_pattern(test_sample_logs, keyword)
+    assert [log['status'] for log in table.errors()] == ['404', '500']
+
+# 커서 페이지 조회 테스트
+def test_page_with_cursor_and_status_filter():
+    logs = [dict(log, status=str([200, 404, 500, 503][i % 4])) for i, log in enumerate(test_sample_logs * 50)]
+    table = LogTable.from_records(logs)
+    errors = [i for i, log in enumerate(logs) if int(log['status']) >= 400]
+
+    # 커서를 따라가면 전체 에러 행을 한 번씩, 원래 순서대로 얻음
+    pages, after = [], -1
+    while True:
+        rows, after = table.page(after=after, limit=7, status_ranges=[(400, 600)])
+        pages.append(rows.tolist())
+        if after is None:
+            break
+    assert [row for page in pages for row in page] == errors
+    assert all(len(page) == 7 for page in pages[:-1]) and 0 < len(pages[-1]) <= 7
+
+    # 행 인덱스(검색 결과) 안에서 상태 코드 필터
+    rows, after = table.page(rows=np.array(errors), after=errors[2], limit=3, status_ranges=[(500, 501)])
+    assert [logs[i]['status'] for i in rows] == ['500'] * 3 and rows[0] > errors[2] and after == rows[-1]
+    rows, after = table.page(limit=len(logs))
+    assert len(rows) == len(logs) and after is None
+    assert table.page(status_ranges=[(300, 400)])[0].size == 0
+
+# 큰 응답 시간 테스트
+def test_large_response_times():
+    """int32를 넘는 응답 시간은 그대로, int64를 넘는 값은 MAX_RESP_TIME으로 잘라 파일 분석이 실패하지 않는지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("2023-10-10 13:55:36 GET 1.2.3.4 /x 200 99999999999\n")
+            f.write("2023-10-10 13:55:37 GET 1.2.3.4 /x 200 " + "9" * 30 + "\n")
+            f.write("2023-10-10 13:55:38 GET 1.2.3.4 /y 200 120\n")
+        parsed = load_parsed_log(path, workers=1)
+        assert parsed.table.resp_time.dtype == np.int64
+        assert [log['resp_time'] for log in parsed.table.records()] == [99999999999, MAX_RESP_TIME, 120]
+        assert parsed.table.slow_requests(1)[0]['resp_time'] == MAX_RESP_TIME
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+timeindex 모듈 테스트 스위트
+
+이 모듈은 app.timeindex의 희소 시간 인덱스와 cache.load_time_window를 테스트합니다.
+- 블록별 시간 범위와 구간 질의의 바이트 범위
+- 시간 인덱스로 구간과 겹치는 바이트만 파싱한 결과가 전체 파싱 결과와 같은지 확인
+- 파일이 덧붙으면 인덱스를 이어 붙이고, 잘리면 다시 만드는지 확인
+"""
+
+import sys
+import os
+import tempfile
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app import cache as cache_module
+from app import parallel as parallel_module
+from app.cache import ParsedCache, load_parsed_log, load_time_window
+from app.parallel import parse_file_parallel, parse_files_indexed
+from app.utils import timestamp_to_epoch
+
+def _write_log(path, n=600, start=0, mode='a'):
+    # 분당 10줄씩 시간순으로 기록
+    with open(path, mode, encoding='utf-8') as f:
+        for i in range(start, start + n):
+            minute = i // 10
+            f.write(f"2025-06-03 {minute // 60:02d}:{minute % 60:02d}:{i % 10:02d} GET 10.0.0.{i % 5} /api/item{i % 4} {['200', '500'][i % 2]} {i}\n")
+            if i % 100 == 0:
+                f.write("[ERROR] 타임스탬프 없는 라인\n")
+
+def _small_blocks(monkeypatch):
+    monkeypatch.setattr(parallel_module, 'TIME_INDEX_BLOCK_SIZE', 1024)
+
+def _recording(monkeypatch):
+    # load_time_window가 파싱한 바이트 범위 기록
+    jobs = []
+    def recording(job_list, workers=None, chunk_size=None, progress=None):
+        jobs.extend(job_list)
+        return parse_files_indexed(job_list, workers, chunk_size, progress)
+    monkeypatch.setattr(cache_module, 'parse_files_indexed', recording)
+    return jobs
+
+# 블록 시간 범위 테스트
+def test_time_blocks_cover_file(monkeypatch):
+    _small_blocks(monkeypatch)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        [(table, blocks)] = parse_files_indexed([(path, 0, None)], workers=1)
+        assert table.records() == parse_file_parallel(path, workers=1).records()
+        assert len(blocks) > 10 and blocks[0][0] == 0
+        assert (blocks[1:, 0] > blocks[:-1, 0]).all()
+        assert (blocks[:, 1] <= blocks[:, 2]).all()
+        first_minute = timestamp_to_epoch('2025-06-03 00:00') // 60
+        assert blocks[0][1] == first_minute and blocks[-1][2] == first_minute + 59
+
+# 인덱스 구간 파싱 테스트
+def test_time_window_parses_only_overlapping_bytes(monkeypatch):
+    _small_blocks(monkeypatch)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        full = load_parsed_log(path, cache, workers=1)
+        index = cache.load_time_index(path)
+        assert index is not None and index.end == os.path.getsize(path)
+
+        # 컬럼 캐시 항목이 없어도 시간 인덱스로 구간만 파싱
+        for name in os.listdir(cache.directory):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(cache.directory, name))
+        jobs = _recording(monkeypatch)
+        ts_from, ts_to = timestamp_to_epoch('2025-06-03 00:20'), timestamp_to_epoch('2025-06-03 00:30')
+        window = load_time_window(path, ts_from, ts_to, cache, workers=1)
+        assert sum(end - start for _, start, end in jobs) < os.path.getsize(path) / 3
+        assert window.table.records() == full.table.time_window(ts_from, ts_to).records()
+        assert len(window.table) == 100
+        assert window.aggregates['status_code_stats']['code_counter'] == {'200': 50, '500': 50}
+
+# 덧붙기/잘림 테스트
+def test_time_index_extends_on_append_and_rebuilds_on_truncate(monkeypatch):
+    _small_blocks(monkeypatch)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.log')
+        _write_log(path)
+        cache = ParsedCache(os.path.join(tmp, 'cache'))
+        load_parsed_log(path, cache, workers=1)
+        for name in os.listdir(cache.directory):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(cache.directory, name))
+        old_end = cache.load_time_index(path).end
+
+        # 덧붙은 부분은 인덱스 끝부터만 파싱하고 인덱스에 추가
+        _write_log(path, n=100, start=600)
+        jobs = _recording(monkeypatch)
+        ts_from = timestamp_to_epoch('2025-06-03 01:00')
+        window = load_time_window(path, ts_from, None, cache, workers=1)
+        assert (path, old_end, os.path.getsize(path)) in jobs
+        assert len(window.table) == 100
+        assert cache.load_time_index(path).end == os.path.getsize(path)
+
+        # 파일이 잘려 다시 쓰이면 인덱스를 버리고 전체 파싱 후 새로 만듦
+        _write_log(path, n=50, mode='w')
+        del jobs[:]
+        window = load_time_window(path, None, timestamp_to_epoch('2025-06-03 00:02'), cache, workers=1)
+        assert jobs[0] == (path, 0, os.path.getsize(path))
+        assert len(window.table) == 20
+        assert cache.load_time_index(path).end == os.path.getsize(path)
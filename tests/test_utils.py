@@ -11,6 +11,8 @@ utils 모듈 테스트 스위트
 
 import sys
 import os
+import tempfile
+import gzip
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -18,8 +20,18 @@ sys.path.insert(0, project_root)
 
 from app.utils import (
     parse_log_line, 
+    get_line_parser,
+    MixedFormatParser,
+    iter_log_records,
+    parse_log_file,
+    iter_mmap_records,
+    iter_decompressed_blocks,
+    is_compressed,
+    open_log_text,
     detect_log_format, 
     convert_log_format,
+    classify_system_message,
+    KeywordClassifier,
     search_pattern,
     traffic_by_hour,
     endpoint_stats,
@@ -27,7 +39,10 @@ from app.utils import (
     slow_requests,
     slowest_endpoints,
     detect_anomalies,
-    suggest_improvements
+    suggest_improvements,
+    LogAccumulator,
+    TopK,
+    top_records
 )
 
 # 표준 형식 로그 파싱 테스트
@@ -78,6 +93,138 @@ def test_parse_log_line_apache_format():
     assert result['status'] == '200'
     assert result['resp_time'] == 123
 
+# 타임스탬프 epoch 변환 테스트
+def test_parse_log_line_epoch_and_timezone():
+    """파싱 시 타임스탬프가 UTC epoch과 시간대 오프셋으로 한 번만 해석되는지 테스트"""
+    standard = parse_log_line("2025-06-03 08:12:34 GET 192.168.0.1 /api/users 200 100", 'standard')
+    assert standard['ts'] == 1748938354
+    assert standard['tz'] == 0
+    apache = parse_log_line('192.168.0.12 - - [03/Jun/2025:08:12:34 -0130] "GET /api/login HTTP/1.1" 200 123', 'apache_format')
+    assert apache['timestamp'] == '2025-06-03 08:12:34'
+    assert apache['tz'] == -5400
+    assert apache['ts'] == standard['ts'] + 5400
+    iso = parse_log_line("2025-06-03T08:12:34.123Z GET /api/login 200 123", 'iso_format')
+    assert iso['ts'] == standard['ts']
+    simple = parse_log_line("08:12:34 GET /api/login 200 123", 'simple_format')
+    assert simple['timestamp'].endswith(' 08:12:34')
+    assert simple['ts'] % 86400 == 8 * 3600 + 12 * 60 + 34
+    # 시간 버킷은 현지 시각 기준
+    assert traffic_by_hour([apache]) == [('2025-06-03 08:00', 1)]
+
+# 형식 전용 파서 함수 테스트
+def test_get_line_parser_matches_parse_log_line():
+    """get_line_parser가 parse_log_line과 같은 결과를 반환하는지 테스트"""
+    lines = {
+        'standard': "2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100",
+        'iso_format': "2025-06-03T08:12:34.123Z GET /api/login 200 123",
+        'app_log_format': "[INFO] 2025-06-10 09:15:23.456 - Client 10.0.1.45 requested GET /api/v1/users with status 200 (response time: 145ms)",
+        'system_log_format': "[ERROR] 2025-06-10 09:05:12.890 - Database connection failed: timeout after 30 seconds",
+    }
+    for format_type, line in lines.items():
+        parser = get_line_parser(format_type)
+        assert parser is get_line_parser(format_type)  # 한 번만 생성되어 재사용
+        assert parser(line) == parse_log_line(line, format_type)
+        assert parser(line) is not None
+
+def test_get_line_parser_unknown_format():
+    """알 수 없는 형식은 표준 형식 파서를 반환"""
+    assert get_line_parser(None) is get_line_parser('standard')
+    assert get_line_parser('nope')("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100")['url'] == '/api/users'
+
+def test_parse_log_line_system_log():
+    """시스템 로그가 가상의 API 요청으로 변환되는지 테스트"""
+    result = parse_log_line("[ERROR] 2025-06-10 09:05:12.890 - Database connection failed", 'system_log_format')
+    assert result == {
+        'timestamp': '2025-06-10 09:05:12',
+        'method': 'SYSTEM',
+        'ip': '127.0.0.1',
+        'url': '/api/system/database',
+        'status': '500',
+        'resp_time': 50,
+        'ts': 1749546312,
+        'tz': 0
+    }
+
+def test_classify_system_message():
+    """키워드 표 기반 시스템 로그 분류 테스트 (표의 앞 항목 우선)"""
+    assert classify_system_message("Database connection failed") == '/api/system/database'
+    assert classify_system_message("Failed to write log FILE to database") == '/api/system/database'
+    assert classify_system_message("Auth token cache expired") == '/api/system/auth'
+    assert classify_system_message("RATE LIMIT exceeded") == '/api/system/ratelimit'
+    assert classify_system_message("Heartbeat OK") == '/api/system/other'
+    
+    classifier = KeywordClassifier([('/q', ('queue',)), ('/db', ('database', 'queue'))], '/none')
+    assert classifier.classify("Queue backed up on database") == '/q'
+    assert classifier.classify("database only") == '/db'
+    assert classifier.classify("nothing") == '/none'
+
+def test_keyword_classifier_priority_and_shape_cache(monkeypatch):
+    """겹치거나 서로 품은 키워드도 표의 앞 항목이 이기고, 숫자만 다른 메시지는 한 번만 훑는지 테스트"""
+    from app import utils
+    classifier = KeywordClassifier([('/ext', ('external',)), ('/idx', ('index',)), ('/auth', ('auth',)),
+                                    ('/authn', ('authentication',))], '/none')
+    assert classifier.classify("indexternal") == '/ext'  # 가장 왼쪽 키워드(index)와 겹친 앞 항목
+    assert classifier.classify("Index rebuilt") == '/idx'
+    assert classifier.classify("AUTHENTICATION failed") == '/auth'  # 품은 키워드(auth)가 앞 항목
+
+    scans = []
+    original = classifier._match
+    monkeypatch.setattr(classifier, '_match', lambda lowered: scans.append(lowered) or original(lowered))
+    assert classifier.classify("Index rebuild took 30 seconds") == '/idx'
+    assert classifier.classify("index REBUILD took 75 seconds") == '/idx'
+    assert len(scans) == 1
+
+    # 숫자가 든 키워드가 있으면 숫자를 정규화하지 않음
+    versioned = KeywordClassifier([('/h2', ('http2',))], '/none')
+    assert versioned.classify("HTTP2 stream reset") == '/h2'
+    assert versioned.classify("HTTP3 stream reset") == '/none'
+
+    # 기억하는 형태 수는 CLASSIFIER_CACHE_SIZE까지
+    monkeypatch.setattr(utils, 'CLASSIFIER_CACHE_SIZE', 2)
+    for word in ('alpha', 'beta', 'gamma', 'delta'):
+        assert classifier.classify(f"{word} external call") == '/ext'
+        assert len(classifier._cache) <= 2
+
+def test_convert_log_format_uses_shared_classifier():
+    """변환 경로와 파싱 경로가 같은 분류 결과를 내는지 테스트"""
+    line = "[WARN] 2025-06-10 09:12:03.012 - SMTP relay rejected message"
+    record = parse_log_line(line, 'system_log_format')
+    converted = parse_log_line(convert_log_format(line), 'standard')
+    assert record['url'] == converted['url'] == '/api/system/email'
+    assert record['status'] == converted['status'] == '400'
+
+# 혼합 형식 파서 테스트
+def test_mixed_format_parser_interleaved():
+    """애플리케이션/시스템 로그가 섞인 라인을 모두 파싱하는지 테스트"""
+    lines = [
+        "[INFO] 2025-06-10 09:00:15.123 - Client 10.0.1.45 requested GET /api/v1/dashboard with status 200 (response time: 89ms)",
+        "[ERROR] 2025-06-10 09:05:12.890 - Database connection failed: timeout after 30 seconds",
+        "[INFO] 2025-06-10 09:07:28.234 - Client 10.0.1.89 requested GET /api/v1/users with status 200 (response time: 123ms)",
+        "2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100",
+        "This is not a valid log line",
+    ]
+    parser = MixedFormatParser('app_log_format')
+    results = [parser.parse(line) for line in lines]
+    assert results[0]['url'] == '/api/v1/dashboard'
+    assert results[1]['url'] == '/api/system/database'
+    # 시스템 로그 다음에도 애플리케이션 로그는 애플리케이션 형식으로 파싱
+    assert results[2]['url'] == '/api/v1/users'
+    assert results[2]['method'] == 'GET'
+    assert results[3]['url'] == '/api/users'
+    assert results[4] is None
+    assert parser.hits['app_log_format'] == 2
+    assert parser.hits['system_log_format'] == 1
+    assert parser.last_format == 'standard'
+
+def test_mixed_format_parser_reuses_hits():
+    """이전 매치 횟수로 가장 많이 매치된 형식을 먼저 시도하는지 테스트"""
+    parser = MixedFormatParser()
+    for _ in range(3):
+        parser.parse("2025-06-03T08:12:34.123Z GET /api/login 200 123")
+    parser.parse("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100")
+    resumed = MixedFormatParser(hits=parser.hits)
+    assert resumed.last_format == 'iso_format'
+
 # 로그 형식 감지 테스트
 def test_detect_log_format_standard():
     sample_lines = [
@@ -208,4 +355,149 @@ def test_detect_anomalies():
 # 개선 방안 제안 테스트
 def test_suggest_improvements():
     result = suggest_improvements(test_sample_logs)
-    assert isinstance(result, list) 
\ No newline at end of file
+    assert isinstance(result, list) 
+# 스트리밍 상위 K개 수집기 테스트
+def test_top_k_streaming_and_merge():
+    """힙 기반 상위 K개가 전체 정렬 결과와 같고, 청크별 결과를 합쳐도 같은지 테스트"""
+    logs = [{'url': f'/api/e{i}', 'resp_time': (i * 37) % 50, 'status': str(200 + i % 3)} for i in range(200)]
+    expected = sorted(logs, key=lambda x: x['resp_time'], reverse=True)[:7]  # 안정 정렬: 동률은 원래 순서
+    assert top_records(iter(logs), 7) == expected
+    assert slow_requests(logs, top_n=7) == expected
+
+    chunks = [TopK(7).update(logs[i:i + 30]) for i in range(0, len(logs), 30)]
+    merged = TopK(7)
+    for chunk in chunks:
+        merged.merge(chunk)
+    assert merged.items() == expected and merged.count == len(logs)
+
+    assert top_records(logs, 3, key=lambda x: int(x['status'])) == [logs[2], logs[5], logs[8]]
+    assert top_records(logs, 0) == [] and top_records([], 5) == []
+
+# 단일 순회 누적기 테스트
+def test_log_accumulator_matches_functions():
+    """누적기 한 번 순회 결과가 개별 분석 함수 결과와 같은지 테스트"""
+    logs = [dict(log, ts=None) if i % 17 == 0 else log for i, log in enumerate(
+        {'timestamp': '', 'method': 'GET', 'ip': f'10.0.0.{i % 6}', 'url': f'/api/e{i % 7}',
+         'status': ['200', '404', '500', '201'][i % 4], 'resp_time': (i * 37) % 900,
+         'ts': 1748937600 + i * 611, 'tz': 32400}
+        for i in range(300))]
+    acc = LogAccumulator(iter(logs), keep_times=True)
+    assert acc.traffic_by_hour() == traffic_by_hour(logs)
+    assert acc.endpoint_stats() == endpoint_stats(logs)
+    assert acc.status_code_stats() == status_code_stats(logs)
+    assert acc.slow_requests() == slow_requests(logs)
+    assert acc.slow_requests(top_n=3) == slow_requests(logs, top_n=3)
+    assert acc.slowest_endpoints() == slowest_endpoints(logs)
+    assert acc.detect_anomalies() == detect_anomalies(logs)
+    assert acc.suggest_improvements() == suggest_improvements(logs)
+
+    results = acc.results()
+    assert acc.endpoint_stats(keep_times=False) == endpoint_stats(logs, keep_times=False)
+    assert results['endpoint_stats'] == acc.endpoint_stats(keep_times=False, percentiles=True)
+    assert results['slowest_endpoints'] == acc.slowest_endpoints(keep_times=False, percentiles=True)
+    assert results['endpoint_stats'][0]['p99'] >= results['endpoint_stats'][0]['p50']
+    assert results['suggest_improvements'] == acc.suggest_improvements()
+    assert LogAccumulator().results()['traffic_by_hour'] == []
+
+    # 기본(스케치) 모드: 응답시간 목록 없이 p90이 1% 이내
+    sketched = LogAccumulator(logs)
+    assert 'times' not in sketched.endpoint_stats()[0]
+    for exact, approx in zip(slowest_endpoints(logs), sketched.slowest_endpoints()):
+        assert abs(approx['p90'] - exact['p90']) <= exact['p90'] * 0.01 + 1
+
+# 누적 상태 병합/직렬화 테스트
+def test_log_accumulator_merge_and_serialize():
+    """청크별 누적 상태를 병합한 결과가 한 번에 누적한 결과와 같은지, JSON 왕복 후에도 같은지 테스트"""
+    import json
+    logs = [{'timestamp': '', 'method': 'GET', 'ip': f'10.0.0.{i % 9}', 'url': f'/api/e{(i * 7) % 11}',
+             'status': ['200', '404', '500'][i % 3], 'resp_time': (i * 53) % 700,
+             'ts': None if i % 13 == 0 else 1748937600 + i * 347, 'tz': 0} for i in range(240)]
+    for keep_times in (False, True):
+        whole = LogAccumulator(logs, keep_times=keep_times)
+        parts = [LogAccumulator(logs[i:i + 50], keep_times=keep_times) for i in range(0, len(logs), 50)]
+        left = LogAccumulator(keep_times=keep_times)
+        for part in parts:
+            left.merge(part)
+        right = LogAccumulator(keep_times=keep_times).merge(parts[0])
+        rest = LogAccumulator(keep_times=keep_times)
+        for part in parts[1:]:
+            rest.merge(part)
+        right.merge(rest)  # 결합 법칙
+        assert left.to_dict() == right.to_dict() == whole.to_dict()
+        assert left.results() == whole.results()
+
+        restored = LogAccumulator.from_dict(json.loads(json.dumps(whole.to_dict())))
+        assert restored.results() == whole.results()
+        assert restored.merge(parts[0]).count == len(logs) + 50
+
+# 스트리밍 레코드 제너레이터 테스트
+def test_iter_log_records():
+    """파일을 한 줄씩 파싱하는 제너레이터 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'stream.log')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100\n")
+            f.write("\n")
+            f.write("Invalid line here\n")
+            f.write("2025-06-03 09:01:00 POST 192.168.0.2 /api/login 500 150\n")
+        records = iter_log_records(path)
+        assert iter(records) is records  # 리스트가 아닌 제너레이터
+        assert [r['url'] for r in records] == ['/api/users', '/api/login']
+        # 집계 함수가 이터레이터를 그대로 소비
+        assert traffic_by_hour(iter_log_records(path)) == [('2025-06-03 08:00', 1), ('2025-06-03 09:00', 1)]
+        assert detect_anomalies(iter_log_records(path))['top_ips'] == [('192.168.0.1', 1), ('192.168.0.2', 1)]
+        assert len(slow_requests(iter_log_records(path), top_n=1)) == 1
+        assert suggest_improvements(iter_log_records(path))
+
+def test_iter_mmap_records_matches_line_reader():
+    """mmap 일괄 매치 리더가 라인 단위 리더와 같은 레코드를 반환하는지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'mmap.log')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100\r\n")
+            f.write("  2025-06-03 08:00:01 GET 192.168.0.1 /api/data 200 90\n")
+            f.write("\n")
+            f.write("[ERROR] 2025-06-03 08:00:02.000 - Database connection failed\n")
+            f.write("Invalid line here\n")
+            f.write("2025-06-03 09:01:00 POST 192.168.0.2 /api/login 500 150  \n")
+            f.write("2025-06-03 09:02:00 GET 192.168.0.3 /api/users 404 80")
+        expected = list(iter_log_records(path))
+        assert len(expected) == 5
+        assert list(iter_mmap_records(path)) == expected
+        # 바이트 범위를 나눠 읽어도 결과가 같음
+        middle = open(path, 'rb').read().index(b'Invalid')
+        parser = MixedFormatParser('standard')
+        assert list(iter_mmap_records(path, 0, middle, parser)) + list(iter_mmap_records(path, middle, None, parser)) == expected
+        
+        empty = os.path.join(tmp, 'empty.log')
+        open(empty, 'w').close()
+        assert list(iter_mmap_records(empty)) == []
+
+def test_iter_log_records_compressed():
+    """압축된 로그 파일을 풀면서 같은 파서로 읽는지 테스트"""
+    lines = (
+        '192.168.0.12 - - [03/Jun/2025:08:12:34 +0000] "GET /api/login HTTP/1.1" 200 123\n'
+        '192.168.0.13 - - [03/Jun/2025:08:12:35 +0000] "POST /api/users HTTP/1.1" 500 456\n'
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, 'access.log')
+        with open(plain, 'w', encoding='utf-8') as f:
+            f.write(lines)
+        compressed = plain + '.gz'
+        with gzip.open(compressed, 'wt', encoding='utf-8') as f:
+            f.write(lines)
+        assert is_compressed(compressed) and not is_compressed(plain)
+        with open_log_text(compressed) as f:
+            assert detect_log_format([line.strip() for line in f]) == 'apache_format'
+        expected = list(iter_log_records(plain))
+        assert len(expected) == 2
+        assert list(iter_log_records(compressed)) == expected
+        assert list(iter_mmap_records(compressed)) == expected
+        assert parse_log_file(compressed) == expected
+        assert b''.join(iter_decompressed_blocks(compressed, 10)) == lines.encode('utf-8')
+
+# 응답시간 목록 없이 엔드포인트 통계 테스트
+def test_endpoint_stats_without_times():
+    result = endpoint_stats(test_sample_logs, keep_times=False)
+    assert all('times' not in ep for ep in result)
+    assert [ep['count'] for ep in result] == [ep['count'] for ep in endpoint_stats(test_sample_logs)]
@@ -12,25 +12,33 @@ import sys
 import os
 import tempfile
 import shutil
+import threading
+import time
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+import pytest
+
+import app.views as views
 from app import create_app
 
 # Flask 앱 fixture
-def app():
+@pytest.fixture
+def app(monkeypatch):
     """Flask 앱 fixture - 테스트용 앱 생성"""
-    app = create_app()
-    app.config['TESTING'] = True
+    app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None))
     app.config['LOG_DIR'] = tempfile.mkdtemp()  # 임시 로그 디렉토리
+    monkeypatch.setattr(views, 'LOG_DIR', app.config['LOG_DIR'])  # 라우트가 읽는 로그 디렉토리
     return app
 
+@pytest.fixture
 def client(app):
     """테스트 클라이언트 fixture"""
     return app.test_client()
 
+@pytest.fixture
 def test_log_file(app):
     """테스트용 로그 파일 fixture"""
     test_log_file = os.path.join(app.config['LOG_DIR'], 'test.log')
@@ -151,6 +159,7 @@ def test_errors_route_nonexistent_file(client):
     assert response.status_code == 404
 
 # 통합 테스트용 fixture
+@pytest.fixture
 def mixed_log_file(app):
     """혼합 형식 테스트용 로그 파일 fixture"""
     mixed_log_file = os.path.join(app.config['LOG_DIR'], 'mixed.log')
@@ -175,4 +184,375 @@ def test_mixed_format_plot(client, mixed_log_file):
     """혼합 형식 로그 그래프 생성 테스트"""
     response = client.get('/analyze/plot/traffic?logfile=mixed.log')
     assert response.status_code == 200
-    assert 'image/png' in response.headers.get('Content-Type', '') 
\ No newline at end of file
+    assert 'image/png' in response.headers.get('Content-Type', '') 
+# 메모리 결과 캐시 테스트
+def test_result_cache_loads_each_file_once():
+    """같은 내용의 파일은 한 번만 읽고, 내용이 바뀌거나 예산을 넘으면 다시 읽는지 테스트"""
+    from app.views import ResultCache
+    from app.cache import load_parsed_log
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'test.log')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100\n")
+        loads = []
+        def loader(file_path):
+            loads.append(file_path)
+            return load_parsed_log(file_path, workers=1)
+
+        cache = ResultCache()
+        first = cache.get(path, loader)
+        assert cache.get(path, loader) is first
+        assert len(loads) == 1
+        assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("2025-06-03 08:01:00 POST 192.168.0.2 /api/login 500 150\n")
+        assert len(cache.get(path, loader).table) == 2
+        assert len(loads) == 2
+
+        cache.max_bytes = 1  # 예산보다 큰 결과는 보관하지 않음
+        cache.clear()
+        cache.get(path, loader)
+        cache.get(path, loader)
+        assert len(loads) == 4 and cache.stats()['entries'] == 0
+    finally:
+        shutil.rmtree(tmp)
+
+# 동시 요청 테스트
+def test_result_cache_get_many_waits_for_concurrent_loads():
+    """여러 요청이 같은 파일들을 동시에 요청해도 한 번만 읽고 나머지는 그 결과를 기다리는지 테스트"""
+    from app.views import ResultCache
+    from app.cache import load_parsed_log, load_parsed_logs
+    tmp = tempfile.mkdtemp()
+    try:
+        paths = [os.path.join(tmp, name) for name in ('a.log', 'b.log')]
+        for path in paths:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100\n")
+        loads = []
+        started = threading.Event()
+        release = threading.Event()
+        def loader_many(file_paths):
+            loads.append(list(file_paths))
+            started.set()
+            release.wait(10)
+            return load_parsed_logs(file_paths, workers=1)
+
+        cache = ResultCache()
+        results = []
+        def request_many():
+            results.append(cache.get_many(paths, loader_many))
+        def request_one():
+            results.append([cache.get(paths[1], lambda path: load_parsed_log(path, workers=1))])
+        threads = [threading.Thread(target=request_many)]
+        threads[0].start()
+        assert started.wait(10)
+        threads += [threading.Thread(target=request_many) for _ in range(3)] + [threading.Thread(target=request_one)]
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)  # 나머지 요청이 읽는 중 잠금을 기다리도록
+        release.set()
+        for thread in threads:
+            thread.join(10)
+
+        assert loads == [paths]
+        first = next(result for result in results if len(result) == 2)
+        assert all(parsed is first[i] for result in results for i, parsed in enumerate(result) if len(result) == 2)
+        assert all(result[0] is first[1] for result in results if len(result) == 1)
+        assert cache.stats()['misses'] == 2 and cache.stats()['hits'] == 7
+    finally:
+        shutil.rmtree(tmp)
+
+# 날짜 범위/여러 파일 선택 테스트
+def test_selected_files_by_date_range():
+    """파일 이름의 날짜로 기간 안의 파일을 고르고, 목록에 없는 이름은 버리는지 테스트"""
+    from werkzeug.datastructures import MultiDict
+    from app.views import _files_in_range, _selected_files
+    log_files = ['app-2025-06-01.log', 'app-2025-06-02.log', 'app-2025-06-03.log', 'app.log']
+    assert _files_in_range(log_files, '2025-06-02', '') == ['app-2025-06-02.log', 'app-2025-06-03.log']
+    assert _files_in_range(log_files, '', '2025-06-01') == ['app-2025-06-01.log']
+    args = MultiDict([('logfile', 'app.log'), ('logfile', '../secret'), ('date_from', '2025-06-03')])
+    assert _selected_files(args, log_files) == ['app-2025-06-03.log', 'app.log']
+
+# 그래프 PNG 캐시/조건부 요청 테스트
+def test_plot_cache_and_conditional_get():
+    """같은 그래프는 한 번만 그리고, ETag/Last-Modified가 같으면 304, 파일이 바뀌면 새 ETag인지 테스트"""
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        views.LOG_DIR = tmp
+        with open(os.path.join(tmp, 'test.log'), 'w', encoding='utf-8') as f:
+            f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100\n")
+        app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None, PLOT_CACHE_DIR=os.path.join(tmp, 'plots')))
+        client = app.test_client()
+        url = '/analyze/plot/status?logfile=test.log'
+
+        first = client.get(url)
+        assert first.status_code == 200 and first.headers['ETag'] and first.headers['Last-Modified']
+        assert 'no-store' not in first.headers['Cache-Control']
+        assert client.get(url).data == first.data
+        assert client.get(url, headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+        stats = client.get('/cache/stats').get_json()['plots']
+        assert stats['misses'] == 1 and stats['hits'] == 1
+        assert len(os.listdir(os.path.join(tmp, 'plots'))) == 1
+
+        # 테마가 다르면 다른 이미지
+        assert client.get(url + '&theme=dark').headers['ETag'] != first.headers['ETag']
+
+        with open(os.path.join(tmp, 'test.log'), 'a', encoding='utf-8') as f:
+            f.write("2025-06-03 08:01:00 POST 192.168.0.2 /api/login 500 150\n")
+        changed = client.get(url, headers={'If-None-Match': first.headers['ETag']})
+        assert changed.status_code == 200 and changed.headers['ETag'] != first.headers['ETag']
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
+
+def test_chart_data_json():
+    """그래프 데이터 JSON이 집계와 일치하고, 분석 페이지는 PNG 대신 캔버스로 그리는지 테스트"""
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        views.LOG_DIR = tmp
+        with open(os.path.join(tmp, 'test.log'), 'w', encoding='utf-8') as f:
+            f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100\n")
+            f.write("2025-06-03 09:00:00 POST 192.168.0.2 /api/login 500 300\n")
+        app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None, PLOT_CACHE_DIR=None))
+        client = app.test_client()
+
+        status = client.get('/analyze/data/status?logfile=test.log')
+        assert status.status_code == 200 and status.headers['ETag']
+        assert status.get_json() == {'labels': ['200', '500'], 'values': [1, 1], 'colors': ['#198754', '#dc3545']}
+        traffic = client.get('/analyze/data/traffic?logfile=test.log').get_json()
+        assert traffic['labels'] == ['08:00', '09:00'] and traffic['values'] == [1, 1]
+        endpoint = client.get('/analyze/data/endpoint?logfile=test.log').get_json()
+        assert endpoint['urls'] == ['/api/login', '/api/users'] and endpoint['avg_time'] == [300, 100]
+        assert len(status.data) < 1024
+        assert client.get('/analyze/data/status?logfile=test.log',
+                          headers={'If-None-Match': status.headers['ETag']}).status_code == 304
+        assert client.get('/analyze/data/pie?logfile=test.log').status_code == 404
+        assert client.get('/analyze/data/status?logfile=missing.log').status_code == 404
+
+        # 분석 페이지는 데이터를 포함하고 PNG는 내보내기 링크로만 남음
+        page = client.post('/analyze', data={'logfile': 'test.log'}).get_data(as_text=True)
+        assert '<canvas id="status-chart"' in page and '<img id="status-chart"' not in page
+        assert '/analyze/plot/status' in page
+        assert client.get('/cache/stats').get_json()['plots']['misses'] == 0
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
+
+def test_plotting_imported_lazily():
+    """앱 생성만으로는 matplotlib을 불러오지 않고, PNG 내보내기 요청 때 불러오는지 테스트"""
+    import subprocess
+    code = (
+        "import sys; import app; flask_app = app.create_app(dict(TESTING=True, PARSE_CACHE_DIR=None)); "
+        "assert 'matplotlib' not in sys.modules and 'seaborn' not in sys.modules; "
+        "import app.views as views; views.LOG_DIR = sys.argv[1]; "
+        "response = flask_app.test_client().get('/analyze/plot/status?logfile=test.log'); "
+        "assert response.status_code == 200 and response.data[:4] == b'\\x89PNG'; "
+        "assert 'matplotlib.pyplot' in sys.modules"
+    )
+    tmp = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(tmp, 'test.log'), 'w', encoding='utf-8') as f:
+            f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/users 200 100\n")
+        subprocess.run([sys.executable, '-c', code, tmp], cwd=project_root, check=True, capture_output=True)
+    finally:
+        shutil.rmtree(tmp)
+
+def test_background_analysis_job():
+    """큰 분석은 작업으로 실행되고, 진행 상황 조회 후 같은 폼을 다시 제출하면 결과가 나오는지 테스트"""
+    import re
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        views.LOG_DIR = tmp
+        with open(os.path.join(tmp, 'test.log'), 'w', encoding='utf-8') as f:
+            for i in range(200):
+                f.write(f"2025-06-03 08:{i % 60:02d}:00 GET 192.168.0.1 /api/users {200 if i % 4 else 500} {i}\n")
+        app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None, JOB_MIN_BYTES=0))
+        client = app.test_client()
+
+        page = client.post('/analyze', data={'logfile': 'test.log'}).get_data(as_text=True)
+        job_id = re.search(r'name="job_id" value="(\w+)"', page).group(1)
+        assert 'id="jobPanel"' in page and '<canvas id="status-chart"' not in page
+        app.extensions['job_manager'].get(job_id).wait(30)
+        status = client.get(f'/jobs/{job_id}').get_json()
+        assert status['status'] == 'done' and status['lines'] == 200 and status['percent'] == 100.0
+        assert client.get('/jobs/unknown').status_code == 404
+
+        page = client.post('/analyze', data={'logfile': 'test.log', 'job_id': job_id}).get_data(as_text=True)
+        assert '<canvas id="status-chart"' in page and 'id="jobPanel"' not in page
+        # 작업 결과는 메모리 결과 캐시에 들어가 그래프/에러 페이지 요청이 다시 읽지 않음
+        series = client.get('/analyze/data/status?logfile=test.log').get_json()
+        assert dict(zip(series['labels'], series['values'])) == {'200': 150, '500': 50}
+        assert client.get('/cache/stats').get_json()['misses'] == 0
+        # 캐시에 있으면 작업 없이 바로 분석
+        page = client.post('/analyze', data={'logfile': 'test.log'}).get_data(as_text=True)
+        assert '<canvas id="status-chart"' in page
+        assert app.extensions['job_manager'].stats()['submitted'] == 1
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
+
+def test_paginated_errors_and_search():
+    """에러 로그와 패턴 검색 결과가 커서로 한 페이지씩, 상태 코드 필터와 함께 조회되는지 테스트"""
+    import html
+    import re
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        views.LOG_DIR = tmp
+        with open(os.path.join(tmp, 'test.log'), 'w', encoding='utf-8') as f:
+            for i in range(300):
+                f.write(f"2025-06-03 08:{i % 60:02d}:00 GET 192.168.0.1 /api/item{i} {[200, 404, 500][i % 3]} {i}\n")
+        app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None, PAGE_SIZE=30))
+        client = app.test_client()
+
+        # 에러 페이지: 건수는 전체, 목록은 한 페이지, 다음 페이지 커서를 따라가면 모든 에러를 한 번씩
+        page = client.get('/errors/test.log').get_data(as_text=True)
+        assert '200건 중 30건 표시' in page
+        seen = []
+        url = '/errors/test.log?status=5xx&limit=40'
+        while url:
+            page = client.get(url).get_data(as_text=True)
+            seen += [int(i) for i in re.findall(r'<code>/api/item(\d+)</code>', page)]
+            match = re.search(r'<a href="([^"]+)"\s*class="[^"]*" id="nextPage"', page)
+            url = html.unescape(match.group(1)) if match else None
+        assert seen == list(range(2, 300, 3))
+        assert '0건 중 0건 표시' in client.get('/errors/test.log?status=200').get_data(as_text=True)
+        assert client.get('/errors/test.log?status=abc').status_code == 400
+
+        # 분석 화면은 검색 결과 첫 페이지만 렌더링
+        page = client.post('/analyze', data={'logfile': 'test.log', 'keyword': 'item1'}).get_data(as_text=True)
+        assert '111건' in page and page.count('<code>/api/item1') == 30 and 'data-cursor="0:' in page
+
+        # 검색 결과 JSON 페이지
+        url = '/analyze/search?logfile=test.log&keyword=item1&limit=50'
+        first = client.get(url).get_json()
+        second = client.get(url + '&cursor=' + first['next_cursor']).get_json()
+        third = client.get(url + '&cursor=' + second['next_cursor']).get_json()
+        urls = [log['url'] for log in first['results'] + second['results'] + third['results']]
+        assert first['total'] == 111 and third['next_cursor'] is None
+        assert urls == [f'/api/item{i}' for i in range(300) if str(i).startswith('1')]
+        filtered = client.get(url + '&status=404').get_json()
+        assert filtered['results'] and all(log['status'] == '404' for log in filtered['results'])
+        assert client.get(url + '&cursor=bad').status_code == 400
+        assert client.get('/analyze/search?logfile=test.log&keyword=(&regex=1').status_code == 400
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
+
+def test_search_rejects_files_outside_log_dir():
+    """검색 JSON은 로그 디렉토리 목록에 없는 이름(../ 포함)이면 디렉토리 밖 파일을 읽지 않고 404인지 테스트"""
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        log_dir = os.path.join(tmp, 'logs')
+        os.makedirs(log_dir)
+        views.LOG_DIR = log_dir
+        line = "2025-06-03 08:00:00 GET 192.168.0.1 /api/secret 200 100\n"
+        for path in (os.path.join(log_dir, 'test.log'), os.path.join(tmp, 'secret.log')):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(line)
+        app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None))
+        client = app.test_client()
+
+        assert client.get('/analyze/search?logfile=test.log&keyword=secret').get_json()['total'] == 1
+        assert client.get('/analyze/search?logfile=../secret.log&keyword=secret').status_code == 404
+        assert client.get('/analyze/search?logfile=test.log&logfile=../secret.log&keyword=secret').status_code == 404
+        assert client.get('/analyze/search?logfile=missing.log&keyword=secret').status_code == 404
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
+
+def test_routes_reject_files_outside_log_dir():
+    """그래프 PNG/데이터와 에러 페이지도 로그 디렉토리 목록에 없는 이름(../, 절대 경로, ..)이면 404인지 테스트"""
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        log_dir = os.path.join(tmp, 'logs')
+        os.makedirs(log_dir)
+        views.LOG_DIR = log_dir
+        secret = os.path.join(tmp, 'secret.log')
+        for path in (os.path.join(log_dir, 'test.log'), secret):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("2025-06-03 08:00:00 GET 192.168.0.1 /api/secret 500 100\n")
+        app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None, PLOT_CACHE_MAX_BYTES=0))
+        client = app.test_client()
+
+        assert client.get('/analyze/data/status?logfile=test.log').status_code == 200
+        assert client.get('/errors/test.log').status_code == 200
+        for logfile in ('../secret.log', secret):
+            assert client.get(f'/analyze/data/status?logfile={logfile}').status_code == 404
+            assert client.get(f'/analyze/data/status?logfile=test.log&logfile={logfile}').status_code == 404
+            assert client.get(f'/analyze/plot/status?logfile={logfile}').status_code == 404
+        assert client.get('/errors/..').status_code == 404
+        assert client.get('/errors/missing.log').status_code == 404
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
+
+def test_log_watcher_prewarms_files():
+    """감시자가 미리 분석한 파일은 첫 대시보드 요청부터 캐시 히트이고, 파일 목록에 메타데이터가 표시되는지 테스트"""
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        views.LOG_DIR = tmp
+        with open(os.path.join(tmp, 'test.log'), 'w', encoding='utf-8') as f:
+            for i in range(50):
+                f.write(f"2025-06-03 08:{i:02d}:00 GET 192.168.0.1 /api/users 200 {i}\n")
+        app = create_app(dict(TESTING=True, PARSE_CACHE_DIR=None))
+        client = app.test_client()
+
+        # 테스트 중에는 폴링 스레드 없이 요청마다 목록만 갱신 (분석 전에는 샘플로 구한 줄 수)
+        page = client.get('/analyze').get_data(as_text=True)
+        assert 'test.log (' in page and '50줄, standard, 06-03 08:00~06-03 08:49)' in page
+        watcher = app.extensions['log_watcher']
+        assert not watcher.running and watcher.stats()['warm'] == 0
+
+        watcher.scan()
+        page = client.get('/analyze').get_data(as_text=True)
+        assert '50행, standard' in page and '⚡' in page
+        page = client.post('/analyze', data={'logfile': 'test.log'}).get_data(as_text=True)
+        assert '<canvas id="status-chart"' in page
+        stats = client.get('/cache/stats').get_json()
+        assert stats['misses'] == 0 and stats['hits'] == 1 and stats['watcher']['warmed'] == 1
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
+
+def test_create_app_starts_log_watcher():
+    """테스트가 아니면 create_app이 첫 요청을 기다리지 않고 감시 스레드를 시작해 파일을 미리 분석하는지 테스트"""
+    import app.views as views
+    tmp = tempfile.mkdtemp()
+    original_log_dir = views.LOG_DIR
+    try:
+        views.LOG_DIR = tmp
+        with open(os.path.join(tmp, 'test.log'), 'w', encoding='utf-8') as f:
+            for i in range(20):
+                f.write(f"2025-06-03 08:{i:02d}:00 GET 192.168.0.1 /api/users 200 {i}\n")
+        assert 'log_watcher' not in create_app(dict(TESTING=True)).extensions
+
+        app = create_app(dict(PARSE_CACHE_DIR=None, LOG_WATCH_INTERVAL=0.05))
+        watcher = app.extensions['log_watcher']
+        try:
+            assert watcher.running
+            deadline = time.time() + 10
+            while not watcher.files()['test.log']['warm'] and time.time() < deadline:
+                time.sleep(0.05)
+            assert watcher.files()['test.log']['rows'] == 20
+        finally:
+            watcher.stop(10)
+        assert app.test_client().get('/cache/stats').get_json()['entries'] == 1
+    finally:
+        views.LOG_DIR = original_log_dir
+        shutil.rmtree(tmp)
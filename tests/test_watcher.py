@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+watcher 모듈 테스트 스위트
+
+이 모듈은 app.watcher의 로그 디렉토리 감시자를 테스트합니다.
+- 파일 앞/뒤 샘플로 구한 형식, 줄 수 추정값, 시간 범위
+- 새로 생기거나 바뀐/삭제된 파일 감지와 미리 분석
+- 미리 분석이 실패한 파일의 오류 기록과 대기 시간 뒤 재시도
+- 손상된 압축 파일과 예상하지 못한 스캔 오류에도 감시가 계속되는지 확인
+- 폴링 스레드가 새 파일을 찾아 분석하는지 확인
+"""
+
+import sys
+import os
+import gzip
+import tempfile
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app import watcher as watcher_module
+from app.cache import load_parsed_logs
+from app.watcher import LogDirWatcher, parsed_file_info, sample_file_info
+
+def _write_log(path, n, opener=open):
+    with opener(path, 'wt', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(f"2025-06-03 {8 + i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d} GET 10.0.0.{i % 5} /api/item{i % 4} 200 {i}\n")
+
+def test_sample_file_info(monkeypatch):
+    """형식, 줄 수(작은 파일은 정확, 큰 파일은 추정), 시간 범위 테스트"""
+    monkeypatch.setattr(watcher_module, 'WATCH_SAMPLE_SIZE', 4096)
+    with tempfile.TemporaryDirectory() as tmp:
+        small = os.path.join(tmp, 'small.log')
+        _write_log(small, 10)
+        info = sample_file_info(small, os.path.getsize(small))
+        assert info == {'format': 'standard', 'lines': 10,
+                        'time_from': '2025-06-03 08:00:00', 'time_to': '2025-06-03 08:00:09'}
+
+        large = os.path.join(tmp, 'large.log')
+        _write_log(large, 5000)
+        info = sample_file_info(large, os.path.getsize(large))
+        assert abs(info['lines'] - 5000) < 250
+        assert info['time_from'] == '2025-06-03 08:00:00' and info['time_to'] == '2025-06-03 09:23:19'
+
+        # 압축 파일은 앞부분만 읽음
+        packed = os.path.join(tmp, 'large.log.gz')
+        _write_log(packed, 5000, gzip.open)
+        info = sample_file_info(packed, os.path.getsize(packed))
+        assert info['format'] == 'standard' and info['lines'] is None and info['time_to'] is None
+
+def test_scan_detects_changes_and_warms():
+    """새/바뀐/삭제된 파일 감지와 미리 분석 결과로 메타데이터가 정확해지는지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        warmed = []
+
+        def warm(path):
+            warmed.append(os.path.basename(path))
+            return load_parsed_logs([path], None, workers=1)[0]
+
+        _write_log(os.path.join(tmp, 'a.log'), 30)
+        _write_log(os.path.join(tmp, 'b.log'), 20)
+        watcher = LogDirWatcher(tmp, warm)
+        assert watcher.scan(warm=False) == ['a.log', 'b.log']
+        assert not any(info['warm'] for info in watcher.files().values()) and warmed == []
+
+        # 바뀐 파일이 없어도 아직 분석하지 않은 파일은 분석
+        assert watcher.scan() == []
+        assert warmed == ['a.log', 'b.log']
+        info = watcher.files()['a.log']
+        assert info['warm'] and info['rows'] == 30 and info['format'] == 'standard'
+        assert info['time_to'] == '2025-06-03 08:00:29'
+
+        # 덧붙은 파일만 다시 분석, 삭제된 파일은 목록에서 제거
+        _write_log(os.path.join(tmp, 'a.log'), 40)
+        os.remove(os.path.join(tmp, 'b.log'))
+        assert watcher.scan() == ['a.log']
+        assert warmed == ['a.log', 'b.log', 'a.log']
+        assert list(watcher.files()) == ['a.log'] and watcher.files()['a.log']['rows'] == 40
+        assert watcher.stats()['warmed'] == 3
+
+def test_failed_warm_is_retried_with_backoff(monkeypatch):
+    """미리 분석이 실패하면 오류를 기록하고, 대기 시간이 지난 뒤의 스캔에서 다시 시도하는지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+
+        def flaky(path):
+            calls.append(path)
+            if len(calls) < 3:
+                raise ValueError('broken log')
+            return load_parsed_logs([path], None, workers=1)[0]
+
+        _write_log(os.path.join(tmp, 'a.log'), 5)
+        watcher = LogDirWatcher(tmp, flaky)
+        watcher.scan()
+        watcher.scan()  # 대기 시간이 지나기 전에는 다시 시도하지 않음
+        info = watcher.files()['a.log']
+        assert info['error'] == 'broken log' and not info['warm'] and len(calls) == 1
+        assert info['failures'] == 1 and info['retry_at'] > time.monotonic() + watcher_module.WARM_RETRY_DELAY / 2
+
+        # 대기 시간이 지나면 다시 시도하고, 연속 실패할 때마다 대기 시간이 늘어남
+        monkeypatch.setattr(watcher_module, 'WARM_RETRY_DELAY', 0.0)
+        with watcher._lock:
+            watcher._files['a.log']['retry_at'] = time.monotonic()
+        watcher.scan()
+        assert len(calls) == 2 and watcher.files()['a.log']['failures'] == 2
+
+        # 성공하면 오류를 지움
+        watcher.scan()
+        info = watcher.files()['a.log']
+        assert len(calls) == 3 and info['warm'] and info['rows'] == 5
+        assert info['error'] is None and info['failures'] == 0 and info['retry_at'] is None
+
+def test_retry_delay_is_capped(monkeypatch):
+    """연속 실패 대기 시간이 두 배씩 늘다가 WARM_RETRY_MAX_DELAY에서 멈추는지 테스트"""
+    monkeypatch.setattr(watcher_module, 'WARM_RETRY_DELAY', 10.0)
+    monkeypatch.setattr(watcher_module, 'WARM_RETRY_MAX_DELAY', 30.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        def broken(path):
+            raise ValueError('broken log')
+
+        _write_log(os.path.join(tmp, 'a.log'), 5)
+        watcher = LogDirWatcher(tmp, broken)
+        delays = []
+        for _ in range(4):
+            with watcher._lock:
+                info = watcher._files.get('a.log')
+                if info is not None:
+                    info['retry_at'] = time.monotonic()
+            watcher.scan()
+            delays.append(round(watcher.files()['a.log']['retry_at'] - time.monotonic()))
+        assert delays == [10, 20, 30, 30]
+
+def test_corrupt_archive_is_recorded():
+    """잘린 .gz 파일은 스캔을 멈추지 않고 그 파일의 오류로 기록되는지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        packed = os.path.join(tmp, 'broken.log.gz')
+        _write_log(packed, 5000, gzip.open)
+        with open(packed, 'rb') as f:
+            data = f.read()
+        with open(packed, 'wb') as f:
+            f.write(data[:len(data) // 2])  # 아직 쓰는 중인 압축 파일
+        _write_log(os.path.join(tmp, 'ok.log'), 5)
+        watcher = LogDirWatcher(tmp, lambda path: load_parsed_logs([path], None, workers=1)[0])
+
+        assert watcher.scan() == ['broken.log.gz', 'ok.log']
+        files = watcher.files()
+        assert files['broken.log.gz']['error'] and not files['broken.log.gz']['warm']
+        assert files['ok.log']['warm'] and files['ok.log']['rows'] == 5
+
+def test_polling_thread_survives_unexpected_errors(monkeypatch):
+    """스캔 중 예상하지 못한 예외가 나도 폴링 스레드가 계속 도는지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        watcher = LogDirWatcher(tmp)
+        calls = []
+        original = watcher.scan
+        def failing_scan(warm=True):
+            calls.append(warm)
+            if len(calls) == 1:
+                raise RuntimeError('unexpected')
+            return original(warm)
+        monkeypatch.setattr(watcher, 'scan', failing_scan)
+        watcher.start(0.01)
+        try:
+            deadline = time.time() + 10
+            while len(calls) < 3 and time.time() < deadline:
+                time.sleep(0.01)
+            assert len(calls) >= 3 and watcher.running
+        finally:
+            watcher.stop(10)
+
+def test_polling_thread_finds_new_files():
+    """폴링 스레드가 새 파일을 찾아 미리 분석하는지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        watcher = LogDirWatcher(tmp, lambda path: load_parsed_logs([path], None, workers=1)[0])
+        watcher.start(0.05)
+        try:
+            assert watcher.running
+            _write_log(os.path.join(tmp, 'new.log'), 10)
+            deadline = time.time() + 10
+            while not watcher.files().get('new.log', {}).get('warm') and time.time() < deadline:
+                time.sleep(0.05)
+            assert watcher.files()['new.log']['rows'] == 10
+        finally:
+            watcher.stop(10)
+        assert not watcher.running
+
+def test_parsed_file_info_without_timestamps():
+    """타임스탬프가 없는 결과는 시간 범위가 None인지 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'empty.log')
+        open(path, 'w').close()
+        info = parsed_file_info(load_parsed_logs([path], None, workers=1)[0])
+        assert info == {'rows': 0, 'format': None, 'time_from': None, 'time_to': None}